@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +10,7 @@ from floris import (
 )
 from floris.core.turbine.operation_models import POWER_SETPOINT_DEFAULT
 from floris.heterogeneous_map import HeterogeneousMap
+from scaling import case_horizontal_plane, case_run, SOLVER_INPUTS
 
 
 N_Conditions = 100
@@ -86,6 +88,31 @@ def test_timing_large_farm_run(benchmark):
     benchmark(fmodel.run)
 
 
+def test_timing_large_farm_pickle(benchmark):
+    """Timing test for pickling a solved large farm, as sent to and from worker processes"""
+    fmodel = FlorisModel(configuration="defaults")
+    wind_directions = np.linspace(0, 360, N_Conditions)
+    wind_speeds = np.ones(N_Conditions) * 8
+    turbulence_intensities = np.ones(N_Conditions) * 0.06
+
+    fmodel.set(
+        wind_directions=wind_directions,
+        wind_speeds=wind_speeds,
+        turbulence_intensities=turbulence_intensities,
+        layout_x=np.linspace(0, 10000, 100),
+        layout_y=np.linspace(0, 10000, 100),
+    )
+    fmodel.run()
+
+    def round_trip():
+        buffers = []
+        data = pickle.dumps(fmodel, protocol=5, buffer_callback=buffers.append)
+        pickle.loads(data, buffers=buffers)
+        return len(data) + sum(memoryview(b).nbytes for b in buffers)
+
+    benchmark.extra_info["bytes"] = benchmark(round_trip)
+
+
 def test_timing_het_set(benchmark):
     """Timing test for setting up a farm with a heterogeneous map"""
 
@@ -161,3 +188,15 @@ def test_timing_het_run(benchmark):
     )
 
     benchmark(fmodel.run)
+
+
+@pytest.mark.parametrize("solver", SOLVER_INPUTS)
+def test_timing_solver_run(benchmark, solver):
+    """Timing test for running a farm with the models of each solver"""
+    benchmark(case_run(solver, 16, N_Conditions, 3))
+
+
+@pytest.mark.parametrize("solver", SOLVER_INPUTS)
+def test_timing_horizontal_plane(benchmark, solver):
+    """Timing test for calculating a horizontal plane with the models of each solver"""
+    benchmark(case_horizontal_plane(solver))
@@ -0,0 +1,110 @@
+"""
+Compare two runs of the scaling benchmarks in the JSON history written by scaling.py and
+flag the cases whose time or peak RSS grew by more than a threshold. The exit status is 1
+if any case regressed, so that the comparison can fail a CI job.
+
+    python compare.py                          # Last run against the one before it
+    python compare.py --baseline 0             # Last run against the first run
+    python compare.py --time-threshold 0.2     # Flag cases that are 20% slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+import pandas as pd
+from scaling import HISTORY_FILE, load_history
+
+
+# Relative growth of the time and of the peak RSS past which a case is flagged
+TIME_THRESHOLD = 0.1
+RSS_THRESHOLD = 0.1
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    time_threshold: float = TIME_THRESHOLD,
+    rss_threshold: float = RSS_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Compare the results of two runs of the scaling benchmarks.
+
+    Args:
+        baseline (dict): The baseline run from the history.
+        current (dict): The run to compare to the baseline.
+        time_threshold (float, optional): Relative increase of the time past which a case
+            is flagged. Defaults to TIME_THRESHOLD.
+        rss_threshold (float, optional): Relative increase of the peak RSS past which a
+            case is flagged. Defaults to RSS_THRESHOLD.
+
+    Returns:
+        pd.DataFrame: One row per case that ran without error in both runs, with the
+        times, the peak RSS, their ratios to the baseline and whether the case regressed.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or "error" in base or "error" in result:
+            continue
+        rows.append({
+            "case": name,
+            "baseline_time": base["time"],
+            "time": result["time"],
+            "baseline_peak_rss": base["peak_rss"],
+            "peak_rss": result["peak_rss"],
+        })
+    df = pd.DataFrame(
+        rows,
+        columns=["case", "baseline_time", "time", "baseline_peak_rss", "peak_rss"],
+    ).set_index("case")
+    df["time_ratio"] = df["time"] / df["baseline_time"]
+    df["rss_ratio"] = df["peak_rss"] / df["baseline_peak_rss"]
+    df["regression"] = (
+        (df["time_ratio"] > 1.0 + time_threshold)
+        | (df["rss_ratio"] > 1.0 + rss_threshold)
+    )
+    return df
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare runs of the scaling benchmarks.")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON history file.")
+    parser.add_argument(
+        "--baseline", type=int, default=-2, help="Index of the baseline run in the history."
+    )
+    parser.add_argument(
+        "--current", type=int, default=-1, help="Index of the compared run in the history."
+    )
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    parser.add_argument("--rss-threshold", type=float, default=RSS_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    if len(history) < 2:
+        print(f"At least two runs are needed in {args.history} to compare.")
+        return 0
+    baseline = history[args.baseline]
+    current = history[args.current]
+
+    df = compare(baseline, current, args.time_threshold, args.rss_threshold)
+    print(
+        f"Baseline: {baseline['date']} {baseline['commit']} {baseline['label'] or ''}\n"
+        f"Current:  {current['date']} {current['commit']} {current['label'] or ''}\n"
+    )
+    with pd.option_context(
+        "display.max_rows", None, "display.max_columns", None, "display.width", 200
+    ):
+        print(df[["time", "time_ratio", "peak_rss", "rss_ratio", "regression"]])
+
+    regressions = df.index[df["regression"]]
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} case(s) regressed:")
+        print("\n".join(f"    {name}" for name in regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
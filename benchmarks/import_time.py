@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import pytest
+
+
+# Budget for the cumulative time of `import floris` as reported by `python -X importtime`,
+# taken as the fastest of several fresh interpreters to reduce the noise from the machine
+IMPORT_TIME_BUDGET_S = 1.5
+N_REPEATS = 5
+
+# Packages that are imported on first use only, so that short jobs and spawned workers do not
+# pay for them
+LAZY_MODULES = [
+    "matplotlib",
+    "shapely",
+    "pathos",
+    "floris.flow_visualization",
+    "floris.layout_visualization",
+    "floris.optimization",
+    "floris.par_floris_model",
+    "floris.parallel_floris_model",
+    "floris.uncertain_floris_model",
+]
+
+# These tests are run with pytest from the benchmarks directory:
+#     pytest import_time.py
+
+
+def import_time(module: str = "floris") -> tuple[float, dict]:
+    """
+    Import a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module (str, optional): The module to import. Defaults to "floris".
+
+    Returns:
+        tuple: The cumulative import time (s) of the module and a dict with the cumulative
+        import time (s) of every module that was imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) * 1e-6
+    return times[module], times
+
+
+def test_import_time_budget():
+    """`import floris` is within the import time budget"""
+    total = min(import_time()[0] for _ in range(N_REPEATS))
+    assert total <= IMPORT_TIME_BUDGET_S, (
+        f"import floris took {total:.3f} s, more than the budget of {IMPORT_TIME_BUDGET_S} s"
+    )
+
+
+@pytest.mark.parametrize("module", LAZY_MODULES)
+def test_lazy_imports(module):
+    """`import floris` does not import the packages that are only needed on first use"""
+    _, times = import_time()
+    assert module not in times
+
+
+if __name__ == "__main__":
+    # Print the slowest imports
+    total, times = import_time()
+    print(f"import floris: {total:.3f} s")
+    for name, t in sorted(times.items(), key=lambda item: -item[1])[:25]:
+        print(f"{t:8.3f} s  {name}")
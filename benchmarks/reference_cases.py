@@ -0,0 +1,430 @@
+"""
+Reference dataset of large synthetic wind farms to check the accuracy of the fast paths of
+FLORIS at a realistic scale. The cases are generated reproducibly from a seed: gridded and
+irregular layouts of 50 to 1000 turbines, mixed turbine types, heterogeneous inflow and
+long time series. The turbine powers of the dense float64 solve with FlorisModel.run() are
+stored as the reference in compressed .npz files, together with the inputs.
+
+The harness runs each calculation mode in MODES on every case and checks its turbine powers
+against the reference within the tolerances of the mode, and reports its time relative to
+the reference solve. New fast paths are validated by adding them to MODES.
+
+    python reference_cases.py generate                  # Generate the reference files
+    python reference_cases.py check                     # Check every mode on every case
+    python reference_cases.py check --case grid_50 --mode pickle
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import floris
+from floris import FlorisModel, TimeSeries
+from floris.heterogeneous_map import HeterogeneousMap
+from floris.utilities import load_yaml
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REFERENCE_DIR = BENCHMARKS_DIR / "reference_data"
+TURBINE_LIBRARY = Path(floris.__file__).resolve().parent / "turbine_library"
+
+# The synthetic cases. Irregular layouts are jittered and rotated grids with a minimum
+# spacing of MIN_SPACING_D rotor diameters. Mixed turbine types are assigned at random.
+CASES = {
+    "grid_50": {
+        "layout": "grid", "n_turbines": 50, "n_findex": 1000,
+        "turbine_types": ["nrel_5MW"], "heterogeneous": False, "seed": 0,
+    },
+    "irregular_200_mixed": {
+        "layout": "irregular", "n_turbines": 200, "n_findex": 500,
+        "turbine_types": ["nrel_5MW", "iea_10MW", "iea_15MW"], "heterogeneous": False, "seed": 1,
+    },
+    "grid_400_heterogeneous": {
+        "layout": "grid", "n_turbines": 400, "n_findex": 100,
+        "turbine_types": ["iea_15MW"], "heterogeneous": True, "seed": 2,
+    },
+    "irregular_1000": {
+        "layout": "irregular", "n_turbines": 1000, "n_findex": 24,
+        "turbine_types": ["iea_15MW"], "heterogeneous": False, "seed": 3,
+    },
+    "time_series_50_8760": {
+        "layout": "irregular", "n_turbines": 50, "n_findex": 8760,
+        "turbine_types": ["nrel_5MW", "iea_10MW"], "heterogeneous": True, "seed": 4,
+    },
+}
+
+SPACING_D = 7.0
+MIN_SPACING_D = 3.0
+N_HETEROGENEOUS_SECTORS = 8
+PAR_MAX_WORKERS = 2
+
+# Absolute tolerance (W) of the turbine powers, on top of the relative tolerance of a mode
+POWER_ATOL = 1e-3
+
+
+def generate_layout(
+    layout: str,
+    n_turbines: int,
+    rotor_diameter: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a gridded or an irregular layout.
+
+    Args:
+        layout (str): "grid" for a square grid or "irregular" for a jittered grid with a
+            random subset of the positions, rotated by a random angle.
+        n_turbines (int): Number of turbines.
+        rotor_diameter (float): Rotor diameter (m) used for the spacing.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        tuple: The x- and y-coordinates of the turbines (m).
+    """
+    spacing = SPACING_D * rotor_diameter
+    if layout == "grid":
+        n_rows = int(np.ceil(np.sqrt(n_turbines)))
+        x, y = np.meshgrid(np.arange(n_rows) * spacing, np.arange(n_rows) * spacing)
+        return x.flatten()[:n_turbines], y.flatten()[:n_turbines]
+    if layout != "irregular":
+        raise ValueError(f"Unknown layout {layout}, expected 'grid' or 'irregular'.")
+
+    # Jitter each position by at most half of the margin over the minimum spacing, so that
+    # neighbors stay at least MIN_SPACING_D apart
+    n_rows = int(np.ceil(np.sqrt(n_turbines / 0.8)))
+    x, y = np.meshgrid(np.arange(n_rows) * spacing, np.arange(n_rows) * spacing)
+    positions = rng.choice(n_rows**2, size=n_turbines, replace=False)
+    x = x.flatten()[positions]
+    y = y.flatten()[positions]
+    jitter = 0.5 * (SPACING_D - MIN_SPACING_D) * rotor_diameter
+    x = x + rng.uniform(-jitter, jitter, n_turbines)
+    y = y + rng.uniform(-jitter, jitter, n_turbines)
+    angle = rng.uniform(0.0, 2 * np.pi)
+    return (
+        x * np.cos(angle) - y * np.sin(angle),
+        x * np.sin(angle) + y * np.cos(angle),
+    )
+
+
+def generate_time_series(n_findex: int, rng: np.random.Generator) -> dict:
+    """
+    Generate a time series of wind conditions: wind directions from a random walk, Weibull
+    distributed wind speeds and a turbulence intensity that decreases with the wind speed.
+
+    Args:
+        n_findex (int): Number of time steps.
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        dict: The wind directions, wind speeds and turbulence intensities.
+    """
+    wind_directions = np.mod(
+        rng.uniform(0.0, 360.0) + np.cumsum(rng.normal(0.0, 10.0, n_findex)), 360.0
+    )
+    wind_speeds = np.clip(9.0 * rng.weibull(2.0, n_findex), 1.0, 24.0)
+    turbulence_intensities = np.clip(
+        0.04 + 0.4 / wind_speeds + rng.normal(0.0, 0.01, n_findex), 0.03, 0.25
+    )
+    return {
+        "wind_directions": wind_directions,
+        "wind_speeds": wind_speeds,
+        "turbulence_intensities": turbulence_intensities,
+    }
+
+
+def build_case(
+    layout: str,
+    n_turbines: int,
+    n_findex: int,
+    turbine_types: list[str],
+    heterogeneous: bool,
+    seed: int,
+) -> FlorisModel:
+    """
+    Build the FlorisModel of a synthetic case with the default models. The same arguments
+    always produce the same model.
+
+    Args:
+        layout (str): "grid" or "irregular"; see :py:func:`generate_layout`.
+        n_turbines (int): Number of turbines.
+        n_findex (int): Number of time steps.
+        turbine_types (list[str]): Turbine types of the turbine library, assigned to the
+            turbines at random.
+        heterogeneous (bool): If True, the inflow has random speed multipliers on a coarse
+            grid over the farm in each of N_HETEROGENEOUS_SECTORS wind direction sectors.
+        seed (int): Seed of the random number generator.
+
+    Returns:
+        FlorisModel: The model, not yet run.
+    """
+    rng = np.random.default_rng(seed)
+    turbine_type = [turbine_types[i] for i in rng.integers(len(turbine_types), size=n_turbines)]
+
+    rotor_diameter = max(
+        load_yaml(TURBINE_LIBRARY / f"{t}.yaml")["rotor_diameter"] for t in turbine_types
+    )
+    layout_x, layout_y = generate_layout(layout, n_turbines, rotor_diameter, rng)
+
+    conditions = generate_time_series(n_findex, rng)
+    heterogeneous_map = None
+    if heterogeneous:
+        margin = SPACING_D * rotor_diameter
+        x, y = np.meshgrid(
+            np.linspace(layout_x.min() - margin, layout_x.max() + margin, 4),
+            np.linspace(layout_y.min() - margin, layout_y.max() + margin, 4),
+        )
+        heterogeneous_map = HeterogeneousMap(
+            x=x.flatten(),
+            y=y.flatten(),
+            speed_multipliers=rng.uniform(0.9, 1.1, (N_HETEROGENEOUS_SECTORS, x.size)),
+            wind_directions=np.arange(N_HETEROGENEOUS_SECTORS) * 360.0 / N_HETEROGENEOUS_SECTORS,
+        )
+    time_series = TimeSeries(**conditions, heterogeneous_map=heterogeneous_map)
+
+    fmodel = FlorisModel("defaults")
+    fmodel.set(
+        layout_x=layout_x,
+        layout_y=layout_y,
+        turbine_type=turbine_type,
+        wind_data=time_series,
+    )
+    fmodel.set(reference_wind_height=float(np.mean(fmodel.core.farm.hub_heights)))
+    return fmodel
+
+
+def case_inputs(fmodel: FlorisModel) -> dict:
+    """
+    Returns:
+        dict: The inputs of a case that are stored with its reference powers.
+    """
+    flow_field = fmodel.core.flow_field
+    inputs = {
+        "layout_x": fmodel.layout_x,
+        "layout_y": fmodel.layout_y,
+        "rotor_diameters": fmodel.core.farm.rotor_diameters,
+        "hub_heights": fmodel.core.farm.hub_heights,
+        "wind_directions": flow_field.wind_directions,
+        "wind_speeds": flow_field.wind_speeds,
+        "turbulence_intensities": flow_field.turbulence_intensities,
+    }
+    if flow_field.heterogeneous_inflow_config is not None:
+        inputs["speed_multipliers"] = np.asarray(
+            flow_field.heterogeneous_inflow_config["speed_multipliers"]
+        )
+    return inputs
+
+
+def inputs_digest(inputs: dict) -> str:
+    """
+    Returns:
+        str: A digest of the inputs of a case, to detect changes of the generator.
+    """
+    digest = hashlib.sha1()
+    for key in sorted(inputs):
+        digest.update(key.encode())
+        digest.update(np.ascontiguousarray(inputs[key], dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+# Calculation modes that the harness validates against the reference solve. Each takes the
+# model of a case, which it must not change, and returns the turbine powers.
+
+def mode_reference(fmodel: FlorisModel) -> np.ndarray:
+    fmodel = copy.deepcopy(fmodel)
+    fmodel.run()
+    return fmodel.get_turbine_powers()
+
+
+def mode_pickle(fmodel: FlorisModel) -> np.ndarray:
+    fmodel = pickle.loads(pickle.dumps(fmodel, protocol=5))
+    fmodel.run()
+    return fmodel.get_turbine_powers()
+
+
+def mode_par_floris_model(fmodel: FlorisModel) -> np.ndarray:
+    from floris import ParFlorisModel
+
+    pfmodel = ParFlorisModel(
+        fmodel,
+        interface="multiprocessing",
+        max_workers=PAR_MAX_WORKERS,
+        n_wind_condition_splits=PAR_MAX_WORKERS,
+    )
+    pfmodel.run()
+    return pfmodel.get_turbine_powers()
+
+
+def mode_run_layouts(fmodel: FlorisModel) -> np.ndarray:
+    return fmodel.run_layouts([fmodel.layout_x], [fmodel.layout_y])[0]
+
+
+def mode_resume_checkpoint(fmodel: FlorisModel) -> np.ndarray:
+    fmodel = copy.deepcopy(fmodel)
+    fmodel.core.initialize_domain()
+    checkpoint = fmodel.core.solve_to_checkpoint(fmodel.n_turbines // 2)
+    fmodel.core.initialize_domain()
+    fmodel.core.steady_state_atmospheric_condition(resume_from=checkpoint)
+    return fmodel.get_turbine_powers()
+
+
+# Calculation modes and the relative tolerance of their turbine powers
+MODES = {
+    "reference": (mode_reference, 1e-12),
+    "pickle": (mode_pickle, 1e-12),
+    "par_floris_model": (mode_par_floris_model, 1e-12),
+    "run_layouts": (mode_run_layouts, 1e-9),
+    "resume_checkpoint": (mode_resume_checkpoint, 1e-12),
+}
+
+
+def reference_file(case: str, reference_dir: str | Path = REFERENCE_DIR) -> Path:
+    return Path(reference_dir) / f"{case}.npz"
+
+
+def generate_reference(case: str, reference_dir: str | Path = REFERENCE_DIR) -> Path:
+    """
+    Solve a case with the reference solver and store its inputs and turbine powers.
+
+    Args:
+        case (str): The name of the case in CASES.
+        reference_dir (str | Path, optional): Directory of the reference files. Defaults to
+            REFERENCE_DIR.
+
+    Returns:
+        Path: The reference file.
+    """
+    fmodel = build_case(**CASES[case])
+    start = time.perf_counter()
+    turbine_powers = mode_reference(fmodel)
+    reference_time = time.perf_counter() - start
+
+    inputs = case_inputs(fmodel)
+    filename = reference_file(case, reference_dir)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        filename,
+        turbine_powers=turbine_powers,
+        reference_time=reference_time,
+        inputs_digest=inputs_digest(inputs),
+        floris_version=floris.__version__,
+        **inputs,
+    )
+    return filename
+
+
+def check_mode(case: str, mode: str, reference_dir: str | Path = REFERENCE_DIR) -> dict:
+    """
+    Check a calculation mode on a case against the stored reference.
+
+    Args:
+        case (str): The name of the case in CASES.
+        mode (str): The name of the mode in MODES.
+        reference_dir (str | Path, optional): Directory of the reference files. Defaults to
+            REFERENCE_DIR.
+
+    Returns:
+        dict: The time of the mode (s), its speedup over the stored reference time, the
+        largest absolute (W) and relative errors of the turbine powers and whether they are
+        within the tolerances of the mode.
+    """
+    reference = np.load(reference_file(case, reference_dir))
+    fmodel = build_case(**CASES[case])
+    if inputs_digest(case_inputs(fmodel)) != str(reference["inputs_digest"]):
+        raise ValueError(
+            f"The generated inputs of case {case} do not match its reference file. "
+            "Generate the reference again."
+        )
+
+    mode_function, rtol = MODES[mode]
+    start = time.perf_counter()
+    turbine_powers = mode_function(fmodel)
+    mode_time = time.perf_counter() - start
+
+    reference_powers = reference["turbine_powers"]
+    abs_error = np.abs(turbine_powers - reference_powers)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel_error = np.where(reference_powers != 0.0, abs_error / np.abs(reference_powers), 0.0)
+    return {
+        "time": mode_time,
+        "speedup": float(reference["reference_time"]) / mode_time,
+        "max_abs_error": float(abs_error.max()),
+        "max_rel_error": float(rel_error.max()),
+        "passed": bool(
+            np.allclose(turbine_powers, reference_powers, rtol=rtol, atol=POWER_ATOL)
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FLORIS large farm reference dataset.")
+    parser.add_argument("command", choices=["generate", "check"])
+    parser.add_argument("--case", action="append", choices=list(CASES), help="Default: all.")
+    parser.add_argument("--mode", action="append", choices=list(MODES), help="Default: all.")
+    parser.add_argument("--reference-dir", default=REFERENCE_DIR)
+    args = parser.parse_args(argv)
+    cases = args.case or list(CASES)
+
+    if args.command == "generate":
+        for case in cases:
+            print(f"{case:25s} {generate_reference(case, args.reference_dir)}")
+        return 0
+
+    n_failed = 0
+    print(f"{'case':25s} {'mode':20s} {'time (s)':>10s} {'speedup':>8s} {'max rel error':>14s}")
+    for case in cases:
+        for mode in args.mode or list(MODES):
+            result = check_mode(case, mode, args.reference_dir)
+            n_failed += not result["passed"]
+            print(
+                f"{case:25s} {mode:20s} {result['time']:10.3f} {result['speedup']:8.2f} "
+                f"{result['max_rel_error']:14.3e} {'' if result['passed'] else 'FAILED'}"
+            )
+    return int(n_failed > 0)
+
+
+# These tests check the generator and the harness on a small case and are run with pytest
+# from the benchmarks directory:
+#     pytest reference_cases.py
+
+SMALL_CASE = {
+    "layout": "irregular", "n_turbines": 12, "n_findex": 20,
+    "turbine_types": ["nrel_5MW", "iea_15MW"], "heterogeneous": True, "seed": 5,
+}
+
+
+def test_build_case_reproducible():
+    fmodel = build_case(**SMALL_CASE)
+    assert fmodel.n_turbines == 12
+    assert fmodel.n_findex == 20
+    assert len(set(fmodel.core.farm.rotor_diameters)) == 2
+    assert fmodel.core.flow_field.heterogeneous_inflow_config is not None
+    assert inputs_digest(case_inputs(fmodel)) == inputs_digest(
+        case_inputs(build_case(**SMALL_CASE))
+    )
+
+    # Irregular layouts keep the minimum spacing
+    xy = np.column_stack([fmodel.layout_x, fmodel.layout_y])
+    distances = np.linalg.norm(xy[:, None] - xy[None, :], axis=2)
+    np.fill_diagonal(distances, np.inf)
+    assert distances.min() >= MIN_SPACING_D * np.max(fmodel.core.farm.rotor_diameters) - 1e-6
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_mode_matches_reference(tmp_path, monkeypatch, mode):
+    monkeypatch.setitem(CASES, "small", SMALL_CASE)
+    generate_reference("small", tmp_path)
+    result = check_mode("small", mode, tmp_path)
+    assert result["passed"], result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""
+Scaling benchmarks of FLORIS. Every case is run in a fresh interpreter, which reports the
+fastest of several repeats of the timed calculation and the peak resident set size (RSS) of
+the process. The results of a run of the suite are appended to a JSON history file, and
+compare.py compares the runs in the history and flags regressions.
+
+    python scaling.py                       # Run every case
+    python scaling.py --filter run-cc       # Run the cases whose name contains "run-cc"
+    python scaling.py --list                # List the cases
+    python compare.py                       # Compare the last run to the one before it
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from floris import FlorisModel
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+INPUTS_DIR = BENCHMARKS_DIR.parent / "examples" / "inputs"
+HISTORY_FILE = BENCHMARKS_DIR / "scaling_history.json"
+
+# Input files for the models of each solver. turboparkgauss uses the sequential solver but
+# is included since its wake model is evaluated very differently from the Gaussian models.
+SOLVER_INPUTS = {
+    "sequential": "gch.yaml",
+    "cc": "cc.yaml",
+    "turbopark": "turbopark.yaml",
+    "empirical_gauss": "emgauss.yaml",
+    "turboparkgauss": "turboparkgauss.yaml",
+}
+
+# The cross-product of these sizes is run for each solver
+N_TURBINES = [4, 16, 64]
+N_FINDEX = [10, 100, 1000]
+TURBINE_GRID_POINTS = [1, 3]
+
+# Size of the cases other than the solver scaling
+N_TURBINES_OTHER = 16
+N_FINDEX_OTHER = 100
+
+PAR_INTERFACES = ["multiprocessing", "pathos", "concurrent"]
+PAR_MAX_WORKERS = 4
+
+N_REPEATS = 3
+CASE_TIMEOUT_S = 1800
+
+
+def _grid_layout(n_turbines, spacing=5 * 126.0):
+    n_rows = int(np.ceil(np.sqrt(n_turbines)))
+    x, y = np.meshgrid(np.arange(n_rows) * spacing, np.arange(n_rows) * spacing)
+    return x.flatten()[:n_turbines], y.flatten()[:n_turbines]
+
+
+def _conditions(n_findex):
+    return {
+        "wind_directions": np.linspace(0.0, 360.0, n_findex, endpoint=False),
+        "wind_speeds": np.linspace(4.0, 14.0, n_findex),
+        "turbulence_intensities": np.full(n_findex, 0.06),
+    }
+
+
+def _fmodel(
+    solver="sequential",
+    n_turbines=N_TURBINES_OTHER,
+    n_findex=N_FINDEX_OTHER,
+    turbine_grid_points=3,
+    model_class=FlorisModel,
+    **kwargs,
+):
+    fmodel = FlorisModel(INPUTS_DIR / SOLVER_INPUTS[solver])
+    layout_x, layout_y = _grid_layout(n_turbines)
+    fmodel.set(
+        layout_x=layout_x,
+        layout_y=layout_y,
+        solver_settings={"type": "turbine_grid", "turbine_grid_points": turbine_grid_points},
+        **_conditions(n_findex),
+    )
+    if model_class is not FlorisModel:
+        fmodel = model_class(fmodel, **kwargs)
+    return fmodel
+
+
+# Each case function sets up the calculation, which is not timed, and returns a function
+# that runs the timed calculation
+
+def case_run(solver, n_turbines, n_findex, turbine_grid_points):
+    fmodel = _fmodel(solver, n_turbines, n_findex, turbine_grid_points)
+
+    def run():
+        fmodel.run()
+        fmodel.get_turbine_powers()
+
+    return run
+
+
+def case_par_run(interface):
+    from floris import ParFlorisModel
+
+    fmodel = _fmodel(
+        model_class=ParFlorisModel,
+        interface=interface,
+        max_workers=PAR_MAX_WORKERS,
+        n_wind_condition_splits=PAR_MAX_WORKERS,
+    )
+
+    def run():
+        fmodel.run()
+        fmodel.get_turbine_powers()
+
+    return run
+
+
+def case_uncertain_run():
+    from floris import UncertainFlorisModel
+
+    fmodel = _fmodel(model_class=UncertainFlorisModel)
+
+    def run():
+        fmodel.run()
+        fmodel.get_turbine_powers()
+
+    return run
+
+
+def case_yaw_optimization(optimizer):
+    from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
+        YawOptimizationGeometric,
+    )
+    from floris.optimization.yaw_optimization.yaw_optimizer_scipy import YawOptimizationScipy
+    from floris.optimization.yaw_optimization.yaw_optimizer_sr import YawOptimizationSR
+
+    # Scipy optimizes each condition separately with finite differences, so it is timed on
+    # a much smaller problem
+    optimizers = {
+        "sr": (YawOptimizationSR, N_TURBINES_OTHER, N_FINDEX_OTHER, {"print_progress": False}),
+        "scipy": (YawOptimizationScipy, 9, 2, {}),
+        "geometric": (YawOptimizationGeometric, N_TURBINES_OTHER, N_FINDEX_OTHER, {}),
+    }
+    optimizer_class, n_turbines, n_findex, optimize_kwargs = optimizers[optimizer]
+    fmodel = _fmodel(n_turbines=n_turbines, n_findex=n_findex)
+
+    def run():
+        optimizer_class(fmodel).optimize(**optimize_kwargs)
+
+    return run
+
+
+def case_horizontal_plane(solver):
+    fmodel = _fmodel(solver, n_findex=1)
+
+    def run():
+        fmodel.calculate_horizontal_plane(
+            height=90.0,
+            x_resolution=200,
+            y_resolution=100,
+        )
+
+    return run
+
+
+def get_cases() -> dict:
+    """
+    Returns:
+        dict: The case functions and their arguments, by case name.
+    """
+    cases = {}
+    for solver, n_turbines, n_findex, grid_points in itertools.product(
+        SOLVER_INPUTS, N_TURBINES, N_FINDEX, TURBINE_GRID_POINTS
+    ):
+        name = f"run-{solver}-t{n_turbines}-f{n_findex}-g{grid_points}"
+        cases[name] = (case_run, (solver, n_turbines, n_findex, grid_points))
+    for interface in PAR_INTERFACES:
+        cases[f"par_run-{interface}"] = (case_par_run, (interface,))
+    cases["uncertain_run"] = (case_uncertain_run, ())
+    for optimizer in ["sr", "scipy", "geometric"]:
+        cases[f"yaw_optimization-{optimizer}"] = (case_yaw_optimization, (optimizer,))
+    for solver in SOLVER_INPUTS:
+        cases[f"horizontal_plane-{solver}"] = (case_horizontal_plane, (solver,))
+    return cases
+
+
+def peak_rss() -> int:
+    """
+    Returns:
+        int: The peak resident set size of this process, or of the largest of its worker
+        processes if that is larger (bytes). 0 where the resource module is not available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    max_rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_case(name: str, n_repeats: int = N_REPEATS) -> dict:
+    """
+    Run a case in this process.
+
+    Args:
+        name (str): The name of the case.
+        n_repeats (int, optional): Number of times the calculation is timed. Defaults to
+            N_REPEATS.
+
+    Returns:
+        dict: The fastest time (s) of the calculation and the peak RSS (bytes).
+    """
+    case_function, args = get_cases()[name]
+    run = case_function(*args)
+    times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {"time": min(times), "peak_rss": peak_rss()}
+
+
+def run_case_subprocess(name: str, n_repeats: int = N_REPEATS) -> dict:
+    """
+    Run a case in a fresh interpreter so that its peak RSS is not affected by other cases.
+
+    Returns:
+        dict: The results of :py:func:`run_case`, or the error of a failed case.
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, __file__, "--case", name, "--repeats", str(n_repeats)],
+            capture_output=True,
+            text=True,
+            timeout=CASE_TIMEOUT_S,
+            cwd=BENCHMARKS_DIR,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"Timed out after {CASE_TIMEOUT_S} s"}
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=BENCHMARKS_DIR,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(filename: str | Path = HISTORY_FILE) -> list:
+    """
+    Returns:
+        list: The runs of the suite in the history file, oldest first.
+    """
+    filename = Path(filename)
+    if not filename.exists():
+        return []
+    with open(filename) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the FLORIS scaling benchmarks.")
+    parser.add_argument("--filter", default="", help="Run only the cases containing this.")
+    parser.add_argument("--repeats", type=int, default=N_REPEATS)
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON history file.")
+    parser.add_argument("--label", default=None, help="Label stored with the run.")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit.")
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case is not None:
+        print(json.dumps(run_case(args.case, args.repeats)))
+        return
+
+    names = [name for name in get_cases() if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return
+
+    results = {}
+    for name in names:
+        results[name] = run_case_subprocess(name, args.repeats)
+        if "error" in results[name]:
+            print(f"{name:50s} error: {results[name]['error']}")
+        else:
+            print(
+                f"{name:50s} {results[name]['time']:10.4f} s "
+                f"{results[name]['peak_rss'] / 2**20:10.1f} MiB"
+            )
+
+    history = load_history(args.history)
+    history.append({
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "label": args.label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    })
+    with open(args.history, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 
+import importlib
 from importlib.metadata import version
 from pathlib import Path
 
@@ -7,18 +8,35 @@ __version__ = version("floris")
 
 
 from .floris_model import FlorisModel
-from .flow_visualization import (
-    plot_rotor_values,
-    visualize_cut_plane,
-    visualize_quiver,
-)
-from .heterogeneous_map import HeterogeneousMap
-from .par_floris_model import ParFlorisModel
-from .parallel_floris_model import ParallelFlorisModel
-from .uncertain_floris_model import ApproxFlorisModel, UncertainFlorisModel
 from .wind_data import (
     TimeSeries,
     WindRose,
     WindRoseWRG,
     WindTIRose,
 )
+
+
+# Objects that depend on plotting or parallelization packages, or are not needed to run
+# FlorisModel, are imported on first use so that `import floris` stays fast (PEP 562)
+_LAZY_IMPORTS = {
+    "plot_rotor_values": ".flow_visualization",
+    "visualize_cut_plane": ".flow_visualization",
+    "visualize_quiver": ".flow_visualization",
+    "HeterogeneousMap": ".heterogeneous_map",
+    "ParFlorisModel": ".par_floris_model",
+    "ParallelFlorisModel": ".parallel_floris_model",
+    "ApproxFlorisModel": ".uncertain_floris_model",
+    "UncertainFlorisModel": ".uncertain_floris_model",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -52,8 +52,12 @@ from .solver import (
     full_flow_empirical_gauss_solver,
     full_flow_sequential_solver,
     full_flow_turbopark_solver,
+    FULL_FLOW_TURBINE_GRID_RESOLUTION,
     sequential_solver,
+    SequentialSolverCheckpoint,
+    solve_wake_source_terms,
     turbopark_solver,
+    WakeSourceTerms,
 )
 from .core import Core
 
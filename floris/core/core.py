@@ -1,14 +1,16 @@
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import attrs
 import yaml
 from attrs import define, field
 
-from floris import logging_manager
+from floris import logging_manager, profiler
 from floris.core import (
     BaseClass,
     cc_solver,
@@ -21,14 +23,18 @@ from floris.core import (
     full_flow_empirical_gauss_solver,
     full_flow_sequential_solver,
     full_flow_turbopark_solver,
+    FULL_FLOW_TURBINE_GRID_RESOLUTION,
     Grid,
     PointsGrid,
     sequential_solver,
+    SequentialSolverCheckpoint,
+    solve_wake_source_terms,
     State,
     TurbineCubatureGrid,
     TurbineGrid,
     turbopark_solver,
     WakeModelManager,
+    WakeSourceTerms,
 )
 from floris.type_dec import NDArrayFloat
 from floris.utilities import (
@@ -59,37 +65,55 @@ class Core(BaseClass):
 
     grid: Grid = field(init=False)
 
-    def __attrs_post_init__(self) -> None:
+    # Wake source terms for the full flow solvers, extracted from the most recent turbine
+    # grid solve on first use. `_solved_turbine_grid` holds the solved objects until then.
+    wake_source_terms: WakeSourceTerms | None = field(init=False, default=None)
+    _solved_turbine_grid: tuple | None = field(init=False, default=None)
 
-        # Configure logging
-        logging_manager.configure_console_log(
-            self.logging["console"]["enable"],
-            self.logging["console"]["level"],
-        )
-        logging_manager.configure_file_log(
-            self.logging["file"]["enable"],
-            self.logging["file"]["level"],
-        )
+    def __attrs_post_init__(self) -> None:
 
-        # Initialize farm quantities that depend on other objects
-        self.farm.construct_turbine_map()
-        self.farm.construct_turbine_thrust_coefficient_functions()
-        self.farm.construct_turbine_axial_induction_functions()
-        self.farm.construct_turbine_power_functions()
-        self.farm.construct_turbine_power_thrust_tables()
-        self.farm.construct_hub_heights()
-        self.farm.construct_rotor_diameters()
-        self.farm.construct_turbine_TSRs()
-        self.farm.construct_turbine_ref_tilts()
-        self.farm.construct_turbine_tilt_interps()
-        self.farm.construct_turbine_correct_cp_ct_for_tilt()
-        self.farm.set_yaw_angles_to_ref_yaw(self.flow_field.n_findex)
-        self.farm.set_tilt_to_ref_tilt(self.flow_field.n_findex)
-        self.farm.set_power_setpoints_to_ref_power(self.flow_field.n_findex)
-        self.farm.set_awc_modes_to_ref_mode(self.flow_field.n_findex)
-        self.farm.set_awc_amplitudes_to_ref_amp(self.flow_field.n_findex)
-        self.farm.set_awc_frequencies_to_ref_freq(self.flow_field.n_findex)
+        with profiler.stage("Core.__attrs_post_init__", "core"):
+            # Configure logging
+            logging_manager.configure_console_log(
+                self.logging["console"]["enable"],
+                self.logging["console"]["level"],
+            )
+            logging_manager.configure_file_log(
+                self.logging["file"]["enable"],
+                self.logging["file"]["level"],
+            )
 
+            # Initialize farm quantities that depend on other objects
+            self.farm.construct_turbine_map()
+            self.farm.construct_turbine_thrust_coefficient_functions()
+            self.farm.construct_turbine_axial_induction_functions()
+            self.farm.construct_turbine_power_functions()
+            self.farm.construct_turbine_power_thrust_tables()
+            self.farm.construct_hub_heights()
+            self.farm.construct_rotor_diameters()
+            self.farm.construct_turbine_TSRs()
+            self.farm.construct_turbine_ref_tilts()
+            self.farm.construct_turbine_tilt_interps()
+            self.farm.construct_turbine_correct_cp_ct_for_tilt()
+            self.farm.set_yaw_angles_to_ref_yaw(self.flow_field.n_findex)
+            self.farm.set_tilt_to_ref_tilt(self.flow_field.n_findex)
+            self.farm.set_power_setpoints_to_ref_power(self.flow_field.n_findex)
+            self.farm.set_awc_modes_to_ref_mode(self.flow_field.n_findex)
+            self.farm.set_awc_amplitudes_to_ref_amp(self.flow_field.n_findex)
+            self.farm.set_awc_frequencies_to_ref_freq(self.flow_field.n_findex)
+
+            self.construct_grid()
+
+            if isinstance(self.grid, (TurbineGrid, TurbineCubatureGrid)):
+                self.farm.expand_farm_properties(
+                    self.flow_field.n_findex,
+                    self.grid.sorted_coord_indices
+                )
+
+    def construct_grid(self):
+        """
+        Build the grid of the solver type from the farm layout and the wind directions.
+        """
         if self.solver["type"] == "turbine_grid":
             self.grid = TurbineGrid(
                 turbine_coordinates=self.farm.coordinates,
@@ -129,31 +153,161 @@ class Core(BaseClass):
                 f"but type given was {self.solver['type']}"
             )
 
+    def set_turbine_coordinates(self, coordinates: NDArrayFloat) -> None:
+        """
+        Rebuild the grid with turbine coordinates that may differ between the findices, so
+        that the turbines are sorted and rotated separately for each findex, and sort the
+        farm properties that were expanded over the findices with the new grid. The layout
+        of the farm itself is not changed.
+
+        Args:
+            coordinates (NDArrayFloat): The turbine coordinates with shape
+                (n_findex, n_turbines, 3), or (n_turbines, 3) for the same coordinates in
+                every findex.
+        """
+        self.grid = attrs.evolve(self.grid, turbine_coordinates=coordinates)
         if isinstance(self.grid, (TurbineGrid, TurbineCubatureGrid)):
             self.farm.expand_farm_properties(
                 self.flow_field.n_findex,
                 self.grid.sorted_coord_indices
             )
 
+    def copy(self, flow_field: dict | None = None) -> Core:
+        """
+        Create a Core with the same inputs as this one, equivalent to
+        Core.from_dict(self.as_dict()): the operation setpoints are at their defaults and the
+        flow field is not solved. The turbine models, with their power, thrust coefficient
+        and axial induction functions, power-thrust tables and tilt interpolants, are
+        read-only, so they are shared with this Core rather than loaded and built again.
+
+        Args:
+            flow_field (dict, optional): Flow field inputs, such as the wind directions, wind
+                speeds and turbulence intensities, that replace those of this Core in the
+                copy. Defaults to None.
+
+        Returns:
+            Core: The copy.
+        """
+        # The flow field is created from its inputs and the grid is built again below, so
+        # that neither the solution nor the grid of this Core are copied
+        flow_field_dict = self.flow_field.as_dict()
+        if flow_field is not None:
+            flow_field_dict.update(flow_field)
+        memo = self.farm.shared_turbine_data()
+        memo[id(self.flow_field)] = FlowField.from_dict(flow_field_dict)
+        memo[id(self.grid)] = self.grid
+        memo[id(self.wake_source_terms)] = None
+        memo[id(self._solved_turbine_grid)] = None
+        core_copy = copy.deepcopy(self, memo)
+        core_copy.farm.state = State.UNINITIALIZED
+        core_copy.state = State.UNINITIALIZED
+
+        # Farm quantities that were expanded over the findices are constructed again
+        core_copy.farm.construct_hub_heights()
+        core_copy.farm.construct_rotor_diameters()
+        core_copy.farm.construct_turbine_TSRs()
+        core_copy.farm.construct_turbine_ref_tilts()
+        core_copy.farm.construct_turbine_correct_cp_ct_for_tilt()
+        n_findex = core_copy.flow_field.n_findex
+        core_copy.farm.set_yaw_angles_to_ref_yaw(n_findex)
+        core_copy.farm.set_tilt_to_ref_tilt(n_findex)
+        core_copy.farm.set_power_setpoints_to_ref_power(n_findex)
+        core_copy.farm.set_awc_modes_to_ref_mode(n_findex)
+        core_copy.farm.set_awc_amplitudes_to_ref_amp(n_findex)
+        core_copy.farm.set_awc_frequencies_to_ref_freq(n_findex)
+        core_copy.construct_grid()
+        if isinstance(core_copy.grid, (TurbineGrid, TurbineCubatureGrid)):
+            core_copy.farm.expand_farm_properties(n_findex, core_copy.grid.sorted_coord_indices)
+
+        return core_copy
+
     def initialize_domain(self):
         """Initialize solution space prior to wake calculations"""
 
-        # Initialize field quantities; doing this immediately prior to doing
-        # the calculation step allows for manipulating inputs in a script
-        # without changing the data structures
-        self.flow_field.initialize_velocity_field(self.grid)
+        with profiler.stage("Core.initialize_domain", "core"):
+            # Initialize field quantities; doing this immediately prior to doing
+            # the calculation step allows for manipulating inputs in a script
+            # without changing the data structures
+            self.flow_field.initialize_velocity_field(self.grid)
+
+            # Initialize farm quantities
+            self.farm.initialize(self.grid.sorted_indices)
+
+            # Any stored wake source terms belong to the previous solve
+            self.wake_source_terms = None
+            self._solved_turbine_grid = None
 
-        # Initialize farm quantities
-        self.farm.initialize(self.grid.sorted_indices)
+            self.state.INITIALIZED
 
-        self.state.INITIALIZED
+    @property
+    def uses_sequential_solver(self) -> bool:
+        """Whether the wake calculations are done by :py:func:`sequential_solver`."""
+        return self.wake.model_strings["velocity_model"] not in [
+            "cc",
+            "turbopark",
+            "empirical_gauss",
+        ]
 
-    def steady_state_atmospheric_condition(self):
+    def solve_to_checkpoint(
+        self,
+        checkpoint_index: int,
+        resume_from: SequentialSolverCheckpoint | None = None,
+    ) -> SequentialSolverCheckpoint:
+        """Solve only the turbines upstream of a sorted position and return the state of
+        the sequential solver there. Later solves that only change the turbines at or
+        downstream of this position can resume from the returned checkpoint. Note that
+        initialize_domain() is required to be called before this function, and that the
+        solution is not finalized.
+
+        Args:
+            checkpoint_index (int): Sorted position of the turbine before which the solve
+                stops.
+            resume_from (SequentialSolverCheckpoint, optional): A checkpoint at or upstream
+                of checkpoint_index from which to start the solve. Defaults to None.
+
+        Returns:
+            SequentialSolverCheckpoint: The solver state before the turbine at
+            checkpoint_index.
+        """
+        if not self.uses_sequential_solver:
+            raise ValueError(
+                "Solver checkpoints are only supported by models that use the sequential "
+                f"solver, but the velocity model is {self.wake.model_strings['velocity_model']}."
+            )
+
+        return sequential_solver(
+            self.farm,
+            self.flow_field,
+            self.grid,
+            self.wake,
+            checkpoint_index=checkpoint_index,
+            resume_from=resume_from,
+            stop_at_checkpoint=True,
+        )
+
+    def steady_state_atmospheric_condition(
+        self,
+        resume_from: SequentialSolverCheckpoint | None = None,
+    ):
         """Perform the steady-state wind farm wake calculations. Note that
-        initialize_domain() is required to be called before this function."""
+        initialize_domain() is required to be called before this function.
+
+        Args:
+            resume_from (SequentialSolverCheckpoint, optional): A checkpoint from
+                :py:meth:`solve_to_checkpoint` with the same wind conditions and the same
+                settings for the turbines upstream of the checkpoint. The solve starts from
+                this state rather than from the first turbine. Only supported by models
+                that use the sequential solver. Defaults to None.
+        """
 
         vel_model = self.wake.model_strings["velocity_model"]
 
+        if resume_from is not None and not self.uses_sequential_solver:
+            raise ValueError(
+                "Solver checkpoints are only supported by models that use the sequential "
+                f"solver, but the velocity model is {vel_model}."
+            )
+
         if vel_model not in ["empirical_gauss"] and \
             self.farm.correct_cp_ct_for_tilt.any():
             self.logger.warning(
@@ -173,41 +327,84 @@ class Core(BaseClass):
                 "be included, but no enhanced wake recovery will occur."
             )
 
-        if vel_model=="cc":
-            cc_solver(
-                self.farm,
-                self.flow_field,
+        wake_induced_mixing = None
+        with profiler.stage("Core.solve", "core"):
+            if vel_model=="cc":
+                cc_solver(
+                    self.farm,
+                    self.flow_field,
+                    self.grid,
+                    self.wake
+                )
+            elif vel_model=="turbopark":
+                self.logger.warning(
+                    "The turbopark model has been superseded by the turboparkgauss model. We " +
+                    "recommend using `velocity_model: turboparkgauss` instead."
+                )
+                turbopark_solver(
+                    self.farm,
+                    self.flow_field,
+                    self.grid,
+                    self.wake
+                )
+            elif vel_model=="empirical_gauss":
+                wake_induced_mixing = empirical_gauss_solver(
+                    self.farm,
+                    self.flow_field,
+                    self.grid,
+                    self.wake
+                )
+            else:
+                sequential_solver(
+                    self.farm,
+                    self.flow_field,
+                    self.grid,
+                    self.wake,
+                    resume_from=resume_from,
+                )
+
+        # If this solve matches the turbine grid used by the full flow solvers, keep it so that
+        # the wake source terms can be reused rather than solving the farm again. Shallow copies
+        # are enough since the sorted arrays are replaced rather than modified in place.
+        if (
+            vel_model != "turbopark"
+            and type(self.grid) is TurbineGrid
+            and self.grid.grid_resolution == FULL_FLOW_TURBINE_GRID_RESOLUTION
+        ):
+            self._solved_turbine_grid = (
+                copy.copy(self.farm),
+                copy.copy(self.flow_field),
                 self.grid,
-                self.wake
-            )
-        elif vel_model=="turbopark":
-            self.logger.warning(
-                "The turbopark model has been superseded by the turboparkgauss model. We " +
-                "recommend using `velocity_model: turboparkgauss` instead."
-            )
-            turbopark_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
-            )
-        elif vel_model=="empirical_gauss":
-            empirical_gauss_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
-            )
-        else:
-            sequential_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
+                wake_induced_mixing,
             )
 
         self.finalize()
 
+    def get_wake_source_terms(self) -> WakeSourceTerms | None:
+        """
+        Get the wake source terms from the most recent turbine grid solve if they are still
+        valid for the current wind conditions and turbine setpoints.
+
+        Returns:
+            WakeSourceTerms | None: The wake source terms, or None if they are not available.
+        """
+        if self.wake_source_terms is None and self._solved_turbine_grid is not None:
+            farm, flow_field, grid, wake_induced_mixing = self._solved_turbine_grid
+            self.wake_source_terms = WakeSourceTerms.from_turbine_grid(
+                farm,
+                flow_field,
+                grid,
+                wake_induced_mixing=wake_induced_mixing,
+            )
+            self._solved_turbine_grid = None
+
+        if (
+            self.wake_source_terms is not None
+            and self.wake_source_terms.matches(self.farm, self.flow_field)
+        ):
+            return self.wake_source_terms
+        return None
+
     def solve_for_viz(self):
         # Do the calculation with the TurbineGrid for a single wind speed
         # and wind direction and 1 point on the grid. Then, use the result
@@ -215,40 +412,45 @@ class Core(BaseClass):
         # This function call should be for a single wind direction and wind speed
         # since the memory consumption is very large.
 
+        wake_source_terms = self.get_wake_source_terms()
+
         self.flow_field.initialize_velocity_field(self.grid)
 
         vel_model = self.wake.model_strings["velocity_model"]
 
         if vel_model=="cc":
-            full_flow_cc_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_cc_solver(
+                self.farm, self.flow_field, self.grid, self.wake, wake_source_terms
+            )
         elif vel_model=="turbopark":
             full_flow_turbopark_solver(self.farm, self.flow_field, self.grid, self.wake)
         elif vel_model=="empirical_gauss":
-            full_flow_empirical_gauss_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_empirical_gauss_solver(
+                self.farm, self.flow_field, self.grid, self.wake, wake_source_terms
+            )
         else:
-            full_flow_sequential_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_sequential_solver(
+                self.farm, self.flow_field, self.grid, self.wake, wake_source_terms
+            )
 
-    def solve_for_points(self, x, y, z):
+    def solve_for_points(
+        self,
+        x,
+        y,
+        z,
+        chunk_size: int | None = None,
+        return_components: bool = False,
+        u_initial_mean: NDArrayFloat | None = None,
+    ):
         # Do the calculation with the TurbineGrid for a single wind speed
         # and wind direction and a 3x3 rotor grid. Then, use the result
         # to construct the full flow field grid.
-        # This function call should be for a single wind direction and wind speed
-        # since the memory consumption is very large.
-
-        # Instantiate the flow_grid
-        field_grid = PointsGrid(
-            points_x=x,
-            points_y=y,
-            points_z=z,
-            turbine_coordinates=self.farm.coordinates,
-            turbine_diameters=self.farm.rotor_diameters,
-            wind_directions=self.flow_field.wind_directions,
-            grid_resolution=1,
-            x_center_of_rotation=self.grid.x_center_of_rotation,
-            y_center_of_rotation=self.grid.y_center_of_rotation
-        )
-
-        self.flow_field.initialize_velocity_field(field_grid)
+        # The points are evaluated in blocks of at most chunk_size points so that the
+        # memory consumption is bounded for large numbers of points. The turbine grid
+        # is solved at most once and its wake source terms are shared by all blocks.
+        # The transverse velocities scale with the mean initial velocity over all of the
+        # points, which is found before the blocks are solved, or given with
+        # u_initial_mean when the points are a part of a larger set.
 
         vel_model = self.wake.model_strings["velocity_model"]
 
@@ -258,13 +460,110 @@ class Core(BaseClass):
                 "However, it is available for \'turboparkgauss\'."
             )
         elif vel_model == "empirical_gauss":
-            full_flow_empirical_gauss_solver(self.farm, self.flow_field, field_grid, self.wake)
+            solver = empirical_gauss_solver
+            full_flow_solver = full_flow_empirical_gauss_solver
         elif vel_model == "cc":
-            full_flow_cc_solver(self.farm, self.flow_field, field_grid, self.wake)
+            solver = cc_solver
+            full_flow_solver = full_flow_cc_solver
         else:
-            full_flow_sequential_solver(self.farm, self.flow_field, field_grid, self.wake)
+            solver = sequential_solver
+            full_flow_solver = full_flow_sequential_solver
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        n_points = len(x)
+        if chunk_size is None:
+            chunk_size = max(n_points, 1)
+        elif chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        # Reuse the wake source terms from the last call to run(), if still valid
+        wake_source_terms = self.get_wake_source_terms()
+        if wake_source_terms is None and chunk_size < n_points:
+            wake_source_terms = solve_wake_source_terms(
+                self.farm, self.flow_field, self.wake, solver
+            )
+
+        full_flow_kwargs = {}
+        if solver in (sequential_solver, cc_solver) and self.wake.enable_transverse_velocities:
+            if u_initial_mean is None and chunk_size < n_points:
+                u_initial_mean = self.points_u_initial_mean(x, y, z, chunk_size)
+            full_flow_kwargs["u_initial_mean"] = u_initial_mean
+
+        n_findex = self.flow_field.n_findex
+        u = np.empty((n_findex, n_points))
+        if return_components:
+            v = np.empty((n_findex, n_points))
+            w = np.empty((n_findex, n_points))
+
+        for start in range(0, n_points, chunk_size):
+            chunk = slice(start, start + chunk_size)
+
+            field_grid = self._points_grid(x[chunk], y[chunk], z[chunk])
+            self.flow_field.initialize_velocity_field(field_grid)
+
+            full_flow_solver(
+                self.farm,
+                self.flow_field,
+                field_grid,
+                self.wake,
+                wake_source_terms,
+                **full_flow_kwargs,
+            )
+
+            # Remove turbine grid dimensions
+            u[:, chunk] = self.flow_field.u_sorted[:, :, 0, 0]
+            if return_components:
+                v[:, chunk] = self.flow_field.v_sorted[:, :, 0, 0]
+                w[:, chunk] = self.flow_field.w_sorted[:, :, 0, 0]
+
+        if return_components:
+            return u, v, w
+        return u
+
+    def points_u_initial_mean(self, x, y, z, chunk_size: int | None = None) -> NDArrayFloat:
+        """
+        Find the mean of the initial streamwise velocity over a set of points for each
+        findex, evaluating the points in blocks of at most chunk_size points.
 
-        return self.flow_field.u_sorted[:,:,0,0] # Remove turbine grid dimensions
+        Args:
+            x (NDArrayFloat): x-locations of the points.
+            y (NDArrayFloat): y-locations of the points.
+            z (NDArrayFloat): z-locations of the points.
+            chunk_size (int, optional): Maximum number of points to evaluate at once.
+                Defaults to None, in which case all points are evaluated together.
+
+        Returns:
+            NDArrayFloat: The mean initial velocity with shape (n_findex,).
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        n_points = len(x)
+        if chunk_size is None:
+            chunk_size = max(n_points, 1)
+
+        u_initial_sum = np.zeros(self.flow_field.n_findex)
+        for start in range(0, n_points, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            field_grid = self._points_grid(x[chunk], y[chunk], z[chunk])
+            self.flow_field.initialize_velocity_field(field_grid)
+            u_initial_sum += np.sum(self.flow_field.u_initial_sorted, axis=(1, 2, 3))
+        return u_initial_sum / n_points
+
+    def _points_grid(self, x, y, z) -> PointsGrid:
+        return PointsGrid(
+            points_x=x,
+            points_y=y,
+            points_z=z,
+            turbine_coordinates=self.farm.coordinates,
+            turbine_diameters=self.farm.rotor_diameters,
+            wind_directions=self.flow_field.wind_directions,
+            grid_resolution=1,
+            x_center_of_rotation=self.grid.x_center_of_rotation,
+            y_center_of_rotation=self.grid.y_center_of_rotation
+        )
 
     def solve_for_velocity_deficit_profiles(
         self,
@@ -342,11 +641,12 @@ class Core(BaseClass):
         return velocity_deficit_profiles
 
     def finalize(self):
-        # Once the wake calculation is finished, unsort the values to match
-        # the user-supplied order of things.
-        self.flow_field.finalize(self.grid.unsorted_indices)
-        self.farm.finalize(self.grid.unsorted_indices)
-        self.state = State.USED
+        with profiler.stage("Core.finalize", "core"):
+            # Once the wake calculation is finished, unsort the values to match
+            # the user-supplied order of things.
+            self.flow_field.finalize(self.grid.unsorted_indices)
+            self.farm.finalize(self.grid.unsorted_indices)
+            self.state = State.USED
 
     ## I/O
 
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import pickle
 from collections.abc import Callable
 from pathlib import Path
 from typing import (
@@ -30,11 +32,41 @@ from floris.type_dec import (
     NDArrayObject,
     NDArrayStr,
 )
-from floris.utilities import load_yaml
+from floris.utilities import load_yaml_cached
 
 
 default_turbine_library_path = Path(__file__).parents[1] / "turbine_library"
 
+# Turbines built in this process, by the digest of their definition; see load_turbine()
+TURBINE_CACHE_SIZE = 32
+_turbine_cache = {}
+
+
+def load_turbine(turbine_definition: dict) -> Turbine:
+    """
+    Build a Turbine from its definition, or reuse the Turbine built from an equal definition
+    earlier in this process. Turbines are not modified after they are built, so they are
+    shared between farms. Multidimensional turbines depend on their data file as well as
+    their definition, so they are always built, but the parsed data file is reused.
+
+    Args:
+        turbine_definition (dict): The turbine definition.
+
+    Returns:
+        Turbine: The turbine.
+    """
+    if turbine_definition.get("multi_dimensional_cp_ct", False):
+        return Turbine.from_dict(turbine_definition)
+
+    digest = hashlib.sha1(pickle.dumps(turbine_definition)).hexdigest()
+    turbine = _turbine_cache.get(digest)
+    if turbine is None:
+        turbine = Turbine.from_dict(turbine_definition)
+        if len(_turbine_cache) >= TURBINE_CACHE_SIZE:
+            _turbine_cache.pop(next(iter(_turbine_cache)))
+        _turbine_cache[digest] = turbine
+    return turbine
+
 
 @define
 class Farm(BaseClass):
@@ -185,7 +217,7 @@ class Farm(BaseClass):
                         f"The turbine type: {t} does not exist in either the internal or"
                         " external turbine library."
                     )
-                self._turbine_definition_cache[t] = load_yaml(full_path)
+                self._turbine_definition_cache[t] = load_yaml_cached(full_path)
 
         # Convert any dict entries in the turbine_type list to the type string. Since the
         # definition is saved above, we can make the whole list consistent now to use it
@@ -297,7 +329,7 @@ class Farm(BaseClass):
 
     def construct_turbine_map(self):
         turbine_map_unique = {
-            k: Turbine.from_dict(v) for k, v in self._turbine_definition_cache.items()
+            k: load_turbine(v) for k, v in self._turbine_definition_cache.items()
         }
         self.turbine_map = [turbine_map_unique[k] for k in self._turbine_types]
 
@@ -326,6 +358,30 @@ class Farm(BaseClass):
             turb.turbine_type: turb.power_thrust_table for turb in self.turbine_map
         }
 
+    def shared_turbine_data(self) -> dict:
+        """
+        The read-only turbine models of the farm and the structures built from them, keyed
+        by object id as a copy.deepcopy() memo. Deep copies made with this memo share these
+        objects with the farm rather than copying them. They are never modified in place after
+        they are built: changes to the turbine definitions are made on a copy and set as a
+        new turbine_type, which builds new ones.
+
+        Returns:
+            dict: The shared objects keyed by their id.
+        """
+        shared = [
+            self.turbine_type,
+            self.turbine_definitions,
+            self.turbine_map,
+            self._turbine_definition_cache,
+            self.turbine_thrust_coefficient_functions,
+            self.turbine_axial_induction_functions,
+            self.turbine_tilt_interps,
+            self.turbine_power_functions,
+            self.turbine_power_thrust_tables,
+        ]
+        return {id(obj): obj for obj in shared}
+
     def expand_farm_properties(self, n_findex: int, sorted_coord_indices):
         template_shape = np.ones_like(sorted_coord_indices)
         self.hub_heights_sorted = np.take_along_axis(
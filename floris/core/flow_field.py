@@ -4,12 +4,10 @@ from __future__ import annotations
 import copy
 
 import attrs
-import matplotlib.path as mpltPath
 import numpy as np
 from attrs import define, field
 from scipy.interpolate import LinearNDInterpolator
 from scipy.spatial import ConvexHull
-from shapely.geometry import Polygon
 
 from floris.core import (
     BaseClass,
@@ -166,6 +164,9 @@ class FlowField(BaseClass):
         # If heterogeneous flow data is given, the speed ups at the defined
         # grid locations are determined in either 2 or 3 dimensions.
         else:
+            import matplotlib.path as mpltPath
+            from shapely.geometry import Polygon
+
             bounds = np.array(list(zip(
                 self.heterogeneous_inflow_config['x'],
                 self.heterogeneous_inflow_config['y']
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import copy
 
+import attrs
 import numpy as np
+from attrs import define, field
 
+from floris import profiler
 from floris.core import (
     axial_induction,
     Farm,
@@ -24,10 +27,320 @@ from floris.core.wake_deflection.gauss import (
     yaw_added_turbulence_mixing,
 )
 from floris.core.wake_velocity.empirical_gauss import awc_added_wake_mixing
-from floris.type_dec import NDArrayFloat
+from floris.type_dec import (
+    NDArrayFloat,
+    NDArrayInt,
+)
 from floris.utilities import cosd
 
 
+# Rotor grid resolution of the TurbineGrid that the full flow solvers use to compute the
+# turbine operating points before evaluating the wakes on the full flow grid
+FULL_FLOW_TURBINE_GRID_RESOLUTION = 3
+
+
+def _operating_conditions(farm: Farm, flow_field: FlowField) -> tuple:
+    return (
+        flow_field.wind_directions,
+        flow_field.wind_speeds,
+        flow_field.turbulence_intensities,
+        farm.yaw_angles,
+        farm.power_setpoints,
+        farm.awc_modes,
+        farm.awc_amplitudes,
+        farm.awc_frequencies,
+    )
+
+
+@define
+class WakeSourceTerms:
+    """
+    Per-turbine quantities from a solved :py:class:`~.grid.TurbineGrid` that act as the
+    sources of the wakes in the full flow solvers. Once computed, these allow the wakes
+    to be evaluated on any other grid without solving the farm again.
+
+    All arrays are in the sorted frame. The rotor quantities have shape
+    (n_findex, n_turbines, n_grid, n_grid) and all others have shape (n_findex, n_turbines).
+
+    Args:
+        x (NDArrayFloat): Streamwise location of each rotor center.
+        y (NDArrayFloat): Spanwise location of each rotor center.
+        z (NDArrayFloat): Vertical location of each rotor center.
+        y_rotor (NDArrayFloat): Spanwise location of the rotor grid points.
+        z_rotor (NDArrayFloat): Vertical location of the rotor grid points.
+        u_rotor (NDArrayFloat): Streamwise velocity at the rotor grid points.
+        v_rotor (NDArrayFloat): Spanwise velocity at the rotor grid points.
+        u_initial_rotor (NDArrayFloat): Inflow velocity at the rotor grid points.
+        thrust_coefficients (NDArrayFloat): Thrust coefficient of each turbine.
+        axial_inductions (NDArrayFloat): Axial induction of each turbine.
+        turbulence_intensities (NDArrayFloat): Rotor-averaged turbulence intensity.
+        yaw_angles (NDArrayFloat): Yaw angle of each turbine.
+        tilt_angles (NDArrayFloat): Tilt angle of each turbine at its effective velocity.
+        hub_heights (NDArrayFloat): Hub height of each turbine.
+        rotor_diameters (NDArrayFloat): Rotor diameter of each turbine.
+        TSRs (NDArrayFloat): Tip speed ratio of each turbine.
+        wake_induced_mixing (NDArrayFloat | None): Total wake-induced mixing at each turbine
+            for the empirical Gaussian model. Defaults to None.
+        conditions (tuple): The wind conditions and turbine setpoints (in the user-supplied
+            order) for which the terms were computed.
+    """
+    x: NDArrayFloat = field()
+    y: NDArrayFloat = field()
+    z: NDArrayFloat = field()
+    y_rotor: NDArrayFloat = field()
+    z_rotor: NDArrayFloat = field()
+    u_rotor: NDArrayFloat = field()
+    v_rotor: NDArrayFloat = field()
+    u_initial_rotor: NDArrayFloat = field()
+    thrust_coefficients: NDArrayFloat = field()
+    axial_inductions: NDArrayFloat = field()
+    turbulence_intensities: NDArrayFloat = field()
+    yaw_angles: NDArrayFloat = field()
+    tilt_angles: NDArrayFloat = field()
+    hub_heights: NDArrayFloat = field()
+    rotor_diameters: NDArrayFloat = field()
+    TSRs: NDArrayFloat = field()
+    wake_induced_mixing: NDArrayFloat | None = field(default=None)
+    conditions: tuple = field(factory=tuple)
+
+    @classmethod
+    def from_turbine_grid(
+        cls,
+        farm: Farm,
+        flow_field: FlowField,
+        grid: TurbineGrid,
+        wake_induced_mixing: NDArrayFloat | None = None,
+    ) -> WakeSourceTerms:
+        """
+        Extract the wake source terms from a farm and flow field that have been solved on
+        the given :py:class:`~.grid.TurbineGrid`.
+
+        Args:
+            farm (Farm): The solved farm, including the sorted turbine properties.
+            flow_field (FlowField): The solved flow field on the turbine grid.
+            grid (TurbineGrid): The turbine grid used in the solve.
+            wake_induced_mixing (NDArrayFloat | None, optional): The mixing factor returned by
+                the empirical Gaussian solver. Defaults to None.
+
+        Returns:
+            WakeSourceTerms: The per-turbine wake source terms.
+        """
+        thrust_coefficients = thrust_coefficient(
+            velocities=flow_field.u_sorted,
+            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+            air_density=flow_field.air_density,
+            yaw_angles=farm.yaw_angles_sorted,
+            tilt_angles=farm.tilt_angles_sorted,
+            power_setpoints=farm.power_setpoints_sorted,
+            awc_modes=farm.awc_modes_sorted,
+            awc_amplitudes=farm.awc_amplitudes_sorted,
+            thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
+            tilt_interps=farm.turbine_tilt_interps,
+            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+            turbine_type_map=farm.turbine_type_map_sorted,
+            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+            average_method=grid.average_method,
+            cubature_weights=grid.cubature_weights,
+            multidim_condition=flow_field.multidim_conditions,
+        )
+        axial_inductions = axial_induction(
+            velocities=flow_field.u_sorted,
+            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+            air_density=flow_field.air_density,
+            yaw_angles=farm.yaw_angles_sorted,
+            tilt_angles=farm.tilt_angles_sorted,
+            power_setpoints=farm.power_setpoints_sorted,
+            awc_modes=farm.awc_modes_sorted,
+            awc_amplitudes=farm.awc_amplitudes_sorted,
+            axial_induction_functions=farm.turbine_axial_induction_functions,
+            tilt_interps=farm.turbine_tilt_interps,
+            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+            turbine_type_map=farm.turbine_type_map_sorted,
+            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+            average_method=grid.average_method,
+            cubature_weights=grid.cubature_weights,
+            multidim_condition=flow_field.multidim_conditions,
+        )
+        average_velocities = average_velocity(
+            flow_field.u_sorted,
+            method=grid.average_method,
+            cubature_weights=grid.cubature_weights
+        )
+        if wake_induced_mixing is not None:
+            wake_induced_mixing = wake_induced_mixing.sum(axis=2)
+
+        return cls(
+            x=np.mean(grid.x_sorted, axis=(2, 3)),
+            y=np.mean(grid.y_sorted, axis=(2, 3)),
+            z=np.mean(grid.z_sorted, axis=(2, 3)),
+            y_rotor=grid.y_sorted,
+            z_rotor=grid.z_sorted,
+            u_rotor=flow_field.u_sorted,
+            v_rotor=flow_field.v_sorted,
+            u_initial_rotor=flow_field.u_initial_sorted,
+            thrust_coefficients=thrust_coefficients,
+            axial_inductions=axial_inductions,
+            turbulence_intensities=np.mean(
+                flow_field.turbulence_intensity_field_sorted,
+                axis=(2, 3),
+            ),
+            yaw_angles=farm.yaw_angles_sorted,
+            tilt_angles=farm.calculate_tilt_for_eff_velocities(average_velocities),
+            hub_heights=farm.hub_heights_sorted,
+            rotor_diameters=farm.rotor_diameters_sorted,
+            TSRs=farm.TSRs_sorted,
+            wake_induced_mixing=wake_induced_mixing,
+            conditions=tuple(
+                np.array(c, copy=True) for c in _operating_conditions(farm, flow_field)
+            ),
+        )
+
+    def matches(self, farm: Farm, flow_field: FlowField) -> bool:
+        """
+        Check whether these terms were computed for the wind conditions and turbine
+        setpoints currently set on the farm and flow field.
+        """
+        current = _operating_conditions(farm, flow_field)
+        return len(current) == len(self.conditions) and all(
+            np.array_equal(a, b) for a, b in zip(self.conditions, current)
+        )
+
+    def select(self, findex: int | NDArrayInt) -> WakeSourceTerms:
+        """
+        Return the wake source terms for a subset of the findex.
+
+        Args:
+            findex (int | NDArrayInt): The findex, or array of findices, to select.
+
+        Returns:
+            WakeSourceTerms: The terms with a leading dimension of the number of findices
+            selected.
+        """
+        findices = np.atleast_1d(findex)
+        selected = {
+            a.name: getattr(self, a.name)[findices]
+            for a in attrs.fields(WakeSourceTerms)
+            if isinstance(getattr(self, a.name), np.ndarray)
+        }
+        selected["conditions"] = tuple(c[findices] for c in self.conditions)
+        return attrs.evolve(self, **selected)
+
+
+def solve_wake_source_terms(
+    farm: Farm,
+    flow_field: FlowField,
+    model_manager: WakeModelManager,
+    solver,
+) -> WakeSourceTerms:
+    """
+    Solve the farm on a :py:class:`~.grid.TurbineGrid` and extract the wake source terms
+    for the full flow solvers. The given farm and flow field are not modified.
+
+    Args:
+        farm (Farm): The farm to solve.
+        flow_field (FlowField): The flow field with the wind conditions to solve.
+        model_manager (WakeModelManager): The wake models.
+        solver (Callable): The turbine grid solver, such as :py:func:`sequential_solver`.
+
+    Returns:
+        WakeSourceTerms: The per-turbine wake source terms.
+    """
+    turbine_grid_farm = copy.deepcopy(farm)
+    turbine_grid_flow_field = copy.deepcopy(flow_field)
+
+    turbine_grid_farm.construct_turbine_map()
+    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
+    turbine_grid_farm.construct_turbine_axial_induction_functions()
+    turbine_grid_farm.construct_turbine_power_functions()
+    turbine_grid_farm.construct_hub_heights()
+    turbine_grid_farm.construct_rotor_diameters()
+    turbine_grid_farm.construct_turbine_TSRs()
+    turbine_grid_farm.construct_turbine_ref_tilts()
+    turbine_grid_farm.construct_turbine_tilt_interps()
+    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
+    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
+
+    turbine_grid = TurbineGrid(
+        turbine_coordinates=turbine_grid_farm.coordinates,
+        turbine_diameters=turbine_grid_farm.rotor_diameters,
+        wind_directions=turbine_grid_flow_field.wind_directions,
+        grid_resolution=FULL_FLOW_TURBINE_GRID_RESOLUTION,
+    )
+    turbine_grid_farm.expand_farm_properties(
+        turbine_grid_flow_field.n_findex,
+        turbine_grid.sorted_coord_indices,
+    )
+    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
+    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
+
+    # Only the empirical Gaussian solver returns a value: the wake-induced mixing factor
+    wake_induced_mixing = solver(
+        turbine_grid_farm,
+        turbine_grid_flow_field,
+        turbine_grid,
+        model_manager
+    )
+
+    return WakeSourceTerms.from_turbine_grid(
+        turbine_grid_farm,
+        turbine_grid_flow_field,
+        turbine_grid,
+        wake_induced_mixing=wake_induced_mixing,
+    )
+
+
+@define
+class SequentialSolverCheckpoint:
+    """
+    The state of :py:func:`sequential_solver` immediately before the turbine at sorted
+    position ``index`` is solved. The wakes of all turbines upstream of this position are
+    already combined into the fields, so a solve with the same wind conditions and the same
+    settings for those upstream turbines can resume from here rather than from the first
+    turbine.
+
+    All arrays are in the sorted frame with shape (n_findex, n_turbines, n_grid, n_grid).
+
+    Args:
+        index (int): Sorted position of the next turbine to solve.
+        wake_field (NDArrayFloat): Combined streamwise velocity deficit.
+        v_wake (NDArrayFloat): Spanwise velocity from the most recent turbine.
+        w_wake (NDArrayFloat): Vertical velocity from the most recent turbine.
+        u_sorted (NDArrayFloat): Streamwise velocity at the rotor grid points.
+        v_sorted (NDArrayFloat): Spanwise velocity at the rotor grid points.
+        w_sorted (NDArrayFloat): Vertical velocity at the rotor grid points.
+        turbine_turbulence_intensity (NDArrayFloat): Turbulence intensity at the rotor grid
+            points, including the wake-added turbulence.
+    """
+    index: int = field()
+    wake_field: NDArrayFloat = field()
+    v_wake: NDArrayFloat = field()
+    w_wake: NDArrayFloat = field()
+    u_sorted: NDArrayFloat = field()
+    v_sorted: NDArrayFloat = field()
+    w_sorted: NDArrayFloat = field()
+    turbine_turbulence_intensity: NDArrayFloat = field()
+
+    def select(self, findex: int | NDArrayInt) -> SequentialSolverCheckpoint:
+        """
+        Return the checkpoint for a subset of the findex. Findices may be repeated, for
+        example to resume several solves that share the same upstream turbines.
+
+        Args:
+            findex (int | NDArrayInt): The findex, or array of findices, to select.
+
+        Returns:
+            SequentialSolverCheckpoint: The checkpoint with a leading dimension of the number
+            of findices selected.
+        """
+        findices = np.atleast_1d(findex)
+        selected = {
+            a.name: getattr(self, a.name)[findices]
+            for a in attrs.fields(SequentialSolverCheckpoint)
+            if a.name != "index"
+        }
+        return attrs.evolve(self, **selected)
+
+
 def calculate_area_overlap(wake_velocities, freestream_velocities, y_ngrid, z_ngrid):
     """
     compute wake overlap based on the number of points that are not freestream
@@ -49,13 +362,22 @@ def sequential_solver(
     farm: Farm,
     flow_field: FlowField,
     grid: TurbineGrid,
-    model_manager: WakeModelManager
-) -> None:
+    model_manager: WakeModelManager,
+    checkpoint_index: int | None = None,
+    resume_from: SequentialSolverCheckpoint | None = None,
+    stop_at_checkpoint: bool = False,
+) -> SequentialSolverCheckpoint | None:
     # Algorithm
     # For each turbine, calculate its effect on every downstream turbine.
     # For the current turbine, we are calculating the deficit that it adds to downstream turbines.
     # Integrate this into the main data structure.
     # Move on to the next turbine.
+    #
+    # If checkpoint_index is given, the state before the turbine at that sorted position is
+    # solved is returned, and with stop_at_checkpoint the solve ends there. If resume_from is
+    # given, the solve starts from that state rather than from the first turbine. The caller
+    # must ensure that the wind conditions and the settings of the turbines upstream of the
+    # checkpoint are unchanged.
 
     # <<interface>>
     deflection_model_args = model_manager.deflection_model.prepare_function(grid, flow_field)
@@ -75,8 +397,39 @@ def sequential_solver(
     ambient_turbulence_intensities = flow_field.turbulence_intensities.copy()
     ambient_turbulence_intensities = ambient_turbulence_intensities[:, None, None, None]
 
+    start_index = 0
+    if resume_from is not None:
+        if checkpoint_index is not None and checkpoint_index < resume_from.index:
+            raise ValueError(
+                f"Cannot record a checkpoint at sorted position {checkpoint_index} when "
+                f"resuming from sorted position {resume_from.index}."
+            )
+        start_index = resume_from.index
+        wake_field = resume_from.wake_field.copy()
+        v_wake = resume_from.v_wake.copy()
+        w_wake = resume_from.w_wake.copy()
+        turbine_turbulence_intensity = resume_from.turbine_turbulence_intensity.copy()
+        flow_field.u_sorted = resume_from.u_sorted.copy()
+        flow_field.v_sorted = resume_from.v_sorted.copy()
+        flow_field.w_sorted = resume_from.w_sorted.copy()
+    checkpoint = None
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
-    for i in range(grid.n_turbines):
+    for i in range(start_index, grid.n_turbines):
+
+        if i == checkpoint_index:
+            checkpoint = SequentialSolverCheckpoint(
+                index=i,
+                wake_field=wake_field.copy(),
+                v_wake=v_wake.copy(),
+                w_wake=w_wake.copy(),
+                u_sorted=flow_field.u_sorted.copy(),
+                v_sorted=flow_field.v_sorted.copy(),
+                w_sorted=flow_field.w_sorted.copy(),
+                turbine_turbulence_intensity=turbine_turbulence_intensity.copy(),
+            )
+            if stop_at_checkpoint:
+                return checkpoint
 
         # Get the current turbine quantities
         x_i = np.mean(grid.x_sorted[:, i:i+1], axis=(2, 3))
@@ -89,47 +442,48 @@ def sequential_solver(
         u_i = flow_field.u_sorted[:, i:i+1]
         v_i = flow_field.v_sorted[:, i:i+1]
 
-        ct_i = thrust_coefficient(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions
-        )
-        # Since we are filtering for the i'th turbine in the thrust coefficient function,
-        # get the first index here (0:1)
-        ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            axial_induction_functions=farm.turbine_axial_induction_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions
-        )
+        with profiler.stage("thrust_induction", "solver"):
+            ct_i = thrust_coefficient(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions
+            )
+            # Since we are filtering for the i'th turbine in the thrust coefficient function,
+            # get the first index here (0:1)
+            ct_i = ct_i[:, 0:1, None, None]
+            axial_induction_i = axial_induction(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                axial_induction_functions=farm.turbine_axial_induction_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions
+            )
         # Since we are filtering for the i'th turbine in the axial induction function,
         # get the first index here (0:1)
         axial_induction_i = axial_induction_i[:, 0:1, None, None]
@@ -160,15 +514,16 @@ def sequential_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field = model_manager.deflection_model.function(
-            x_i,
-            y_i,
-            effective_yaw_i,
-            turbulence_intensity_i,
-            ct_i,
-            rotor_diameter_i,
-            **deflection_model_args,
-        )
+        with profiler.stage("deflection", "solver"):
+            deflection_field = model_manager.deflection_model.function(
+                x_i,
+                y_i,
+                effective_yaw_i,
+                turbulence_intensity_i,
+                ct_i,
+                rotor_diameter_i,
+                **deflection_model_args,
+            )
 
         if model_manager.enable_transverse_velocities:
             v_wake, w_wake = calculate_transverse_velocity(
@@ -200,32 +555,35 @@ def sequential_solver(
             turbine_turbulence_intensity[:, i:i+1] = turbulence_intensity_i + gch_gain * I_mixing
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
-            x_i,
-            y_i,
-            z_i,
-            axial_induction_i,
-            deflection_field,
-            yaw_angle_i,
-            turbulence_intensity_i,
-            ct_i,
-            hub_height_i,
-            rotor_diameter_i,
-            **deficit_model_args,
-        )
+        with profiler.stage("deficit", "solver"):
+            velocity_deficit = model_manager.velocity_model.function(
+                x_i,
+                y_i,
+                z_i,
+                axial_induction_i,
+                deflection_field,
+                yaw_angle_i,
+                turbulence_intensity_i,
+                ct_i,
+                hub_height_i,
+                rotor_diameter_i,
+                **deficit_model_args,
+            )
 
-        wake_field = model_manager.combination_model.function(
-            wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
-        )
+        with profiler.stage("combination", "solver"):
+            wake_field = model_manager.combination_model.function(
+                wake_field,
+                velocity_deficit * flow_field.u_initial_sorted
+            )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
-            ambient_turbulence_intensities,
-            grid.x_sorted,
-            x_i,
-            rotor_diameter_i,
-            axial_induction_i,
-        )
+        with profiler.stage("turbulence", "solver"):
+            wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+                ambient_turbulence_intensities,
+                grid.x_sorted,
+                x_i,
+                rotor_diameter_i,
+                axial_induction_i,
+            )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
         area_overlap = (
@@ -259,43 +617,27 @@ def sequential_solver(
         axis=(2,3)
     )[:, :, None, None]
 
+    return checkpoint
+
 
 def full_flow_sequential_solver(
     farm: Farm,
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid | FlowFieldPlanarGrid | PointsGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    wake_source_terms: WakeSourceTerms | None = None,
+    u_initial_mean: NDArrayFloat | None = None,
 ) -> None:
 
-    # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
-
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
-    turbine_grid_farm.construct_hub_heights()
-    turbine_grid_farm.construct_rotor_diameters()
-    turbine_grid_farm.construct_turbine_TSRs()
-    turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
-    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
-    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
-
-    turbine_grid = TurbineGrid(
-        turbine_coordinates=turbine_grid_farm.coordinates,
-        turbine_diameters=turbine_grid_farm.rotor_diameters,
-        wind_directions=turbine_grid_flow_field.wind_directions,
-        grid_resolution=3,
-    )
-    turbine_grid_farm.expand_farm_properties(
-        turbine_grid_flow_field.n_findex,
-        turbine_grid.sorted_coord_indices,
-    )
-    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
-    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    sequential_solver(turbine_grid_farm, turbine_grid_flow_field, turbine_grid, model_manager)
+    # Get the flow quantities and turbine performance, reusing a previous solution if given
+    if wake_source_terms is None:
+        wake_source_terms = solve_wake_source_terms(
+            farm,
+            flow_field,
+            model_manager,
+            sequential_solver
+        )
+    terms = wake_source_terms
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
@@ -317,66 +659,20 @@ def full_flow_sequential_solver(
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, i:i+1], axis=(2, 3))
-        x_i = x_i[:, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, i:i+1], axis=(2, 3))
-        y_i = y_i[:, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, i:i+1], axis=(2, 3))
-        z_i = z_i[:, :, None, None]
+        x_i = terms.x[:, i:i+1, None, None]
+        y_i = terms.y[:, i:i+1, None, None]
+        z_i = terms.z[:, i:i+1, None, None]
 
-        u_i = turbine_grid_flow_field.u_sorted[:, i:i+1]
-        v_i = turbine_grid_flow_field.v_sorted[:, i:i+1]
-
-        ct_i = thrust_coefficient(
-            velocities=turbine_grid_flow_field.u_sorted,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=turbine_grid_farm.turbine_thrust_coefficient_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the thrust_coefficient function,
-        # get the first index here (0:1)
-        ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
-            velocities=turbine_grid_flow_field.u_sorted,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            axial_induction_functions=turbine_grid_farm.turbine_axial_induction_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the axial induction function,
-        # get the first index here (0:1)
-        axial_induction_i = axial_induction_i[:, 0:1, None, None]
-        turbulence_intensity_i = \
-            turbine_grid_flow_field.turbulence_intensity_field_sorted_avg[:, i:i+1]
-        yaw_angle_i = turbine_grid_farm.yaw_angles_sorted[:, i:i+1, None, None]
-        hub_height_i = turbine_grid_farm.hub_heights_sorted[:, i:i+1, None, None]
-        rotor_diameter_i = turbine_grid_farm.rotor_diameters_sorted[:, i:i+1, None, None]
-        TSR_i = turbine_grid_farm.TSRs_sorted[:, i:i+1, None, None]
+        u_i = terms.u_rotor[:, i:i+1]
+        v_i = terms.v_rotor[:, i:i+1]
+
+        ct_i = terms.thrust_coefficients[:, i:i+1, None, None]
+        axial_induction_i = terms.axial_inductions[:, i:i+1, None, None]
+        turbulence_intensity_i = terms.turbulence_intensities[:, i:i+1, None, None]
+        yaw_angle_i = terms.yaw_angles[:, i:i+1, None, None]
+        hub_height_i = terms.hub_heights[:, i:i+1, None, None]
+        rotor_diameter_i = terms.rotor_diameters[:, i:i+1, None, None]
+        TSR_i = terms.TSRs[:, i:i+1, None, None]
 
         effective_yaw_i = np.zeros_like(yaw_angle_i)
         effective_yaw_i += yaw_angle_i
@@ -385,9 +681,9 @@ def full_flow_sequential_solver(
             added_yaw = wake_added_yaw(
                 u_i,
                 v_i,
-                turbine_grid_flow_field.u_initial_sorted,
-                turbine_grid.y_sorted[:, i:i+1] - y_i,
-                turbine_grid.z_sorted[:, i:i+1],
+                terms.u_initial_rotor,
+                terms.y_rotor[:, i:i+1] - y_i,
+                terms.z_rotor[:, i:i+1],
                 rotor_diameter_i,
                 hub_height_i,
                 ct_i,
@@ -424,6 +720,7 @@ def full_flow_sequential_solver(
                 TSR_i,
                 axial_induction_i,
                 flow_field.wind_shear,
+                u_initial_mean=u_initial_mean,
             )
 
         # NOTE: exponential
@@ -508,68 +805,69 @@ def cc_solver(
         )
 
         turb_avg_vels = average_velocity(turb_inflow_field)
-        turb_Cts = thrust_coefficient(
-            turb_avg_vels,
-            flow_field.turbulence_intensity_field_sorted,
-            flow_field.air_density,
-            farm.yaw_angles_sorted,
-            farm.tilt_angles_sorted,
-            farm.power_setpoints_sorted,
-            farm.awc_modes_sorted,
-            farm.awc_amplitudes_sorted,
-            farm.turbine_thrust_coefficient_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
-        turb_Cts = turb_Cts[:, :, None, None]
-        turb_aIs = axial_induction(
-            turb_avg_vels,
-            flow_field.turbulence_intensity_field_sorted,
-            flow_field.air_density,
-            farm.yaw_angles_sorted,
-            farm.tilt_angles_sorted,
-            farm.power_setpoints_sorted,
-            farm.awc_modes_sorted,
-            farm.awc_amplitudes_sorted,
-            farm.turbine_axial_induction_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
-        turb_aIs = turb_aIs[:, :, None, None]
-
-        u_i = turb_inflow_field[:, i:i+1]
-        v_i = flow_field.v_sorted[:, i:i+1]
-
-        axial_induction_i = axial_induction(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            axial_induction_functions=farm.turbine_axial_induction_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
+        with profiler.stage("thrust_induction", "solver"):
+            turb_Cts = thrust_coefficient(
+                turb_avg_vels,
+                flow_field.turbulence_intensity_field_sorted,
+                flow_field.air_density,
+                farm.yaw_angles_sorted,
+                farm.tilt_angles_sorted,
+                farm.power_setpoints_sorted,
+                farm.awc_modes_sorted,
+                farm.awc_amplitudes_sorted,
+                farm.turbine_thrust_coefficient_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
+            turb_Cts = turb_Cts[:, :, None, None]
+            turb_aIs = axial_induction(
+                turb_avg_vels,
+                flow_field.turbulence_intensity_field_sorted,
+                flow_field.air_density,
+                farm.yaw_angles_sorted,
+                farm.tilt_angles_sorted,
+                farm.power_setpoints_sorted,
+                farm.awc_modes_sorted,
+                farm.awc_amplitudes_sorted,
+                farm.turbine_axial_induction_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
+            turb_aIs = turb_aIs[:, :, None, None]
+
+            u_i = turb_inflow_field[:, i:i+1]
+            v_i = flow_field.v_sorted[:, i:i+1]
+
+            axial_induction_i = axial_induction(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                axial_induction_functions=farm.turbine_axial_induction_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
 
         axial_induction_i = axial_induction_i[:, :, None, None]
 
@@ -600,15 +898,16 @@ def cc_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field = model_manager.deflection_model.function(
-            x_i,
-            y_i,
-            effective_yaw_i,
-            turbulence_intensity_i,
-            turb_Cts[:, i:i+1],
-            rotor_diameter_i,
-            **deflection_model_args,
-        )
+        with profiler.stage("deflection", "solver"):
+            deflection_field = model_manager.deflection_model.function(
+                x_i,
+                y_i,
+                effective_yaw_i,
+                turbulence_intensity_i,
+                turb_Cts[:, i:i+1],
+                rotor_diameter_i,
+                **deflection_model_args,
+            )
 
         if model_manager.enable_transverse_velocities:
             v_wake, w_wake = calculate_transverse_velocity(
@@ -640,29 +939,31 @@ def cc_solver(
             gch_gain = 1.0
             turbine_turbulence_intensity[:, i:i+1] = turbulence_intensity_i + gch_gain * I_mixing
 
-        turb_u_wake, Ctmp = model_manager.velocity_model.function(
-            i,
-            x_i,
-            y_i,
-            z_i,
-            u_i,
-            deflection_field,
-            yaw_angle_i,
-            turbine_turbulence_intensity,
-            turb_Cts,
-            farm.rotor_diameters_sorted[:, :, None, None],
-            turb_u_wake,
-            Ctmp,
-            **deficit_model_args,
-        )
+        with profiler.stage("deficit", "solver"):
+            turb_u_wake, Ctmp = model_manager.velocity_model.function(
+                i,
+                x_i,
+                y_i,
+                z_i,
+                u_i,
+                deflection_field,
+                yaw_angle_i,
+                turbine_turbulence_intensity,
+                turb_Cts,
+                farm.rotor_diameters_sorted[:, :, None, None],
+                turb_u_wake,
+                Ctmp,
+                **deficit_model_args,
+            )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
-            ambient_turbulence_intensities,
-            grid.x_sorted,
-            x_i,
-            rotor_diameter_i,
-            turb_aIs
-        )
+        with profiler.stage("turbulence", "solver"):
+            wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+                ambient_turbulence_intensities,
+                grid.x_sorted,
+                x_i,
+                rotor_diameter_i,
+                turb_aIs
+            )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
         area_overlap = 1 - (
@@ -702,36 +1003,13 @@ def full_flow_cc_solver(
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid | FlowFieldPlanarGrid | PointsGrid,
     model_manager: WakeModelManager,
+    wake_source_terms: WakeSourceTerms | None = None,
+    u_initial_mean: NDArrayFloat | None = None,
 ) -> None:
-    # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
-
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
-    turbine_grid_farm.construct_hub_heights()
-    turbine_grid_farm.construct_rotor_diameters()
-    turbine_grid_farm.construct_turbine_TSRs()
-    turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
-    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
-    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
-
-    turbine_grid = TurbineGrid(
-        turbine_coordinates=turbine_grid_farm.coordinates,
-        turbine_diameters=turbine_grid_farm.rotor_diameters,
-        wind_directions=turbine_grid_flow_field.wind_directions,
-        grid_resolution=3,
-    )
-    turbine_grid_farm.expand_farm_properties(
-        turbine_grid_flow_field.n_findex,
-        turbine_grid.sorted_coord_indices,
-    )
-    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
-    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    cc_solver(turbine_grid_farm, turbine_grid_flow_field, turbine_grid, model_manager)
+    # Get the flow quantities and turbine performance, reusing a previous solution if given
+    if wake_source_terms is None:
+        wake_source_terms = solve_wake_source_terms(farm, flow_field, model_manager, cc_solver)
+    terms = wake_source_terms
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
@@ -752,68 +1030,27 @@ def full_flow_cc_solver(
     shape = (farm.n_turbines,) + np.shape(flow_field.u_initial_sorted)
     Ctmp = np.zeros((shape))
 
+    turb_Cts = terms.thrust_coefficients[:, :, None, None]
+    turbine_turbulence_intensities = terms.turbulence_intensities[:, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, i:i+1], axis=(2, 3))
-        x_i = x_i[:, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, i:i+1], axis=(2, 3))
-        y_i = y_i[:, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, i:i+1], axis=(2, 3))
-        z_i = z_i[:, :, None, None]
+        x_i = terms.x[:, i:i+1, None, None]
+        y_i = terms.y[:, i:i+1, None, None]
+        z_i = terms.z[:, i:i+1, None, None]
 
-        u_i = turbine_grid_flow_field.u_sorted[:, i:i+1]
-        v_i = turbine_grid_flow_field.v_sorted[:, i:i+1]
-
-        turb_avg_vels = average_velocity(turbine_grid_flow_field.u_sorted)
-        turb_Cts = thrust_coefficient(
-            velocities=turb_avg_vels,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=turbine_grid_farm.turbine_thrust_coefficient_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        turb_Cts = turb_Cts[:, :, None, None]
-
-        axial_induction_i = axial_induction(
-            velocities=turbine_grid_flow_field.u_sorted,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            axial_induction_functions=turbine_grid_farm.turbine_axial_induction_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        axial_induction_i = axial_induction_i[:, :, None, None]
+        u_i = terms.u_rotor[:, i:i+1]
+        v_i = terms.v_rotor[:, i:i+1]
 
-        turbulence_intensity_i = \
-            turbine_grid_flow_field.turbulence_intensity_field_sorted_avg[:, i:i+1]
-        yaw_angle_i = turbine_grid_farm.yaw_angles_sorted[:, i:i+1, None, None]
-        hub_height_i = turbine_grid_farm.hub_heights_sorted[:, i:i+1, None, None]
-        rotor_diameter_i = turbine_grid_farm.rotor_diameters_sorted[:, i:i+1, None, None]
-        TSR_i = turbine_grid_farm.TSRs_sorted[:, i:i+1, None, None]
+        axial_induction_i = terms.axial_inductions[:, i:i+1, None, None]
+
+        turbulence_intensity_i = turbine_turbulence_intensities[:, i:i+1]
+        yaw_angle_i = terms.yaw_angles[:, i:i+1, None, None]
+        hub_height_i = terms.hub_heights[:, i:i+1, None, None]
+        rotor_diameter_i = terms.rotor_diameters[:, i:i+1, None, None]
+        TSR_i = terms.TSRs[:, i:i+1, None, None]
 
         effective_yaw_i = np.zeros_like(yaw_angle_i)
         effective_yaw_i += yaw_angle_i
@@ -822,9 +1059,9 @@ def full_flow_cc_solver(
             added_yaw = wake_added_yaw(
                 u_i,
                 v_i,
-                turbine_grid_flow_field.u_initial_sorted,
-                turbine_grid.y_sorted[:, i:i+1] - y_i,
-                turbine_grid.z_sorted[:, i:i+1],
+                terms.u_initial_rotor,
+                terms.y_rotor[:, i:i+1] - y_i,
+                terms.z_rotor[:, i:i+1],
                 rotor_diameter_i,
                 hub_height_i,
                 turb_Cts[:, i:i+1],
@@ -863,6 +1100,7 @@ def full_flow_cc_solver(
                 axial_induction_i,
                 flow_field.wind_shear,
                 scale=2.0,
+                u_initial_mean=u_initial_mean,
             )
 
         # NOTE: exponential
@@ -874,9 +1112,9 @@ def full_flow_cc_solver(
             u_i,
             deflection_field,
             yaw_angle_i,
-            turbine_grid_flow_field.turbulence_intensity_field_sorted_avg,
+            turbine_turbulence_intensities,
             turb_Cts,
-            turbine_grid_farm.rotor_diameters_sorted[:, :, None, None],
+            terms.rotor_diameters[:, :, None, None],
             turb_u_wake,
             Ctmp,
             **deficit_model_args,
@@ -930,66 +1168,67 @@ def turbopark_solver(
         z_i = np.mean(grid.z_sorted[:, i:i+1], axis=(2, 3))
         z_i = z_i[:, :, None, None]
 
-        Cts = thrust_coefficient(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
+        with profiler.stage("thrust_induction", "solver"):
+            Cts = thrust_coefficient(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
 
-        ct_i = thrust_coefficient(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the thrust coefficient function,
-        # get the first index here (0:1)
-        ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            axial_induction_functions=farm.turbine_axial_induction_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
+            ct_i = thrust_coefficient(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
+            # Since we are filtering for the i'th turbine in the thrust coefficient function,
+            # get the first index here (0:1)
+            ct_i = ct_i[:, 0:1, None, None]
+            axial_induction_i = axial_induction(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                axial_induction_functions=farm.turbine_axial_induction_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
         # Since we are filtering for the i'th turbine in the axial induction function,
         # get the first index here (0:1)
         axial_induction_i = axial_induction_i[:, 0:1, None, None]
@@ -1042,15 +1281,16 @@ def turbopark_solver(
                 ct_ii = ct_ii[:, 0:1, None, None]
                 rotor_diameter_ii = farm.rotor_diameters_sorted[:, ii:ii+1, None, None]
 
-                deflection_field_ii = model_manager.deflection_model.function(
-                    x_ii,
-                    y_ii,
-                    yaw_ii,
-                    turbulence_intensity_ii,
-                    ct_ii,
-                    rotor_diameter_ii,
-                    **deflection_model_args,
-                )
+                with profiler.stage("deflection", "solver"):
+                    deflection_field_ii = model_manager.deflection_model.function(
+                        x_ii,
+                        y_ii,
+                        yaw_ii,
+                        turbulence_intensity_ii,
+                        ct_ii,
+                        rotor_diameter_ii,
+                        **deflection_model_args,
+                    )
 
                 deflection_field[:, ii:ii+1, :, :] = deflection_field_ii[:, i:i+1, :, :]
 
@@ -1063,31 +1303,34 @@ def turbopark_solver(
                 "Yaw added recovery not used in this model.")
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
-            x_i,
-            y_i,
-            z_i,
-            turbine_turbulence_intensity,
-            Cts[:, :, None, None],
-            rotor_diameter_i,
-            farm.rotor_diameters_sorted[:, :, None, None],
-            i,
-            deflection_field,
-            **deficit_model_args,
-        )
+        with profiler.stage("deficit", "solver"):
+            velocity_deficit = model_manager.velocity_model.function(
+                x_i,
+                y_i,
+                z_i,
+                turbine_turbulence_intensity,
+                Cts[:, :, None, None],
+                rotor_diameter_i,
+                farm.rotor_diameters_sorted[:, :, None, None],
+                i,
+                deflection_field,
+                **deficit_model_args,
+            )
 
-        wake_field = model_manager.combination_model.function(
-            wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
-        )
+        with profiler.stage("combination", "solver"):
+            wake_field = model_manager.combination_model.function(
+                wake_field,
+                velocity_deficit * flow_field.u_initial_sorted
+            )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
-            ambient_turbulence_intensities,
-            grid.x_sorted,
-            x_i,
-            rotor_diameter_i,
-            axial_induction_i
-        )
+        with profiler.stage("turbulence", "solver"):
+            wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+                ambient_turbulence_intensities,
+                grid.x_sorted,
+                x_i,
+                rotor_diameter_i,
+                axial_induction_i
+            )
 
         # TODO: leaving this in for GCH quantities; will need to find another way to
         # compute area_overlap as the current wake deficit is solved for only upstream
@@ -1198,47 +1441,48 @@ def empirical_gauss_solver(
         z_i = np.mean(grid.z_sorted[:, i:i+1], axis=(2, 3))
         z_i = z_i[:, :, None, None]
 
-        ct_i = thrust_coefficient(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the thrust coefficient function,
-        # get the first index here (0:1)
-        ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
-            velocities=flow_field.u_sorted,
-            turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
-            air_density=flow_field.air_density,
-            yaw_angles=farm.yaw_angles_sorted,
-            tilt_angles=farm.tilt_angles_sorted,
-            power_setpoints=farm.power_setpoints_sorted,
-            awc_modes=farm.awc_modes_sorted,
-            awc_amplitudes=farm.awc_amplitudes_sorted,
-            axial_induction_functions=farm.turbine_axial_induction_functions,
-            tilt_interps=farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=grid.average_method,
-            cubature_weights=grid.cubature_weights,
-            multidim_condition=flow_field.multidim_conditions,
-        )
+        with profiler.stage("thrust_induction", "solver"):
+            ct_i = thrust_coefficient(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                thrust_coefficient_functions=farm.turbine_thrust_coefficient_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
+            # Since we are filtering for the i'th turbine in the thrust coefficient function,
+            # get the first index here (0:1)
+            ct_i = ct_i[:, 0:1, None, None]
+            axial_induction_i = axial_induction(
+                velocities=flow_field.u_sorted,
+                turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
+                air_density=flow_field.air_density,
+                yaw_angles=farm.yaw_angles_sorted,
+                tilt_angles=farm.tilt_angles_sorted,
+                power_setpoints=farm.power_setpoints_sorted,
+                awc_modes=farm.awc_modes_sorted,
+                awc_amplitudes=farm.awc_amplitudes_sorted,
+                axial_induction_functions=farm.turbine_axial_induction_functions,
+                tilt_interps=farm.turbine_tilt_interps,
+                correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt_sorted,
+                turbine_type_map=farm.turbine_type_map_sorted,
+                turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+                ix_filter=[i],
+                average_method=grid.average_method,
+                cubature_weights=grid.cubature_weights,
+                multidim_condition=flow_field.multidim_conditions,
+            )
         # Since we are filtering for the i'th turbine in the axial induction function,
         # get the first index here (0:1)
         axial_induction_i = axial_induction_i[:, 0:1, None, None]
@@ -1298,48 +1542,52 @@ def empirical_gauss_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field_y, deflection_field_z = model_manager.deflection_model.function(
-            x_i,
-            y_i,
-            yaw_angle_i,
-            tilt_angle_i,
-            mixing_i,
-            ct_i,
-            rotor_diameter_i,
-            **deflection_model_args
-        )
+        with profiler.stage("deflection", "solver"):
+            deflection_field_y, deflection_field_z = model_manager.deflection_model.function(
+                x_i,
+                y_i,
+                yaw_angle_i,
+                tilt_angle_i,
+                mixing_i,
+                ct_i,
+                rotor_diameter_i,
+                **deflection_model_args
+            )
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
-            x_i,
-            y_i,
-            z_i,
-            axial_induction_i,
-            deflection_field_y,
-            deflection_field_z,
-            yaw_angle_i,
-            tilt_angle_i,
-            mixing_i,
-            ct_i,
-            hub_height_i,
-            rotor_diameter_i,
-            **deficit_model_args
-        )
+        with profiler.stage("deficit", "solver"):
+            velocity_deficit = model_manager.velocity_model.function(
+                x_i,
+                y_i,
+                z_i,
+                axial_induction_i,
+                deflection_field_y,
+                deflection_field_z,
+                yaw_angle_i,
+                tilt_angle_i,
+                mixing_i,
+                ct_i,
+                hub_height_i,
+                rotor_diameter_i,
+                **deficit_model_args
+            )
 
-        wake_field = model_manager.combination_model.function(
-            wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
-        )
+        with profiler.stage("combination", "solver"):
+            wake_field = model_manager.combination_model.function(
+                wake_field,
+                velocity_deficit * flow_field.u_initial_sorted
+            )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
         area_overlap = np.sum(velocity_deficit * flow_field.u_initial_sorted > 0.05, axis=(2, 3))\
             / (grid.grid_resolution * grid.grid_resolution)
 
         # Compute wake induced mixing factor
-        mixing_factor[:,:,i] += \
-            area_overlap * model_manager.turbulence_model.function(
-                axial_induction_i, downstream_distance_D[:,:,i]
-            )
+        with profiler.stage("turbulence", "solver"):
+            mixing_factor[:,:,i] += \
+                area_overlap * model_manager.turbulence_model.function(
+                    axial_induction_i, downstream_distance_D[:,:,i]
+                )
         if model_manager.enable_yaw_added_recovery:
             mixing_factor[:,:,i] += \
                 area_overlap * yaw_added_wake_mixing(
@@ -1360,43 +1608,19 @@ def full_flow_empirical_gauss_solver(
     farm: Farm,
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    wake_source_terms: WakeSourceTerms | None = None,
 ) -> None:
 
-    # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
-
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
-    turbine_grid_farm.construct_hub_heights()
-    turbine_grid_farm.construct_rotor_diameters()
-    turbine_grid_farm.construct_turbine_TSRs()
-    turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
-    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
-    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
-
-    turbine_grid = TurbineGrid(
-        turbine_coordinates=turbine_grid_farm.coordinates,
-        turbine_diameters=turbine_grid_farm.rotor_diameters,
-        wind_directions=turbine_grid_flow_field.wind_directions,
-        grid_resolution=3,
-    )
-    turbine_grid_farm.expand_farm_properties(
-        turbine_grid_flow_field.n_findex,
-        turbine_grid.sorted_coord_indices
-    )
-    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
-    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    wim_field = empirical_gauss_solver(
-        turbine_grid_farm,
-        turbine_grid_flow_field,
-        turbine_grid,
-        model_manager
-    )
+    # Get the flow quantities and turbine performance, reusing a previous solution if given
+    if wake_source_terms is None:
+        wake_source_terms = solve_wake_source_terms(
+            farm,
+            flow_field,
+            model_manager,
+            empirical_gauss_solver
+        )
+    terms = wake_source_terms
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
@@ -1414,71 +1638,20 @@ def full_flow_empirical_gauss_solver(
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, i:i+1], axis=(2,3))
-        x_i = x_i[:, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, i:i+1], axis=(2,3))
-        y_i = y_i[:, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, i:i+1], axis=(2,3))
-        z_i = z_i[:, :, None, None]
-
-        ct_i = thrust_coefficient(
-            velocities=turbine_grid_flow_field.u_sorted,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            thrust_coefficient_functions=turbine_grid_farm.turbine_thrust_coefficient_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the thrust coefficient function,
-        # get the first index here (0:1)
-        ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
-            velocities=turbine_grid_flow_field.u_sorted,
-            turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
-            air_density=turbine_grid_flow_field.air_density,
-            yaw_angles=turbine_grid_farm.yaw_angles_sorted,
-            tilt_angles=turbine_grid_farm.tilt_angles_sorted,
-            power_setpoints=turbine_grid_farm.power_setpoints_sorted,
-            awc_modes=turbine_grid_farm.awc_modes_sorted,
-            awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
-            axial_induction_functions=turbine_grid_farm.turbine_axial_induction_functions,
-            tilt_interps=turbine_grid_farm.turbine_tilt_interps,
-            correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
-            turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
-            turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
-            ix_filter=[i],
-            average_method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights,
-            multidim_condition=turbine_grid_flow_field.multidim_conditions,
-        )
-        # Since we are filtering for the i'th turbine in the axial induction function,
-        # get the first index here (0:1)
-        axial_induction_i = axial_induction_i[:, 0:1, None, None]
-        yaw_angle_i = turbine_grid_farm.yaw_angles_sorted[:, i:i+1, None, None]
-        hub_height_i = turbine_grid_farm.hub_heights_sorted[:, i:i+1, None, None]
-        rotor_diameter_i = turbine_grid_farm.rotor_diameters_sorted[:, i:i+1, None, None]
-        wake_induced_mixing_i = wim_field[:, i:i+1, :, None].sum(axis=2, keepdims=1)
+        x_i = terms.x[:, i:i+1, None, None]
+        y_i = terms.y[:, i:i+1, None, None]
+        z_i = terms.z[:, i:i+1, None, None]
+
+        ct_i = terms.thrust_coefficients[:, i:i+1, None, None]
+        axial_induction_i = terms.axial_inductions[:, i:i+1, None, None]
+        yaw_angle_i = terms.yaw_angles[:, i:i+1, None, None]
+        hub_height_i = terms.hub_heights[:, i:i+1, None, None]
+        rotor_diameter_i = terms.rotor_diameters[:, i:i+1, None, None]
+        wake_induced_mixing_i = terms.wake_induced_mixing[:, i:i+1, None, None]
         effective_yaw_i = np.zeros_like(yaw_angle_i)
         effective_yaw_i += yaw_angle_i
 
-        average_velocities = average_velocity(
-            turbine_grid_flow_field.u_sorted,
-            method=turbine_grid.average_method,
-            cubature_weights=turbine_grid.cubature_weights
-        )
-        tilt_angle_i = turbine_grid_farm.calculate_tilt_for_eff_velocities(average_velocities)
-        tilt_angle_i = tilt_angle_i[:, i:i+1, None, None]
+        tilt_angle_i = terms.tilt_angles[:, i:i+1, None, None]
 
         if model_manager.enable_secondary_steering:
             raise NotImplementedError(
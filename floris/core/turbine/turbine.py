@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from pathlib import Path
 
 import attrs
@@ -30,7 +31,11 @@ from floris.type_dec import (
     NDArrayObject,
     NDArrayStr,
 )
-from floris.utilities import cosd
+from floris.utilities import (
+    cosd,
+    file_cache_key,
+    FILE_CACHE_SIZE,
+)
 
 
 TURBINE_MODEL_MAP = {
@@ -421,6 +426,42 @@ def axial_induction(
     return axial_induction
 
 
+@lru_cache(maxsize=FILE_CACHE_SIZE)
+def _read_multidim_power_thrust_data(cache_key: tuple) -> tuple[list, dict]:
+    """
+    Read a multidimensional power and thrust coefficient data file once per process for each
+    version of the file; see floris.utilities.file_cache_key. The returned arrays are shared
+    by all turbines that use the file and must not be modified in place.
+
+    Args:
+        cache_key (tuple): The file cache key, starting with the resolved file path.
+
+    Returns:
+        tuple: The condition keys and, for each multidimensional condition, a dict with the
+        wind speed, power and thrust coefficient arrays.
+    """
+    df = pd.read_csv(cache_key[0])
+
+    # Down-select the DataFrame to have just the ws, Cp, and Ct values
+    index_col = df.columns.values[:-3]
+    condition_keys = index_col.tolist()
+    df2 = df.set_index(condition_keys)
+
+    # Group the ws/Cp/Ct data by the multi-dimensional keys, which are tuples only if there
+    # are several condition keys
+    tables = {}
+    level = condition_keys if len(condition_keys) > 1 else condition_keys[0]
+    for key, data in df2.groupby(level=level, sort=False):
+        if isinstance(key, tuple):
+            key = tuple(k.item() if isinstance(k, np.generic) else k for k in key)
+        tables[key] = {
+            "wind_speed": data['ws'].values,
+            "power": data['power'].values,
+            "thrust_coefficient": data['thrust_coefficient'].values,
+        }
+    return condition_keys, tables
+
+
 @define
 class Turbine(BaseClass):
     """
@@ -546,33 +587,17 @@ class Turbine(BaseClass):
         # Solidify the data file path and name
         self.power_thrust_data_file = self.turbine_library_path / self.power_thrust_data_file
 
-        # Read in the multi-dimensional data supplied by the user.
-        df = pd.read_csv(self.power_thrust_data_file)
-
-        # Down-select the DataFrame to have just the ws, Cp, and Ct values
-        index_col = df.columns.values[:-3]
-        self.condition_keys = index_col.tolist()
-        df2 = df.set_index(index_col.tolist())
-
-        # Loop over the multi-dimensional keys to get the correct ws/Cp/Ct data to make
-        # the thrust_coefficient and power interpolants.
-        power_thrust_table_ = {} # Reset
-        for key in df2.index.unique():
-            # Select the correct ws/Cp/Ct data
-            data = df2.loc[key]
+        # Read in the multi-dimensional data supplied by the user, or reuse the data read
+        # from the unchanged file earlier in this process
+        condition_keys, tables = _read_multidim_power_thrust_data(
+            file_cache_key(self.power_thrust_data_file)
+        )
+        self.condition_keys = list(condition_keys)
 
-            # Build the interpolants
-            power_thrust_table_.update(
-                {
-                    key: {
-                        "wind_speed": data['ws'].values,
-                        "power": data['power'].values,
-                        "thrust_coefficient": data['thrust_coefficient'].values,
-                        **power_thrust_table_ref
-                    },
-                }
-            )
-            # Add reference information at the lower level
+        # Add the reference information to the ws/Cp/Ct data of each multi-dimensional key
+        power_thrust_table_ = {
+            key: {**table, **power_thrust_table_ref} for key, table in tables.items()
+        }
 
         # Set on-object version
         self.power_thrust_table = power_thrust_table_
@@ -347,10 +347,15 @@ def calculate_transverse_velocity(
     axial_induction_i,
     wind_shear,
     scale=1.0,
+    u_initial_mean=None,
 ):
     """
     Calculate transverse velocity components for all downstream turbines
     given the vortices at the current turbine.
+
+    The vortex strengths are scaled with the mean of u_initial over the grid for each
+    findex. When the grid is solved in parts, u_initial_mean, with shape (n_findex,), gives
+    the mean over the whole grid so that the result does not depend on the parts.
     """
 
     # turbine parameters
@@ -361,8 +366,9 @@ def calculate_transverse_velocity(
     aI = axial_induction_i
 
     # flow parameters
-    Uinf = np.mean(u_initial, axis=(1, 2, 3))
-    Uinf = Uinf[:, None, None, None]
+    if u_initial_mean is None:
+        u_initial_mean = np.mean(u_initial, axis=(1, 2, 3))
+    Uinf = u_initial_mean[:, None, None, None]
 
     eps_gain = 0.2
     eps = eps_gain * D  # Use set value
@@ -1,10 +1,9 @@
 
 import copy
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
+from scipy.interpolate import griddata, RectBivariateSpline
 
 
 def nudge_outward(x):
@@ -89,8 +88,14 @@ class CutPlane:
     """
     A CutPlane object represents a 2D slice through the flow of a
     FLORIS simulation, or other such as SOWFA result.
+
+    The data is held either as a DataFrame or, for planes on a structured grid, as 2D
+    arrays with shape (x2 resolution, x1 resolution). In the latter case, the DataFrame
+    is only built when :py:attr:`df` is accessed.
     """
 
+    COLUMNS = ("x1", "x2", "x3", "u", "v", "w")
+
     def __init__(self, df, x1_resolution, x2_resolution, normal_vector):
         """
         Initialize CutPlane object, storing the DataFrame and resolution.
@@ -99,10 +104,73 @@ class CutPlane:
             df (pandas.DataFrame): Pandas DataFrame of data with
                 columns x1, x2, u, v, w.
         """
-        self.df: pd.DataFrame = df
+        self.df = df
         self.normal_vector: str = normal_vector
         self.resolution = (x1_resolution, x2_resolution)
-        self.df.set_index(["x1", "x2"])
+
+    @classmethod
+    def from_arrays(cls, x1, x2, x3, u, v, w, normal_vector):
+        """
+        Create a CutPlane from data on a structured grid.
+
+        Args:
+            x1 (np.array): 2D array of x1-coordinates with shape
+                (x2 resolution, x1 resolution).
+            x2 (np.array): 2D array of x2-coordinates.
+            x3 (np.array): 2D array of x3-coordinates.
+            u (np.array): 2D array of u-velocities.
+            v (np.array): 2D array of v-velocities.
+            w (np.array): 2D array of w-velocities.
+            normal_vector (str): Vector normal to the plane.
+
+        Returns:
+            CutPlane: The plane of data.
+        """
+        cut_plane = cls(None, x1.shape[1], x1.shape[0], normal_vector)
+        cut_plane._set_arrays(x1, x2, x3, u, v, w)
+        return cut_plane
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        The data as a DataFrame with columns x1, x2, x3, u, v, w. Since the DataFrame can
+        be modified in place, it replaces the structured arrays once accessed.
+        """
+        if self._df is None and self._arrays is not None:
+            self._df = pd.DataFrame({c: self._arrays[c].flatten() for c in self.COLUMNS})
+            self._arrays = None
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        self._df = df
+        self._arrays = None
+
+    def _set_arrays(self, x1, x2, x3, u, v, w):
+        self._arrays = dict(zip(self.COLUMNS, (x1, x2, x3, u, v, w)))
+        self._df = None
+        self.resolution = (x1.shape[1], x1.shape[0])
+
+    def get_arrays(self) -> dict | None:
+        """
+        Get the data as 2D arrays with shape (x2 resolution, x1 resolution).
+
+        Returns:
+            dict | None: The arrays for x1, x2, x3, u, v, and w, or None if the data does
+            not match the resolution of the plane.
+        """
+        if self._arrays is not None:
+            return self._arrays
+        n_x1, n_x2 = self.resolution
+        if self._df is None or len(self._df) != n_x1 * n_x2:
+            return None
+        return {c: self._df[c].to_numpy().reshape(n_x2, n_x1) for c in self.COLUMNS}
+
+    def _values(self, column):
+        # Flattened values of a column without building the DataFrame
+        if self._arrays is not None:
+            return self._arrays[column].ravel()
+        return self._df[column].to_numpy()
 
     def __sub__(self, other):
 
@@ -113,6 +181,17 @@ class CutPlane:
         # DF must be of the same size
         # resolution must be of the same size
 
+        if self._arrays is not None and other._arrays is not None:
+            return CutPlane.from_arrays(
+                self._arrays["x1"],
+                self._arrays["x2"],
+                self._arrays["x3"],
+                self._arrays["u"] - other._arrays["u"],
+                self._arrays["v"] - other._arrays["v"],
+                self._arrays["w"] - other._arrays["w"],
+                self.normal_vector,
+            )
+
         df: pd.DataFrame = self.df.copy()
         other_df: pd.DataFrame = other.df.copy()
 
@@ -145,6 +224,11 @@ def set_origin(cut_plane, center_x1=0.0, center_x2=0.0):
         cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
             Updated plane of data.
     """
+    if cut_plane._arrays is not None:
+        cut_plane._arrays["x1"] = cut_plane._arrays["x1"] - center_x1
+        cut_plane._arrays["x2"] = cut_plane._arrays["x2"] - center_x2
+        return cut_plane
+
     # Store the un-interpolated input arrays at this slice
     cut_plane.df.x1 = cut_plane.df.x1 - center_x1
     cut_plane.df.x2 = cut_plane.df.x2 - center_x2
@@ -152,6 +236,85 @@ def set_origin(cut_plane, center_x1=0.0, center_x2=0.0):
     return cut_plane
 
 
+def _interpolate(cut_plane, x1_lin, x2_lin):
+    """
+    Interpolate the velocities of a CutPlane onto a grid of x1 and x2 coordinates.
+
+    If the plane is on a structured grid aligned with the x1 and x2 axes, the data is
+    interpolated with splines on the regular grid. Otherwise, the data is interpolated from
+    the scattered points.
+
+    Args:
+        cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
+            Plane of data.
+        x1_lin (np.array): The x1-coordinates of the new grid.
+        x2_lin (np.array): The x2-coordinates of the new grid.
+
+    Returns:
+        dict: 2D arrays of x1, x2, x3, u, v, and w on the new grid.
+    """
+    x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
+    x3_value = cut_plane._values("x3")[0]
+
+    arrays = cut_plane.get_arrays()
+    if arrays is not None:
+        x1_axis = arrays["x1"][0, :]
+        x2_axis = arrays["x2"][:, 0]
+        is_regular = (
+            np.all(arrays["x1"] == x1_axis[None, :])
+            and np.all(arrays["x2"] == x2_axis[:, None])
+            and np.all(np.diff(x1_axis) > 0)
+            and np.all(np.diff(x2_axis) > 0)
+        )
+    else:
+        is_regular = False
+
+    if is_regular:
+        # Interpolating splines on the regular grid, cubic where there are enough points
+        kx2 = min(3, len(x2_axis) - 1)
+        kx1 = min(3, len(x1_axis) - 1)
+        uvw_mesh = np.stack(
+            [
+                RectBivariateSpline(x2_axis, x1_axis, arrays[c], kx=kx2, ky=kx1).ev(
+                    x2_mesh,
+                    x1_mesh,
+                )
+                for c in ("u", "v", "w")
+            ],
+            axis=-1,
+        )
+
+        # Match the scattered interpolation, which is undefined outside of the data
+        outside = (
+            (x1_mesh < x1_axis[0]) | (x1_mesh > x1_axis[-1])
+            | (x2_mesh < x2_axis[0]) | (x2_mesh > x2_axis[-1])
+        )
+        uvw_mesh[outside] = np.nan
+    else:
+        uvw_mesh = griddata(
+            np.column_stack(
+                [
+                    nudge_outward(cut_plane._values("x1")),
+                    nudge_outward(cut_plane._values("x2")),
+                ]
+            ),
+            np.column_stack(
+                [cut_plane._values("u"), cut_plane._values("v"), cut_plane._values("w")]
+            ),
+            (x1_mesh, x2_mesh),
+            method="cubic",
+        )
+
+    return {
+        "x1": x1_mesh,
+        "x2": x2_mesh,
+        "x3": np.full_like(x1_mesh, x3_value),
+        "u": uvw_mesh[..., 0],
+        "v": uvw_mesh[..., 1],
+        "w": uvw_mesh[..., 2],
+    }
+
+
 def change_resolution(cut_plane, resolution=(100, 100)):
     """
     Modify default resolution of a CutPlane object.
@@ -168,55 +331,13 @@ def change_resolution(cut_plane, resolution=(100, 100)):
     """
 
     # Linearize the data
-    x1_lin = np.linspace(min(cut_plane.df.x1), max(cut_plane.df.x1), resolution[0])
-    x2_lin = np.linspace(min(cut_plane.df.x2), max(cut_plane.df.x2), resolution[1])
-    # x3 = np.ones_like(x1) * cut_plane.df.x3[0]
+    x1 = cut_plane._values("x1")
+    x2 = cut_plane._values("x2")
+    x1_lin = np.linspace(np.min(x1), np.max(x1), resolution[0])
+    x2_lin = np.linspace(np.min(x2), np.max(x2), resolution[1])
 
-    # Mesh the data
-    x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
-    x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3[0]
-
-    # Interpolate u,v,w
-    u_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    w_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    # Assign back to df
-    cut_plane.df = pd.DataFrame(
-        {
-            "x1": x1_mesh.flatten(),
-            "x2": x2_mesh.flatten(),
-            "x3": x3_mesh.flatten(),
-            "u": u_mesh.flatten(),
-            "v": v_mesh.flatten(),
-            "w": w_mesh.flatten(),
-        }
-    )
-
-    # Save the resolution
-    cut_plane.resolution = resolution
+    # Interpolate u, v, w and assign back to the plane
+    cut_plane._set_arrays(**_interpolate(cut_plane, x1_lin, x2_lin))
 
     # Return the cutplane
     return cut_plane
@@ -238,55 +359,11 @@ def interpolate_onto_array(cut_plane_in, x1_array, x2_array):
     """
     cut_plane = copy.deepcopy(cut_plane_in)
 
-    # Linearize the data
-    x1_lin = x1_array
-    x2_lin = x2_array
+    # Interpolate u, v, w and assign back to the plane
+    cut_plane._set_arrays(**_interpolate(cut_plane, x1_array, x2_array))
 
     # Save the new resolution
-    cut_plane.resolution = (len(np.unique(x1_lin)), len(np.unique(x2_lin)))
-
-    # Mesh the data
-    x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
-    x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3.iloc[0]
-
-    # Interpolate u,v,w
-    u_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    w_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    # Assign back to df
-    cut_plane.df = pd.DataFrame(
-        {
-            "x1": x1_mesh.flatten(),
-            "x2": x2_mesh.flatten(),
-            "x3": x3_mesh.flatten(),
-            "u": u_mesh.flatten(),
-            "v": v_mesh.flatten(),
-            "w": w_mesh.flatten(),
-        }
-    )
+    cut_plane.resolution = (len(np.unique(x1_array)), len(np.unique(x2_array)))
 
     # Return the cutplane
     return cut_plane
@@ -306,6 +383,11 @@ def rescale_axis(cut_plane, x1_factor=1.0, x2_factor=1.0):
         cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
             Updated plane of data.
     """
+    if cut_plane._arrays is not None:
+        cut_plane._arrays["x1"] = cut_plane._arrays["x1"] / x1_factor
+        cut_plane._arrays["x2"] = cut_plane._arrays["x2"] / x2_factor
+        return cut_plane
+
     # Store the un-interpolated input arrays at this slice
     cut_plane.df.x1 = cut_plane.df.x1 / x1_factor
     cut_plane.df.x2 = cut_plane.df.x2 / x2_factor
@@ -329,7 +411,9 @@ def project_onto(cut_plane_a, cut_plane_b):
     """
 
     return interpolate_onto_array(
-        cut_plane_a, cut_plane_b.df.x1.unique(), cut_plane_b.df.x2.unique()
+        cut_plane_a,
+        pd.unique(cut_plane_b._values("x1")),
+        pd.unique(cut_plane_b._values("x2")),
     )
 
 
@@ -348,21 +432,20 @@ def calculate_wind_speed(cross_plane, x1_loc, x2_loc, R):
         (float): effective wind speed
     """
 
-    # Temp local copy
-    df = cross_plane.df.copy()
-
-    # Make a distance column
-    df["distance"] = np.sqrt((df.x1 - x1_loc) ** 2 + (df.x2 - x2_loc) ** 2)
+    # Distance of each point from the point of interest
+    distance = np.sqrt(
+        (cross_plane._values("x1") - x1_loc) ** 2 + (cross_plane._values("x2") - x2_loc) ** 2
+    )
 
     # Return the cube-mean wind speed
-    return np.cbrt(np.mean(df[df.distance < R].u ** 3))
+    return np.cbrt(np.mean(cross_plane._values("u")[distance < R] ** 3))
 
 
 def wind_speed_profile(cross_plane, R, x2_loc, resolution=100, x1_locs=None):
 
     if x1_locs is None:
         x1_locs = np.linspace(
-            min(cross_plane.df.x1), max(cross_plane.df.x1), resolution
+            np.min(cross_plane._values("x1")), np.max(cross_plane._values("x1")), resolution
         )
     v_array = np.array(
         [calculate_wind_speed(cross_plane, x1_loc, x2_loc, R) for x1_loc in x1_locs]
@@ -412,7 +495,7 @@ def get_power_profile(
 
     if x1_locs is None:
         x1_locs = np.linspace(
-            min(cross_plane.df.x1), max(cross_plane.df.x1), resolution
+            np.min(cross_plane._values("x1")), np.max(cross_plane._values("x1")), resolution
         )
     p_array = np.array(
         [
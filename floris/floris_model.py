@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import inspect
+import pickle
 from pathlib import Path
 from typing import (
     Any,
@@ -10,10 +12,12 @@ from typing import (
     Optional,
 )
 
+import attrs
 import numpy as np
 import pandas as pd
 
-from floris.core import Core, State
+from floris import profiler
+from floris.core import Core, FlowFieldPlanarGrid, State
 from floris.core.rotor_velocity import average_velocity
 from floris.core.turbine.operation_models import (
     POWER_SETPOINT_DEFAULT,
@@ -26,10 +30,13 @@ from floris.core.turbine.turbine import (
 )
 from floris.cut_plane import CutPlane
 from floris.logging_manager import LoggingManager
+from floris.profiler import Profile
 from floris.type_dec import (
     floris_array_converter,
+    floris_float_type,
     NDArrayBool,
     NDArrayFloat,
+    NDArrayInt,
     NDArrayStr,
 )
 from floris.utilities import (
@@ -47,6 +54,31 @@ from floris.wind_data import (
 )
 
 
+# Default number of hours in a year of the annual energy and value production
+HOURS_PER_YEAR = 365 * 24
+
+# Approximate number of point-sized float arrays held at once by the full flow solvers,
+# used to convert a memory budget into a number of points for sample_flow_at_points
+POINTS_WORKING_ARRAYS = 32
+
+# Inputs and outputs given per findex, which are pickled as arrays apart from the rest of the
+# configuration; see FlorisModel.__getstate__
+CONDITION_KEYS = ("wind_directions", "wind_speeds", "turbulence_intensities")
+SETPOINT_DEFAULTS = {
+    "yaw_angles": 0.0,
+    "power_setpoints": POWER_SETPOINT_DEFAULT,
+    "awc_modes": "baseline",
+    "awc_amplitudes": 0.0,
+    "awc_frequencies": 0.0,
+}
+SOLUTION_KEYS = ("u", "v", "w", "turbulence_intensity_field")
+
+# Cores built from unpickled configurations in this process, by configuration digest, so that
+# the turbine models are loaded once per process rather than once per unpickled model
+CORE_TEMPLATE_CACHE_SIZE = 8
+_core_templates = {}
+
+
 class FlorisModel(LoggingManager):
     """
     FlorisModel provides a high-level user interface to many of the
@@ -64,6 +96,9 @@ class FlorisModel(LoggingManager):
                 - **logging**: See `floris.simulation.core.Core` for more details.
     """
 
+    # Profile that records the instrumented stages of the calculations; see set_profiling()
+    _profile: Profile | None = None
+
     @staticmethod
     def get_defaults() -> dict:
         return copy.deepcopy(load_yaml(Path(__file__).parent / "default_inputs.yaml"))
@@ -273,7 +308,8 @@ class FlorisModel(LoggingManager):
         floris_dict["farm"] = farm_dict
 
         # Create a new instance of floris and attach to self
-        self.core = Core.from_dict(floris_dict)
+        with profiler.recording(self._profile):
+            self.core = Core.from_dict(floris_dict)
 
     def set_operation(
         self,
@@ -492,11 +528,12 @@ class FlorisModel(LoggingManager):
         Run the FLORIS solve to compute the velocity field and wake effects.
         """
 
-        # Initialize solution space
-        self.core.initialize_domain()
+        with profiler.recording(self._profile):
+            # Initialize solution space
+            self.core.initialize_domain()
 
-        # Perform the wake calculations
-        self.core.steady_state_atmospheric_condition()
+            # Perform the wake calculations
+            self.core.steady_state_atmospheric_condition()
 
     def run_no_wake(self) -> None:
         """
@@ -505,11 +542,161 @@ class FlorisModel(LoggingManager):
         reduce the power and thrust of the turbine to where they're applied.
         """
 
-        # Initialize solution space
-        self.core.initialize_domain()
+        with profiler.recording(self._profile):
+            # Initialize solution space
+            self.core.initialize_domain()
+
+            # Finalize values to user-supplied order
+            self.core.finalize()
+
+    def run_layouts(
+        self,
+        layouts_x: NDArrayFloat | list[list[float]],
+        layouts_y: NDArrayFloat | list[list[float]],
+        yaw_angles: NDArrayFloat | None = None,
+        max_layouts_per_run: int | None = None,
+    ) -> NDArrayFloat:
+        """
+        Compute the turbine powers for several layouts of the turbines of this model under
+        its current wind conditions and operation setpoints. The layouts are folded into the
+        findex dimension of a single model with turbine coordinates that vary with the findex,
+        so that the grid, the solver and the power calculation evaluate all layouts in one
+        vectorized pass rather than one set() and run() per layout. This model is not changed.
+
+        Args:
+            layouts_x (NDArrayFloat | list[list[float]]): x-coordinates of the turbines with
+                shape (n_layouts, n_turbines).
+            layouts_y (NDArrayFloat | list[list[float]]): y-coordinates of the turbines with
+                shape (n_layouts, n_turbines).
+            yaw_angles (NDArrayFloat | None, optional): Yaw angles of each layout with shape
+                (n_layouts, n_findex, n_turbines). If None, the yaw angles of this model are
+                used for all layouts. Defaults to None.
+            max_layouts_per_run (int | None, optional): Maximum number of layouts to evaluate
+                in one pass, which limits the memory use. If None, all layouts are evaluated in
+                one pass. Defaults to None.
+
+        Returns:
+            NDArrayFloat: Turbine powers with shape (n_layouts, n_findex, n_turbines).
+        """
+        layouts_x = np.atleast_2d(np.array(layouts_x, dtype=float))
+        layouts_y = np.atleast_2d(np.array(layouts_y, dtype=float))
+        n_layouts = layouts_x.shape[0]
+        n_findex = self.core.flow_field.n_findex
+        n_turbines = self.core.farm.n_turbines
+        if layouts_x.shape != (n_layouts, n_turbines) or layouts_y.shape != layouts_x.shape:
+            raise ValueError(
+                "layouts_x and layouts_y must have shape (n_layouts, n_turbines), "
+                f"with n_turbines = {n_turbines}."
+            )
+        if yaw_angles is None:
+            yaw_angles = np.repeat(self.core.farm.yaw_angles[None, :, :], n_layouts, axis=0)
+        yaw_angles = np.array(yaw_angles, dtype=float)
+        if yaw_angles.shape != (n_layouts, n_findex, n_turbines):
+            raise ValueError("yaw_angles must have shape (n_layouts, n_findex, n_turbines).")
+        if max_layouts_per_run is None:
+            max_layouts_per_run = n_layouts
+
+        turbine_powers = np.zeros((n_layouts, n_findex, n_turbines))
+        for i_start in range(0, n_layouts, max_layouts_per_run):
+            layouts = slice(i_start, min(i_start + max_layouts_per_run, n_layouts))
+            turbine_powers[layouts] = self._run_layouts(
+                layouts_x[layouts],
+                layouts_y[layouts],
+                yaw_angles[layouts],
+            ).reshape(-1, n_findex, n_turbines)
+
+        return turbine_powers
+
+    def _run_layouts(self, layouts_x, layouts_y, yaw_angles) -> NDArrayFloat:
+        # Model with the conditions and setpoints repeated for each layout
+        n_layouts = layouts_x.shape[0]
+        flow_field = self.core.flow_field
+        if flow_field.heterogeneous_inflow_config is not None:
+            heterogeneous_inflow_config = {
+                **flow_field.heterogeneous_inflow_config,
+                'speed_multipliers': np.tile(
+                    np.asarray(flow_field.heterogeneous_inflow_config['speed_multipliers']),
+                    (n_layouts, 1),
+                ),
+            }
+        else:
+            heterogeneous_inflow_config = None
+        fmodel_layouts = self.copy()
+        fmodel_layouts._reinitialize(
+            wind_directions=np.tile(flow_field.wind_directions, n_layouts),
+            wind_speeds=np.tile(flow_field.wind_speeds, n_layouts),
+            turbulence_intensities=np.tile(flow_field.turbulence_intensities, n_layouts),
+            heterogeneous_inflow_config=heterogeneous_inflow_config,
+        )
+        farm = self.core.farm
+        farm_layouts = fmodel_layouts.core.farm
+        farm_layouts.set_yaw_angles(yaw_angles.reshape(-1, farm.n_turbines))
+        farm_layouts.set_power_setpoints(np.tile(farm.power_setpoints, (n_layouts, 1)))
+        if farm.awc_modes is not None:
+            farm_layouts.set_awc_modes(np.tile(farm.awc_modes, (n_layouts, 1)))
+        farm_layouts.set_awc_amplitudes(np.tile(farm.awc_amplitudes, (n_layouts, 1)))
+        farm_layouts.set_awc_frequencies(np.tile(farm.awc_frequencies, (n_layouts, 1)))
+
+        # Rebuild the grid with turbine coordinates that vary with the findex, so that the
+        # turbines are sorted separately for each layout
+        core = fmodel_layouts.core
+        n_findex = flow_field.n_findex
+        coordinates = np.repeat(farm.coordinates[None, :, :], n_layouts * n_findex, axis=0)
+        coordinates[:, :, 0] = np.repeat(layouts_x, n_findex, axis=0)
+        coordinates[:, :, 1] = np.repeat(layouts_y, n_findex, axis=0)
+        core.set_turbine_coordinates(coordinates)
+
+        fmodel_layouts.run()
+        return fmodel_layouts._get_turbine_powers()
+
+
+    ### Methods for profiling the calculations
+
+    def set_profiling(self, enabled: bool = True, track_memory: bool = False) -> None:
+        """
+        Enable or disable the recording of the wall time, and optionally the allocated array
+        memory, of the stages of the calculations: the construction of the Core in set(),
+        the initialization of the domain, each phase of the wake solver per turbine, the
+        finalization and the power evaluation. Profiling is disabled by default. Enabling
+        it starts a new, empty profile.
+
+        Args:
+            enabled (bool, optional): Whether to record the stages. Defaults to True.
+            track_memory (bool, optional): If True, also record the peak array memory
+                allocated in each stage with tracemalloc. This slows the calculations
+                considerably. Defaults to False.
+        """
+        self._profile = Profile(track_memory=track_memory) if enabled else None
+
+    def get_profile(self) -> pd.DataFrame:
+        """
+        Report the stages recorded since profiling was enabled.
+
+        Returns:
+            pd.DataFrame: One row per stage with its category, number of calls, total, mean
+            and maximum wall time (s) and the largest peak of array memory allocated in a
+            single call (bytes); see :py:meth:`floris.profiler.Profile.report`.
+        """
+        if self._profile is None:
+            raise RuntimeError(
+                "Profiling is not enabled. Call `FlorisModel.set_profiling()` first."
+            )
+        return self._profile.report()
+
+    def write_profile_trace(self, filename: str | Path) -> None:
+        """
+        Write the stages recorded since profiling was enabled to a JSON file in the Chrome
+        trace event format, which can be viewed with chrome://tracing or
+        https://ui.perfetto.dev.
 
-        # Finalize values to user-supplied order
-        self.core.finalize()
+        Args:
+            filename (str | Path): The output file.
+        """
+        if self._profile is None:
+            raise RuntimeError(
+                "Profiling is not enabled. Call `FlorisModel.set_profiling()` first."
+            )
+        self._profile.write_chrome_trace(filename)
 
 
     ### Methods for extracting turbine performance after running
@@ -531,22 +718,25 @@ class FlorisModel(LoggingManager):
         if (self.core.flow_field.u < 0.0).any():
             self.logger.warning("Some velocities at the rotor are negative.")
 
-        turbine_powers = power(
-            velocities=self.core.flow_field.u,
-            turbulence_intensities=self.core.flow_field.turbulence_intensity_field[:,:,None,None],
-            air_density=self.core.flow_field.air_density,
-            power_functions=self.core.farm.turbine_power_functions,
-            yaw_angles=self.core.farm.yaw_angles,
-            tilt_angles=self.core.farm.tilt_angles,
-            power_setpoints=self.core.farm.power_setpoints,
-            awc_modes = self.core.farm.awc_modes,
-            awc_amplitudes=self.core.farm.awc_amplitudes,
-            tilt_interps=self.core.farm.turbine_tilt_interps,
-            turbine_type_map=self.core.farm.turbine_type_map,
-            turbine_power_thrust_tables=self.core.farm.turbine_power_thrust_tables,
-            correct_cp_ct_for_tilt=self.core.farm.correct_cp_ct_for_tilt,
-            multidim_condition=self.core.flow_field.multidim_conditions,
-        )
+        with profiler.recording(self._profile), profiler.stage("FlorisModel.power", "floris_model"):
+            turbine_powers = power(
+                velocities=self.core.flow_field.u,
+                turbulence_intensities=(
+                    self.core.flow_field.turbulence_intensity_field[:, :, None, None]
+                ),
+                air_density=self.core.flow_field.air_density,
+                power_functions=self.core.farm.turbine_power_functions,
+                yaw_angles=self.core.farm.yaw_angles,
+                tilt_angles=self.core.farm.tilt_angles,
+                power_setpoints=self.core.farm.power_setpoints,
+                awc_modes = self.core.farm.awc_modes,
+                awc_amplitudes=self.core.farm.awc_amplitudes,
+                tilt_interps=self.core.farm.turbine_tilt_interps,
+                turbine_type_map=self.core.farm.turbine_type_map,
+                turbine_power_thrust_tables=self.core.farm.turbine_power_thrust_tables,
+                correct_cp_ct_for_tilt=self.core.farm.correct_cp_ct_for_tilt,
+                multidim_condition=self.core.flow_field.multidim_conditions,
+            )
         return turbine_powers
 
 
@@ -756,6 +946,60 @@ class FlorisModel(LoggingManager):
 
         return farm_power
 
+    def _get_expected_value(
+        self,
+        turbine_powers,
+        freq=None,
+        values=None,
+        use_value=False,
+    ):
+        """
+        Weigh turbine powers with the frequencies, and optionally the values, of the
+        conditions and sum them over the conditions and the turbines. This is the weighting
+        of :py:meth:`get_expected_farm_power` and :py:meth:`get_expected_farm_value`, for
+        turbine powers that may also come from several layouts, as those of
+        :py:meth:`run_layouts`.
+
+        Args:
+            turbine_powers (NDArrayFloat): Turbine powers with shape
+                (..., n_findex, n_turbines), with any turbine weights already applied.
+            freq (NDArrayFloat, optional): Frequencies of the conditions, with shape
+                (n_findex) or (n_findex, n_turbines). Defaults to None, in which case the
+                frequencies of the WindData object are used if one was supplied, and
+                uniform frequencies otherwise.
+            values (NDArrayFloat, optional): Values of the power in each condition, with
+                shape (n_findex). Only used if use_value is True. Defaults to None, in which
+                case the values of the WindData object are used if one was supplied, and a
+                value of 1 otherwise.
+            use_value (bool, optional): Whether to weigh the power with the values.
+                Defaults to False.
+
+        Returns:
+            NDArrayFloat: The expected power, or value, with shape
+            turbine_powers.shape[:-2].
+        """
+        if freq is None:
+            if self.wind_data is None:
+                freq = np.array([1.0/self.core.flow_field.n_findex])
+            else:
+                freq = self.wind_data.unpack_freq()
+
+        # If freq is 1d, it weighs the farm power, and otherwise the power of each turbine
+        if len(np.shape(freq)) == 1:
+            farm_power = np.multiply(freq, np.sum(turbine_powers, axis=-1))
+        else:
+            farm_power = np.nansum(np.multiply(freq, turbine_powers), axis=-1)
+
+        if use_value:
+            if values is None:
+                if self.wind_data is None:
+                    values = np.array([1.0])
+                else:
+                    values = self.wind_data.unpack_value()
+            farm_power = np.multiply(values, farm_power)
+
+        return np.nansum(farm_power, axis=-1)
+
     def get_expected_farm_power(
             self,
             freq=None,
@@ -788,27 +1032,16 @@ class FlorisModel(LoggingManager):
                 n_turbines). Defaults to None.
         """
 
-        if freq is None:
-            if self.wind_data is None:
-                freq = np.array([1.0/self.core.flow_field.n_findex])
-            else:
-                freq = self.wind_data.unpack_freq()
-
-        # If freq is 1d
-        if len(np.shape(freq)) == 1:
-            farm_power = self._get_farm_power(turbine_weights=turbine_weights)
-            return np.nansum(np.multiply(freq, farm_power))
-        else:
-            weighted_turbine_powers = self._get_weighted_turbine_powers(
-                turbine_weights=turbine_weights,
-            )
-            return np.nansum(np.multiply(freq, weighted_turbine_powers))
+        weighted_turbine_powers = self._get_weighted_turbine_powers(
+            turbine_weights=turbine_weights,
+        )
+        return self._get_expected_value(weighted_turbine_powers, freq=freq)
 
     def get_farm_AEP(
         self,
         freq=None,
         turbine_weights=None,
-        hours_per_year=8760,
+        hours_per_year=HOURS_PER_YEAR,
     ) -> float:
         """
         Estimate annual energy production (AEP) for distributions of wind speed, wind
@@ -901,33 +1134,22 @@ class FlorisModel(LoggingManager):
             float:
                 The expected value produced by the wind farm in units of value.
         """
-        if freq is None:
-            if self.wind_data is None:
-                freq = np.array([1.0/self.core.flow_field.n_findex])
-            else:
-                freq = self.wind_data.unpack_freq()
-        # If freq is 1d
-        if len(np.shape(freq)) == 1:
-            farm_power = self._get_farm_power(turbine_weights=turbine_weights)
-            farm_power = np.multiply(freq, farm_power)
-        else:
-            weighted_turbine_powers = self._get_weighted_turbine_powers(
-                turbine_weights=turbine_weights
-            )
-            farm_power = np.nansum(np.multiply(freq, weighted_turbine_powers), axis=1)
-        if values is None:
-            if self.wind_data is None:
-                values = np.array([1.0])
-            else:
-                values = self.wind_data.unpack_value()
-        return np.nansum(np.multiply(values, farm_power))
+        weighted_turbine_powers = self._get_weighted_turbine_powers(
+            turbine_weights=turbine_weights
+        )
+        return self._get_expected_value(
+            weighted_turbine_powers,
+            freq=freq,
+            values=values,
+            use_value=True,
+        )
 
     def get_farm_AVP(
         self,
         freq=None,
         values=None,
         turbine_weights=None,
-        hours_per_year=8760,
+        hours_per_year=HOURS_PER_YEAR,
     ) -> float:
         """
         Estimate annual value production (AVP) for distribution of wind
@@ -1042,22 +1264,25 @@ class FlorisModel(LoggingManager):
 
     ### Methods for sampling and visualization
 
-    def set_for_viz(self, findex: int, solver_settings: dict) -> None:
+    def set_for_viz(self, findex: int | NDArrayInt, solver_settings: dict) -> None:
         """
-        Set the floris object to a single findex for visualization.
+        Set the floris object to a single findex, or a subset of findices, for visualization.
 
         Args:
-            findex (int): The findex to set the floris object to.
+            findex (int | NDArrayInt): The findex, or array of findices, to set the floris
+                object to.
             solver_settings (dict): The solver settings to use for visualization.
         """
+        findices = np.atleast_1d(findex)
 
         # If not None, set the heterogeneous inflow configuration
         if self.core.flow_field.heterogeneous_inflow_config is not None:
             heterogeneous_inflow_config = {
                 'x': self.core.flow_field.heterogeneous_inflow_config['x'],
                 'y': self.core.flow_field.heterogeneous_inflow_config['y'],
-                'speed_multipliers':
-                    self.core.flow_field.heterogeneous_inflow_config['speed_multipliers'][findex:findex+1],
+                'speed_multipliers': np.asarray(
+                    self.core.flow_field.heterogeneous_inflow_config['speed_multipliers']
+                )[findices],
             }
             if 'z' in self.core.flow_field.heterogeneous_inflow_config:
                 heterogeneous_inflow_config['z'] = (
@@ -1066,18 +1291,25 @@ class FlorisModel(LoggingManager):
         else:
             heterogeneous_inflow_config = None
 
+        # Keep the wake source terms from the last run so the full flow solvers can reuse them
+        wake_source_terms = self.core.get_wake_source_terms()
+
         self.set(
-            wind_speeds=self.wind_speeds[findex:findex+1],
-            wind_directions=self.wind_directions[findex:findex+1],
-            turbulence_intensities=self.turbulence_intensities[findex:findex+1],
-            yaw_angles=self.core.farm.yaw_angles[findex:findex+1,:],
-            power_setpoints=self.core.farm.power_setpoints[findex:findex+1,:],
-            awc_modes=self.core.farm.awc_modes[findex:findex+1,:],
-            awc_amplitudes=self.core.farm.awc_amplitudes[findex:findex+1,:],
+            wind_speeds=self.wind_speeds[findices],
+            wind_directions=self.wind_directions[findices],
+            turbulence_intensities=self.turbulence_intensities[findices],
+            yaw_angles=self.core.farm.yaw_angles[findices,:],
+            power_setpoints=self.core.farm.power_setpoints[findices,:],
+            awc_modes=self.core.farm.awc_modes[findices,:],
+            awc_amplitudes=self.core.farm.awc_amplitudes[findices,:],
+            awc_frequencies=self.core.farm.awc_frequencies[findices,:],
             heterogeneous_inflow_config = heterogeneous_inflow_config,
             solver_settings=solver_settings,
         )
 
+        if wake_source_terms is not None:
+            self.core.wake_source_terms = wake_source_terms.select(findices)
+
     def calculate_cross_plane(
         self,
         downstream_dist,
@@ -1130,16 +1362,8 @@ class FlorisModel(LoggingManager):
         # Calculate wake
         fmodel_viz.core.solve_for_viz()
 
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest dependency is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="x",
-            planar_coordinate=downstream_dist,
-        )
-
         # Compute the cutplane
-        cross_plane = CutPlane(df, y_resolution, z_resolution, "x")
+        cross_plane = fmodel_viz._get_cut_plane(normal_vector="x")
 
         return cross_plane
 
@@ -1196,21 +1420,8 @@ class FlorisModel(LoggingManager):
         # Calculate wake
         fmodel_viz.core.solve_for_viz()
 
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest depenedcy is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="z",
-            planar_coordinate=height,
-        )
-
         # Compute the cutplane
-        horizontal_plane = CutPlane(
-            df,
-            fmodel_viz.core.grid.grid_resolution[0],
-            fmodel_viz.core.grid.grid_resolution[1],
-            "z",
-        )
+        horizontal_plane = fmodel_viz._get_cut_plane(normal_vector="z")
 
         return horizontal_plane
 
@@ -1268,23 +1479,277 @@ class FlorisModel(LoggingManager):
         # Calculate wake
         fmodel_viz.core.solve_for_viz()
 
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest depenedcy is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="y",
-            planar_coordinate=crossstream_dist,
-        )
-
         # Compute the cutplane
-        y_plane = CutPlane(df, x_resolution, z_resolution, "y")
+        y_plane = fmodel_viz._get_cut_plane(normal_vector="y")
 
         return y_plane
 
+    def calculate_horizontal_planes(
+        self,
+        heights,
+        findices=None,
+        x_resolution=200,
+        y_resolution=200,
+        x_bounds=None,
+        y_bounds=None,
+        max_memory_mb=32.0,
+    ):
+        """
+        Calculate horizontal planes at several heights for several findices in a single
+        solve, rather than one :py:meth:`calculate_horizontal_plane` call for each.
+        All planes share the same bounds in the frame aligned with the wind direction.
+
+        Args:
+            heights (float | list): Heights of the cut planes.
+            findices (int | list, optional): Indices of the conditions to visualize.
+                Defaults to None, which uses all findices.
+            x_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            y_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            x_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None, which covers the turbines for all findices.
+            y_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None, which covers the turbines for all findices.
+            max_memory_mb (float, optional): Approximate memory budget, in MB, for each
+                solve. The findices are split into as few solves as fit within the budget.
+                The default is kept small since the solver is limited by memory bandwidth
+                for large arrays. Defaults to 32 MB. If None, all findices are solved
+                together.
+
+        Returns:
+            list[list[:py:class:`~.tools.cut_plane.CutPlane`]]: The planes for each findex
+            (outer list) and each height (inner list).
+        """
+        return self._calculate_planes(
+            "z",
+            heights,
+            findices,
+            (x_resolution, y_resolution),
+            (x_bounds, y_bounds),
+            max_memory_mb,
+        )
+
+    def calculate_cross_planes(
+        self,
+        downstream_dists,
+        findices=None,
+        y_resolution=200,
+        z_resolution=200,
+        y_bounds=None,
+        z_bounds=None,
+        max_memory_mb=32.0,
+    ):
+        """
+        Calculate cross planes at several downstream distances for several findices in a
+        single solve, rather than one :py:meth:`calculate_cross_plane` call for each.
+
+        Args:
+            downstream_dists (float | list): Distances downstream of turbines to compute.
+            findices (int | list, optional): Indices of the conditions to visualize.
+                Defaults to None, which uses all findices.
+            y_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            z_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            y_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None, which covers the turbines for all findices.
+            z_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None.
+            max_memory_mb (float, optional): Approximate memory budget, in MB, for each
+                solve. Defaults to 32 MB. If None, all findices are solved together.
+
+        Returns:
+            list[list[:py:class:`~.tools.cut_plane.CutPlane`]]: The planes for each findex
+            (outer list) and each downstream distance (inner list).
+        """
+        return self._calculate_planes(
+            "x",
+            downstream_dists,
+            findices,
+            (y_resolution, z_resolution),
+            (y_bounds, z_bounds),
+            max_memory_mb,
+        )
+
+    def calculate_y_planes(
+        self,
+        crossstream_dists,
+        findices=None,
+        x_resolution=200,
+        z_resolution=200,
+        x_bounds=None,
+        z_bounds=None,
+        max_memory_mb=32.0,
+    ):
+        """
+        Calculate y planes at several cross-stream distances for several findices in a
+        single solve, rather than one :py:meth:`calculate_y_plane` call for each.
+
+        Args:
+            crossstream_dists (float | list): Cross-stream distances of the cut planes.
+            findices (int | list, optional): Indices of the conditions to visualize.
+                Defaults to None, which uses all findices.
+            x_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            z_resolution (float, optional): Output array resolution.
+                Defaults to 200 points.
+            x_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None, which covers the turbines for all findices.
+            z_bounds (tuple, optional): Limits of output array (in m).
+                Defaults to None.
+            max_memory_mb (float, optional): Approximate memory budget, in MB, for each
+                solve. Defaults to 32 MB. If None, all findices are solved together.
+
+        Returns:
+            list[list[:py:class:`~.tools.cut_plane.CutPlane`]]: The planes for each findex
+            (outer list) and each cross-stream distance (inner list).
+        """
+        return self._calculate_planes(
+            "y",
+            crossstream_dists,
+            findices,
+            (x_resolution, z_resolution),
+            (x_bounds, z_bounds),
+            max_memory_mb,
+        )
+
+    def _calculate_planes(
+        self,
+        normal_vector,
+        planar_coordinates,
+        findices,
+        resolution,
+        bounds,
+        max_memory_mb,
+    ):
+        """
+        Solve a :py:class:`~.core.grid.FlowFieldPlanarGrid` containing several planes for
+        several findices at once, splitting the findices into chunks to bound the memory.
+        See :py:meth:`calculate_horizontal_planes` for the arguments.
+        """
+        if findices is None:
+            findices = np.arange(self.n_findex)
+        findices = np.atleast_1d(findices).astype(int)
+        planar_coordinates = np.atleast_1d(np.array(planar_coordinates, dtype=float))
+
+        # Fix the bounds for all findices so that every chunk uses the same grid
+        x1_bounds, x2_bounds = bounds
+        if x1_bounds is None or x2_bounds is None:
+            bounds_grid = FlowFieldPlanarGrid(
+                turbine_coordinates=self.core.farm.coordinates,
+                turbine_diameters=self.core.farm.rotor_diameters,
+                wind_directions=self.wind_directions[findices],
+                normal_vector=normal_vector,
+                planar_coordinate=planar_coordinates[0],
+                grid_resolution=[2, 2],
+                x1_bounds=x1_bounds,
+                x2_bounds=x2_bounds,
+            )
+            x1_bounds, x2_bounds = bounds_grid.x1_bounds, bounds_grid.x2_bounds
+
+        solver_settings = {
+            "type": "flow_field_planar_grid",
+            "normal_vector": normal_vector,
+            "planar_coordinate": planar_coordinates[0],
+            "flow_field_grid_points": list(resolution),
+            "flow_field_bounds": [x1_bounds, x2_bounds],
+        }
+
+        if max_memory_mb is None:
+            chunk_size = len(findices)
+        else:
+            # Each plane of the horizontal grid is solved at three heights
+            n_levels = 3 if normal_vector == "z" else 1
+            n_points = resolution[0] * resolution[1] * n_levels
+            chunk_size = max(self._points_chunk_size(max_memory_mb, n_findex=1) // n_points, 1)
+
+        # Extract the wake source terms from the last run once, rather than in every copy
+        self.core.get_wake_source_terms()
+
+        planes = []
+        for start in range(0, len(findices), chunk_size):
+            fmodel_viz = copy.deepcopy(self)
+            fmodel_viz.set_for_viz(findices[start:start + chunk_size], solver_settings)
+            chunk_planes = [[] for _ in range(fmodel_viz.n_findex)]
+
+            # The findices are solved together, but each plane is solved on its own grid
+            # since the transverse velocities depend on the mean inflow over the grid
+            for planar_coordinate in planar_coordinates:
+                fmodel_viz.core.grid = attrs.evolve(
+                    fmodel_viz.core.grid,
+                    planar_coordinate=planar_coordinate,
+                )
+                fmodel_viz.core.solve_for_viz()
+
+                for i in range(fmodel_viz.n_findex):
+                    chunk_planes[i].append(
+                        fmodel_viz._get_cut_plane(normal_vector=normal_vector, findex=i)
+                    )
+            planes.extend(chunk_planes)
+
+        return planes
+
+    def _get_cut_plane(self, normal_vector="z", findex=0):
+        """
+        Get a :py:class:`~.tools.cut_plane.CutPlane` from a model solved on a
+        :py:class:`~.core.grid.FlowFieldPlanarGrid`, keeping the structured grid of the
+        solve rather than going through :py:meth:`get_plane_of_points`.
+
+        Args:
+            normal_vector (string, optional): Vector normal to plane.
+                Defaults to z.
+            findex (int, optional): Index of the condition to extract. Defaults to 0.
+
+        Returns:
+            :py:class:`~.tools.cut_plane.CutPlane`: containing values of x1, x2, x3, u, v, w
+        """
+        grid = self.core.grid
+        flow_field = self.core.flow_field
+
+        # The grid in the rotated frame may be shared by all findices
+        grid_findex = findex if grid.x_sorted.shape[0] > 1 else 0
+
+        # Index the plane in the (n_findex, x, y, z) arrays, taking the middle of the three
+        # heights of the horizontal grid, and order the coordinates as (x1, x2, x3)
+        if normal_vector == "z":
+            plane = (slice(None), slice(None), 1)
+            coordinates = (
+                grid.x_sorted_inertial_frame[findex],
+                grid.y_sorted_inertial_frame[findex],
+                grid.z_sorted_inertial_frame[findex],
+            )
+        elif normal_vector == "x":
+            plane = (0, slice(None), slice(None))
+            coordinates = (
+                grid.y_sorted[grid_findex],
+                grid.z_sorted[grid_findex],
+                grid.x_sorted[grid_findex],
+            )
+        elif normal_vector == "y":
+            plane = (slice(None), 0, slice(None))
+            coordinates = (
+                grid.x_sorted[grid_findex],
+                grid.z_sorted[grid_findex],
+                grid.y_sorted[grid_findex],
+            )
+        else:
+            raise ValueError(f"normal_vector must be x, y, or z, but {normal_vector} was given.")
+
+        # Transpose to (x2, x1) so that the rows are ordered as in get_plane_of_points
+        x1, x2, x3 = (c[plane].T.copy() for c in coordinates)
+        u, v, w = (
+            f[findex][plane].T.copy()
+            for f in (flow_field.u_sorted, flow_field.v_sorted, flow_field.w_sorted)
+        )
+
+        return CutPlane.from_arrays(x1, x2, x3, u, v, w, normal_vector)
+
     def get_plane_of_points(
         self,
         normal_vector="z",
         planar_coordinate=None,
+        findex=0,
     ):
         """
         Calculates velocity values through the
@@ -1296,22 +1761,25 @@ class FlorisModel(LoggingManager):
                 Defaults to z.
             planar_coordinate (float, optional): Value of normal vector
                 to slice through. Defaults to None.
+            findex (int, optional): Index of the condition to extract. Defaults to 0.
 
         Returns:
             :py:class:`pandas.DataFrame`: containing values of x1, x2, x3, u, v, w
         """
         # Get results vectors
         if normal_vector == "z":
-            x_flat = self.core.grid.x_sorted_inertial_frame[0].flatten()
-            y_flat = self.core.grid.y_sorted_inertial_frame[0].flatten()
-            z_flat = self.core.grid.z_sorted_inertial_frame[0].flatten()
+            x_flat = self.core.grid.x_sorted_inertial_frame[findex].flatten()
+            y_flat = self.core.grid.y_sorted_inertial_frame[findex].flatten()
+            z_flat = self.core.grid.z_sorted_inertial_frame[findex].flatten()
         else:
-            x_flat = self.core.grid.x_sorted[0].flatten()
-            y_flat = self.core.grid.y_sorted[0].flatten()
-            z_flat = self.core.grid.z_sorted[0].flatten()
-        u_flat = self.core.flow_field.u_sorted[0].flatten()
-        v_flat = self.core.flow_field.v_sorted[0].flatten()
-        w_flat = self.core.flow_field.w_sorted[0].flatten()
+            # The grid in the rotated frame may be shared by all findices
+            grid_findex = findex if self.core.grid.x_sorted.shape[0] > 1 else 0
+            x_flat = self.core.grid.x_sorted[grid_findex].flatten()
+            y_flat = self.core.grid.y_sorted[grid_findex].flatten()
+            z_flat = self.core.grid.z_sorted[grid_findex].flatten()
+        u_flat = self.core.flow_field.u_sorted[findex].flatten()
+        v_flat = self.core.flow_field.v_sorted[findex].flatten()
+        w_flat = self.core.flow_field.w_sorted[findex].flatten()
 
         # Create a df of these
         if normal_vector == "z":
@@ -1362,25 +1830,77 @@ class FlorisModel(LoggingManager):
 
         return df
 
-    def sample_flow_at_points(self, x: NDArrayFloat, y: NDArrayFloat, z: NDArrayFloat):
+    def sample_flow_at_points(
+        self,
+        x: NDArrayFloat,
+        y: NDArrayFloat,
+        z: NDArrayFloat,
+        chunk_size: int | None = None,
+        max_memory_mb: float | None = None,
+        return_components: bool = False,
+    ):
         """
         Extract the wind speed at points in the flow.
 
+        For large numbers of points, the points can be evaluated in blocks to bound the
+        memory used by the full flow solver. The block size is given directly with
+        ``chunk_size`` or derived from a memory budget with ``max_memory_mb``.
+
         Args:
             x (1DArrayFloat | list): x-locations of points where flow is desired.
             y (1DArrayFloat | list): y-locations of points where flow is desired.
             z (1DArrayFloat | list): z-locations of points where flow is desired.
+            chunk_size (int, optional): Maximum number of points to evaluate at once.
+                Defaults to None, in which case all points are evaluated together unless
+                max_memory_mb is given.
+            max_memory_mb (float, optional): Approximate memory budget, in MB, for the
+                evaluation of each block of points. Ignored if chunk_size is given.
+                Defaults to None.
+            return_components (bool, optional): If True, also return the v and w velocity
+                components. Defaults to False.
 
         Returns:
-            3DArrayFloat containing wind speed with dimensions
-            (# of findex, # of sample points)
+            2DArrayFloat containing wind speed with dimensions
+            (# of findex, # of sample points). If return_components is True, a tuple of
+            the u, v, and w components, each with these dimensions.
         """
 
         # Check that x, y, z are all the same length
         if not len(x) == len(y) == len(z):
             raise ValueError("x, y, and z must be the same size")
 
-        return self.core.solve_for_points(x, y, z)
+        if chunk_size is None and max_memory_mb is not None:
+            chunk_size = self._points_chunk_size(max_memory_mb)
+
+        return self.core.solve_for_points(
+            x,
+            y,
+            z,
+            chunk_size=chunk_size,
+            return_components=return_components,
+        )
+
+    def _points_chunk_size(self, max_memory_mb: float, n_findex: int | None = None) -> int:
+        """
+        Estimate the number of points that can be evaluated at once by the full flow
+        solver within a memory budget.
+
+        Args:
+            max_memory_mb (float): The memory budget in MB.
+            n_findex (int, optional): The number of findices solved together. Defaults to
+                None, which uses the number of findices in the model.
+
+        Returns:
+            int: The number of points per block, at least 1.
+        """
+        if max_memory_mb <= 0:
+            raise ValueError("max_memory_mb must be positive.")
+        if n_findex is None:
+            n_findex = self.core.flow_field.n_findex
+        bytes_per_point = (
+            POINTS_WORKING_ARRAYS * np.dtype(floris_float_type).itemsize * n_findex
+        )
+        return max(int(max_memory_mb * 1e6 // bytes_per_point), 1)
 
     def sample_velocity_deficit_profiles(
         self,
@@ -1546,7 +2066,7 @@ class FlorisModel(LoggingManager):
         if isinstance(operation_model, str):
             if len(self.core.farm.turbine_type) == 1:
                 # Set a single one here, then, and return
-                turbine_type = self.core.farm.turbine_definitions[0]
+                turbine_type = copy.deepcopy(self.core.farm.turbine_definitions[0])
                 turbine_type["operation_model"] = operation_model
                 self.set(
                     turbine_type=[turbine_type],
@@ -1562,7 +2082,7 @@ class FlorisModel(LoggingManager):
                     "equal to the number of turbines."
                 )
 
-        turbine_type_list = self.core.farm.turbine_definitions
+        turbine_type_list = copy.deepcopy(self.core.farm.turbine_definitions)
 
         for tindex in range(self.core.farm.n_turbines):
             turbine_type_list[tindex]["turbine_type"] = (
@@ -1576,8 +2096,105 @@ class FlorisModel(LoggingManager):
         )
 
     def copy(self):
-        """Create an independent copy of the current FlorisModel object"""
-        return FlorisModel(self.core.as_dict())
+        """
+        Create an independent copy of the current FlorisModel object, with the same inputs
+        but with the operation setpoints at their defaults and without the wind_data, as
+        FlorisModel(self.core.as_dict()). The read-only turbine models are shared with this
+        object rather than loaded and built again; see Core.copy().
+        """
+        fmodel_copy = FlorisModel.__new__(FlorisModel)
+        fmodel_copy.configuration = self.configuration
+        fmodel_copy.core = self.core.copy()
+        fmodel_copy._wind_data = None
+        return fmodel_copy
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copy the FlorisModel, including its operation, wind_data and solution, but
+        share the read-only turbine models with the original; see Farm.shared_turbine_data().
+        """
+        memo.update(self.core.farm.shared_turbine_data())
+        fmodel_copy = type(self).__new__(type(self))
+        memo[id(self)] = fmodel_copy
+        for name, value in self.__dict__.items():
+            setattr(fmodel_copy, name, copy.deepcopy(value, memo))
+        return fmodel_copy
+
+    def __getstate__(self):
+        """
+        Compact state for pickling, for example to send the model to worker processes. The
+        Core is reduced to its configuration dictionary, without the wind conditions, and a
+        digest of it, plus contiguous arrays of the wind conditions, the operation setpoints
+        and, if the model has been run, the solved flow field at the turbines. The grids,
+        the turbine models and all other derived arrays are built again on unpickling. With
+        pickle protocol 5 the arrays can be sent out-of-band.
+        """
+        state = self.__dict__.copy()
+        state["core"] = self._get_core_state()
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        core_state = state.pop("core")
+        self.__dict__.update(state)
+        self.core = _core_from_state(core_state)
+
+    def _get_core_state(
+        self,
+        findex: NDArrayInt | None = None,
+        include_solution: bool = True,
+    ) -> dict:
+        """
+        Get the compact state of the Core used by __getstate__.
+
+        Args:
+            findex (NDArrayInt, optional): Indices of the findices to include. Defaults to
+                None, in which case all findices are included.
+            include_solution (bool, optional): If True and the model has been run, include
+                the solved flow field at the turbines. Defaults to True.
+
+        Returns:
+            dict: The state, which _core_from_state() turns back into a Core.
+        """
+        if findex is None:
+            findex = slice(None)
+
+        configuration = self.core.as_dict()
+        flow_field = {
+            key: np.ascontiguousarray(np.asarray(configuration["flow_field"].pop(key))[findex])
+            for key in CONDITION_KEYS
+        }
+        # Heterogeneous inflow has speed multipliers for each findex
+        heterogeneous_inflow_config = configuration["flow_field"].pop(
+            "heterogeneous_inflow_config", None
+        )
+        if heterogeneous_inflow_config is not None:
+            flow_field["heterogeneous_inflow_config"] = {
+                **heterogeneous_inflow_config,
+                "speed_multipliers": np.ascontiguousarray(
+                    np.asarray(heterogeneous_inflow_config["speed_multipliers"])[findex]
+                ),
+            }
+        # Setpoints at their defaults are set again on unpickling and are not included
+        setpoints = {}
+        for key, default in SETPOINT_DEFAULTS.items():
+            value = getattr(self.core.farm, key)[findex]
+            if not (value == default).all():
+                setpoints[key] = np.ascontiguousarray(value)
+        solution = None
+        if include_solution and self.core.state is State.USED:
+            solution = {
+                key: np.ascontiguousarray(getattr(self.core.flow_field, key)[findex])
+                for key in SOLUTION_KEYS
+            }
+
+        return {
+            "configuration": configuration,
+            "digest": hashlib.sha1(pickle.dumps(configuration, protocol=5)).hexdigest(),
+            "flow_field": flow_field,
+            "setpoints": setpoints,
+            "solution": solution,
+        }
 
     def get_param(
         self,
@@ -1844,3 +2461,50 @@ class FlorisModel(LoggingManager):
         )
 
         return fmodel_merged
+
+
+def _core_from_state(core_state: dict) -> Core:
+    """
+    Build a Core from the compact state given by FlorisModel._get_core_state(). The turbine
+    models are shared with a template Core, which is built once per configuration digest
+    in each process.
+
+    Args:
+        core_state (dict): The compact state.
+
+    Returns:
+        Core: The Core, solved if the state holds a solution.
+    """
+    flow_field = core_state["flow_field"]
+    template = _core_templates.get(core_state["digest"])
+    if template is None:
+        # The template only holds the first findex to keep it small
+        configuration = copy.deepcopy(core_state["configuration"])
+        configuration["flow_field"].update({key: flow_field[key][:1] for key in CONDITION_KEYS})
+        template = Core.from_dict(configuration)
+        if len(_core_templates) >= CORE_TEMPLATE_CACHE_SIZE:
+            _core_templates.pop(next(iter(_core_templates)))
+        _core_templates[core_state["digest"]] = template
+
+    core = template.copy(flow_field=flow_field)
+    setpoints = core_state["setpoints"]
+    if "yaw_angles" in setpoints:
+        core.farm.set_yaw_angles(setpoints["yaw_angles"])
+    if "power_setpoints" in setpoints:
+        core.farm.set_power_setpoints(setpoints["power_setpoints"])
+    if "awc_modes" in setpoints:
+        core.farm.set_awc_modes(setpoints["awc_modes"])
+    if "awc_amplitudes" in setpoints:
+        core.farm.set_awc_amplitudes(setpoints["awc_amplitudes"])
+    if "awc_frequencies" in setpoints:
+        core.farm.set_awc_frequencies(setpoints["awc_frequencies"])
+
+    # The solver only changes the flow field, so the remaining solved quantities are
+    # recovered by initializing and finalizing the domain
+    if core_state["solution"] is not None:
+        core.initialize_domain()
+        core.finalize()
+        for key, value in core_state["solution"].items():
+            setattr(core.flow_field, key, value)
+
+    return core
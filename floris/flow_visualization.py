@@ -418,17 +418,17 @@ def calculate_horizontal_plane_with_turbines(
     x_bounds=None,
     y_bounds=None,
     findex_for_viz=None,
+    chunk_size=1000,
 ) -> CutPlane:
         """
         This function creates a :py:class:`~.tools.cut_plane.CutPlane` by
         adding an additional turbine to the farm and moving it through every
         a regular grid throughout the flow field. This method allows for
         visualizing wake models that do not support the FullFlowGrid and
-        its associated solver. As the new turbine is moved around the flow
-        field, the velocities at its rotor are stored in local variables,
-        and the flow field is reset to its initial state for every new
-        location. Then, the local velocities are put into a DataFrame and
-        then into a CutPlane. This method is much slower than
+        its associated solver. Each location of the new turbine is solved
+        as a separate condition, so that many locations are calculated
+        together in one solve, and the velocities at its rotor are put into
+        a CutPlane. This method is slower than
         `FlorisModel.calculate_horizontal_plane`, but it is helpful
         for models where the visualization capability is not yet available.
 
@@ -440,6 +440,8 @@ def calculate_horizontal_plane_with_turbines(
             x_bounds (tuple, optional): Limits of output array (in m). Defaults to None.
             y_bounds (tuple, optional): Limits of output array (in m). Defaults to None.
             findex_for_viz (int, optional): Index of the condition to visualize.
+            chunk_size (int, optional): Number of locations of the new turbine that are
+                solved together. Smaller values reduce the memory use. Defaults to 1000.
 
         Returns:
             :py:class:`~.tools.cut_plane.CutPlane`: containing values of x, y, u, v, w
@@ -512,64 +514,79 @@ def calculate_horizontal_plane_with_turbines(
         if y_bounds is None:
             y_bounds = (np.min(layout_y) - 2 * D, np.max(layout_y) + 2 * D)
 
-        # Now generate a list of points
+        # Now generate a list of points, with x varying fastest
         x_points = np.linspace(x_bounds[0], x_bounds[1], x_resolution)
         y_points = np.linspace(y_bounds[0], y_bounds[1], y_resolution)
-        num_points = len(x_points) * len(y_points)
+        x_mesh, y_mesh = np.meshgrid(x_points, y_points)
+        x_results = x_mesh.flatten()
+        y_results = y_mesh.flatten()
+        num_points = len(x_results)
+
+        # Add the test turbine to the farm. It is moved to each point below.
+        layout_x_test[-1] = x_results[0]
+        layout_y_test[-1] = y_results[0]
+        fmodel_viz.set(
+            layout_x=layout_x_test,
+            layout_y=layout_y_test,
+            yaw_angles=yaw_angles,
+            power_setpoints=power_setpoints,
+            awc_modes=awc_modes,
+            awc_amplitudes=awc_amplitudes,
+            awc_frequencies=awc_frequencies,
+            turbine_type=turbine_types_test,
+            reference_wind_height=fmodel_viz.reference_wind_height
+        )
 
-        # Now loop over the points
-        x_results = np.zeros(num_points)
-        y_results = np.zeros(num_points)
-        z_results = np.zeros(num_points)
+        # Each location of the test turbine is solved as a separate condition, so that
+        # chunk_size locations are calculated together in one solve
         u_results = np.zeros(num_points)
-        v_results = np.zeros(num_points)
-        w_results = np.zeros(num_points)
-        idx = 0
-        for y in y_points:
-            for x in x_points:
-
-                # Save the x and y results
-                x_results[idx] = x
-                y_results[idx] = y
-
-                # Place the test turbine at this location and calculate wake
-                layout_x_test[-1] = x
-                layout_y_test[-1] = y
-                fmodel_viz.set(
-                    layout_x=layout_x_test,
-                    layout_y=layout_y_test,
-                    yaw_angles=yaw_angles,
-                    power_setpoints=power_setpoints,
-                    awc_modes=awc_modes,
-                    awc_amplitudes=awc_amplitudes,
-                    awc_frequencies=awc_frequencies,
-                    turbine_type=turbine_types_test,
-                    reference_wind_height=fmodel_viz.reference_wind_height
-                )
-                fmodel_viz.run()
-
-                # Get the velocity of that test turbines central point
-                center_point = int(np.floor(fmodel_viz.core.flow_field.u[0,-1].shape[0] / 2.0))
-                u_results[idx] = fmodel_viz.core.flow_field.u[0,-1,center_point,center_point]
-
-                # Increment index
-                idx = idx + 1
-
-        # Make a dataframe
-        df = pd.DataFrame({
-            'x1':x_results,
-            'x2':y_results,
-            'x3':z_results,
-            'u':u_results,
-            'v':v_results,
-            'w':w_results,
-        })
+        for start in range(0, num_points, chunk_size):
+            stop = min(start + chunk_size, num_points)
+            fmodel_chunk = copy.deepcopy(fmodel_viz)
+            fmodel_chunk.set_for_viz(np.zeros(stop - start, dtype=int), None)
+            _run_with_test_turbine(fmodel_chunk, x_results[start:stop], y_results[start:stop])
+
+            # Get the velocity of that test turbines central point
+            u = fmodel_chunk.core.flow_field.u
+            center_point = int(np.floor(u.shape[2] / 2.0))
+            u_results[start:stop] = u[:, -1, center_point, center_point]
 
         # Convert to a cut_plane
-        horizontal_plane = CutPlane(df, x_resolution, y_resolution, "z")
+        shape = (y_resolution, x_resolution)
+        zeros = np.zeros(shape)
+        horizontal_plane = CutPlane.from_arrays(
+            x_mesh,
+            y_mesh,
+            zeros,
+            u_results.reshape(shape),
+            zeros,
+            zeros,
+            "z",
+        )
 
         return horizontal_plane
 
+def _run_with_test_turbine(fmodel, x, y):
+    """
+    Run a model in which the last turbine is a test turbine located at (x[i], y[i]) for
+    condition i. The grid is rebuilt with turbine coordinates that vary with the condition,
+    so that the turbines are sorted separately for each location of the test turbine.
+
+    Args:
+        fmodel (:py:class:`floris.floris_model.FlorisModel`): Model with one condition for
+            each location of the test turbine.
+        x (NDArrayFloat): x-coordinates of the test turbine for each condition.
+        y (NDArrayFloat): y-coordinates of the test turbine for each condition.
+    """
+    core = fmodel.core
+    coordinates = np.repeat(core.farm.coordinates[None, :, :], len(x), axis=0)
+    coordinates[:, -1, 0] = x
+    coordinates[:, -1, 1] = y
+
+    core.set_turbine_coordinates(coordinates)
+    core.initialize_domain()
+    core.steady_state_atmospheric_condition()
+
 @define
 class VelocityProfilesFigure():
     """
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import matplotlib.cm as cm
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
 import scipy.spatial._qhull
@@ -13,6 +13,10 @@ from floris.logging_manager import LoggingManager
 from floris.type_dec import NDArrayFloat
 
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
 class HeterogeneousMap(LoggingManager):
     """
     Class for handling heterogeneous inflow configurations when defined by wind direction
@@ -299,6 +303,7 @@ class HeterogeneousMap(LoggingManager):
             ax (matplotlib.axes.Axes, optional): The axes on which to plot the boundary.
                 If None, a new figure and axes will be created.
         """
+        import matplotlib.pyplot as plt
 
         # If not provided create the axis
         if ax is None:
@@ -368,7 +373,7 @@ class HeterogeneousMap(LoggingManager):
         ax: plt.Axes = None,
         vmin: float = None,
         vmax: float = None,
-        cmap: cm = cm.viridis,
+        cmap: str = "viridis",
         show_boundary: bool = True,
         show_wind_direction: bool = True,
         show_colorbar: bool = True,
@@ -388,8 +393,8 @@ class HeterogeneousMap(LoggingManager):
                 value of the speed multipliers.
             vmax (float, optional): The maximum value for the colorbar. Default is the maximum
                 value of the speed multipliers.
-            cmap (matplotlib.colors.Colormap, optional): The colormap to use for the heatmap.
-                Default is matplotlib.cm.viridis.
+            cmap (str | matplotlib.colors.Colormap, optional): The colormap to use for the
+                heatmap. Default is "viridis".
             show_boundary (bool, optional): Whether to show the boundary of the heterogeneous
                 inflow configuration. Default is True.
             show_wind_direction (bool, optional): Whether to show the wind direction as an arrow.
@@ -401,6 +406,7 @@ class HeterogeneousMap(LoggingManager):
         Returns:
             matplotlib.axes.Axes: The axes on which the speed multipliers are plotted.
         """
+        import matplotlib.pyplot as plt
 
         # Confirm wind_direction and wind_speed are floats
         if not isinstance(wind_direction, float):
@@ -0,0 +1,283 @@
+"""
+Geometric constraints shared by the layout optimizers: turbines inside the boundary polygon
+and a minimum spacing between turbines. Boundary checks are evaluated for all turbines at
+once on prepared shapely geometries, spacing checks use a KD-tree, and the constraints used
+by the gradient-based optimizers are aggregated with the Kreisselmeier-Steinhauser (KS)
+function and provided with their analytic Jacobians.
+"""
+
+import numpy as np
+import shapely
+from scipy.spatial import cKDTree
+
+
+def prepare_boundary(boundary_polygon):
+    """
+    Prepare a shapely geometry in place so that repeated point-in-polygon checks
+    against it are fast.
+
+    Args:
+        boundary_polygon (shapely.Geometry): The boundary polygon (or multipolygon).
+
+    Returns:
+        shapely.Geometry: The same, now prepared, geometry.
+    """
+    shapely.prepare(boundary_polygon)
+    return boundary_polygon
+
+
+def points_in_bounds(x, y, boundary_polygon, include_boundary=False):
+    """
+    Check which points lie inside the boundary polygon.
+
+    Args:
+        x (iterable): x-coordinates of the points (m).
+        y (iterable): y-coordinates of the points (m).
+        boundary_polygon (shapely.Geometry): The boundary polygon (or multipolygon).
+        include_boundary (bool, optional): If True, points on the boundary itself are
+            also considered in bounds. Defaults to False.
+
+    Returns:
+        np.ndarray: Boolean array with the shape of x, True for points in bounds.
+    """
+    if include_boundary:
+        return shapely.intersects_xy(boundary_polygon, x, y)
+    return shapely.contains_xy(boundary_polygon, x, y)
+
+
+def distance_from_boundaries(x, y, boundary_polygon, boundary_line=None, jacobian=False):
+    """
+    Signed distance of each point from the boundary, positive for points inside the
+    boundary polygon and negative for points outside of it.
+
+    Args:
+        x (iterable): x-coordinates of the points (m).
+        y (iterable): y-coordinates of the points (m).
+        boundary_polygon (shapely.Geometry): The boundary polygon (or multipolygon).
+        boundary_line (shapely.Geometry, optional): The boundary of boundary_polygon.
+            Computed if not provided. Defaults to None.
+        jacobian (bool, optional): If True, also return the derivatives of the signed
+            distance of each point with respect to its own x- and y-coordinate.
+            Defaults to False.
+
+    Returns:
+        np.ndarray | tuple: The signed distances (m) and, if jacobian is True, their
+        derivatives as an array of shape (n_points, 2).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if boundary_line is None:
+        boundary_line = boundary_polygon.boundary
+
+    points = shapely.points(x, y)
+    distances = shapely.distance(points, boundary_line)
+    sign = np.where(shapely.contains_xy(boundary_polygon, x, y), 1.0, -1.0)
+    signed_distances = sign * distances
+    if not jacobian:
+        return signed_distances
+
+    # The distance grows along the direction from the nearest boundary point to the point
+    nearest = shapely.get_coordinates(shapely.shortest_line(points, boundary_line))[1::2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        directions = (np.column_stack([x, y]) - nearest) / distances[:, None]
+    directions[distances == 0.0] = 0.0
+    return signed_distances, sign[:, None] * directions
+
+
+def ks_aggregate(g, rho=500, jacobian=False):
+    """
+    Aggregate constraint values into a single smooth constraint with the
+    Kreisselmeier-Steinhauser (KS) function, following OpenMDAO's KSComp. The aggregate
+    is a conservative estimate of the maximum of g, so the constraints are satisfied
+    when the aggregate is at most 0.
+
+    Args:
+        g (iterable): Constraint values.
+        rho (float, optional): Aggregation factor; larger values follow the maximum more
+            closely. Defaults to 500.
+        jacobian (bool, optional): If True, also return the derivatives of the aggregate
+            with respect to g. Defaults to False.
+
+    Returns:
+        float | tuple: The aggregated constraint and, if jacobian is True, its
+        derivatives with respect to g.
+    """
+    g = np.asarray(g, dtype=float)
+    g_max = np.max(g)
+    exponents = np.exp(rho * (g - g_max))
+    summation = np.sum(exponents)
+    ks = g_max + 1.0 / rho * np.log(summation)
+    if not jacobian:
+        return ks
+    return ks, exponents / summation
+
+
+def nearest_turbine_distances(x, y):
+    """
+    Distance from each turbine to its nearest neighbor, found with a KD-tree.
+
+    Args:
+        x (iterable): x-coordinates of the turbines (m).
+        y (iterable): y-coordinates of the turbines (m).
+
+    Returns:
+        tuple: The distances (m) and the indices of the nearest neighbors.
+    """
+    xy = np.column_stack([x, y]).astype(float)
+    distances, indices = cKDTree(xy).query(xy, k=2)
+
+    # Coincident turbines may be returned in either order
+    nearest = np.where(indices[:, 0] == np.arange(len(xy)), indices[:, 1], indices[:, 0])
+    return distances[:, 1], nearest
+
+
+def min_dist_satisfied(x, y, min_dist):
+    """
+    Check that no two turbines are closer than min_dist.
+
+    Args:
+        x (iterable): x-coordinates of the turbines (m).
+        y (iterable): y-coordinates of the turbines (m).
+        min_dist (float): Minimum distance between turbines (m).
+
+    Returns:
+        bool: True if all turbines are at least min_dist apart.
+    """
+    if len(x) < 2:
+        return True
+    return nearest_turbine_distances(x, y)[0].min() >= min_dist
+
+
+def space_constraint(x, y, min_dist, rho=500, jacobian=False):
+    """
+    KS-aggregated spacing constraint, 1 - d / min_dist, of the distances d from each
+    turbine to its nearest neighbor. The constraint is satisfied when it is at most 0.
+
+    Args:
+        x (iterable): x-coordinates of the turbines (m).
+        y (iterable): y-coordinates of the turbines (m).
+        min_dist (float): Minimum distance between turbines (m).
+        rho (float, optional): KS aggregation factor. Defaults to 500.
+        jacobian (bool, optional): If True, also return the derivatives of the constraint
+            with respect to the x-coordinates followed by the y-coordinates of the
+            turbines. Defaults to False.
+
+    Returns:
+        float | tuple: The aggregated constraint and, if jacobian is True, its
+        derivatives as an array of length 2 * n_turbines.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    distances, nearest = nearest_turbine_distances(x, y)
+    g = 1 - distances / min_dist
+    if not jacobian:
+        return ks_aggregate(g, rho)
+
+    ks, dks_dg = ks_aggregate(g, rho, jacobian=True)
+
+    # Each g depends on the positions of the turbine and its nearest neighbor
+    n_turbines = len(x)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dg_dx = -(x - x[nearest]) / (distances * min_dist)
+        dg_dy = -(y - y[nearest]) / (distances * min_dist)
+    dg_dx[distances == 0.0] = 0.0
+    dg_dy[distances == 0.0] = 0.0
+    dks = np.zeros(2 * n_turbines)
+    turbines = np.arange(n_turbines)
+    np.add.at(dks, turbines, dks_dg * dg_dx)
+    np.add.at(dks, nearest, -dks_dg * dg_dx)
+    np.add.at(dks, n_turbines + turbines, dks_dg * dg_dy)
+    np.add.at(dks, n_turbines + nearest, -dks_dg * dg_dy)
+    return ks, dks
+
+
+class SpacingTree:
+    """
+    KD-tree of the turbine positions to check the minimum spacing when turbines move one at
+    a time. A check costs a tree query, O(log N), plus a comparison against the turbines
+    that moved since the tree was last built. The tree is rebuilt once that number of moved
+    turbines exceeds rebuild_interval, so that the cost of the rebuilds is spread over many
+    moves.
+
+    Args:
+        x (iterable): x-coordinates of the turbines (m).
+        y (iterable): y-coordinates of the turbines (m).
+        min_dist (float): Minimum distance between turbines (m).
+        rebuild_interval (int, optional): Number of moved turbines after which the tree is
+            rebuilt. Defaults to None, in which case sqrt(N) is used.
+    """
+    def __init__(self, x, y, min_dist, rebuild_interval=None):
+        self.xy = np.column_stack([x, y]).astype(float)
+        self.min_dist = min_dist
+        self.n_turbines = len(self.xy)
+        if rebuild_interval is None:
+            rebuild_interval = int(np.ceil(np.sqrt(self.n_turbines)))
+        self.rebuild_interval = rebuild_interval
+        self._build()
+
+        # Count the pairs that violate the minimum spacing so that moves can be checked
+        # against the whole layout
+        self.n_violations = sum(
+            self._count_close_turbines(i, self.xy[i]) for i in range(self.n_turbines)
+        ) // 2
+
+    def _build(self):
+        self._tree = cKDTree(self.xy)
+        self._moved = np.zeros(self.n_turbines, dtype=bool)
+
+    def _close_turbines(self, turbine, xy):
+        # Turbines in the tree that have not moved since it was built
+        candidates = np.array(self._tree.query_ball_point(xy, self.min_dist), dtype=int)
+        candidates = candidates[~self._moved[candidates]]
+
+        # Turbines that moved since the tree was built
+        candidates = np.concatenate([candidates, np.flatnonzero(self._moved)])
+        candidates = candidates[candidates != turbine]
+        distances = np.linalg.norm(self.xy[candidates] - xy, axis=1)
+        return candidates[distances < self.min_dist]
+
+    def _count_close_turbines(self, turbine, xy):
+        return len(self._close_turbines(turbine, np.asarray(xy, dtype=float)))
+
+    def is_satisfied(self):
+        """
+        Returns:
+            bool: True if all turbines are at least min_dist apart.
+        """
+        return self.n_violations == 0
+
+    def test_move(self, turbine, x, y):
+        """
+        Check whether the layout satisfies the minimum spacing after moving a turbine.
+
+        Args:
+            turbine (int): Index of the turbine to move.
+            x (float): New x-coordinate of the turbine (m).
+            y (float): New y-coordinate of the turbine (m).
+
+        Returns:
+            bool: True if all turbines are at least min_dist apart after the move.
+        """
+        return self._n_violations_after_move(turbine, x, y) == 0
+
+    def _n_violations_after_move(self, turbine, x, y):
+        return (
+            self.n_violations
+            - self._count_close_turbines(turbine, self.xy[turbine])
+            + self._count_close_turbines(turbine, (x, y))
+        )
+
+    def move(self, turbine, x, y):
+        """
+        Move a turbine to a new position.
+
+        Args:
+            turbine (int): Index of the turbine to move.
+            x (float): New x-coordinate of the turbine (m).
+            y (float): New y-coordinate of the turbine (m).
+        """
+        self.n_violations = self._n_violations_after_move(turbine, x, y)
+        self.xy[turbine] = (x, y)
+        self._moved[turbine] = True
+        if np.sum(self._moved) > self.rebuild_interval:
+            self._build()
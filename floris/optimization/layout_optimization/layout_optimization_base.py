@@ -10,6 +10,7 @@ from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
 from floris.wind_data import WindDataBase
 
 from ...logging_manager import LoggingManager
+from .layout_constraints import prepare_boundary
 
 
 class LayoutOptimization(LoggingManager):
@@ -65,6 +66,7 @@ class LayoutOptimization(LoggingManager):
             self._boundary_line = self._boundary_polygon.boundary
         else:
             raise TypeError(boundary_specification_error_msg)
+        prepare_boundary(self._boundary_polygon)
 
         self.xmin, self.ymin, self.xmax, self.ymax = self._boundary_polygon.bounds
 
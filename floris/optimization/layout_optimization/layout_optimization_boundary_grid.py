@@ -1,6 +1,11 @@
 
+import hashlib
+import itertools
+import os
+
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from scipy.spatial.distance import cdist
 from shapely.geometry import (
     LineString,
@@ -8,7 +13,49 @@ from shapely.geometry import (
     Polygon,
 )
 
+from .layout_constraints import (
+    ks_aggregate,
+    min_dist_satisfied,
+    nearest_turbine_distances,
+    points_in_bounds,
+    prepare_boundary,
+)
 from .layout_optimization_base import LayoutOptimization
+from .layout_optimization_random_search import _get_objectives, _load_local_floris_object
+
+
+# Parameters of boundary_grid() that search_parameters() can vary
+SEARCH_PARAMETERS = [
+    "start",
+    "x_spacing",
+    "y_spacing",
+    "shear",
+    "rotation",
+    "center_x",
+    "center_y",
+    "boundary_setback",
+    "n_boundary_turbines",
+    "boundary_spacing",
+]
+
+
+def _layout_key(layout_x, layout_y, decimals=3):
+    # Layouts that agree to the given number of decimals (m) share a key; adding 0.0
+    # maps -0.0 to 0.0 so that both give the same bytes
+    xy = np.round(np.column_stack([layout_x, layout_y]), decimals) + 0.0
+    return hashlib.sha1(xy.tobytes()).hexdigest()
+
+
+def _evaluate_layouts(fmodel_dict, wind_data, keys, layouts_x, layouts_y, use_value):
+    fmodel = _load_local_floris_object(fmodel_dict, wind_data)
+
+    # The layouts of a batch share a number of turbines, which may differ from the model's
+    fmodel.set(layout_x=layouts_x[0], layout_y=layouts_y[0])
+    return keys, _get_objectives(layouts_x, layouts_y, fmodel, use_value=use_value)
+
+
+def _unpack_evaluate_layouts(args):
+    return _evaluate_layouts(*args)
 
 
 class LayoutOptimizationBoundaryGrid(LayoutOptimization):
@@ -148,14 +195,9 @@ class LayoutOptimizationBoundaryGrid(LayoutOptimization):
             poly = Polygon(boundary)
 
         # get rid of points outside of boundary
-        index = 0
-        for i in range(len(grid_x)):
-            point = Point(grid_x[index], grid_y[index])
-            if poly.contains(point) is False and poly.touches(point) is False:
-                grid_x = np.delete(grid_x, index)
-                grid_y = np.delete(grid_y, index)
-            else:
-                index += 1
+        mask_in_bounds = points_in_bounds(grid_x, grid_y, poly, include_boundary=True)
+        grid_x = grid_x[mask_in_bounds]
+        grid_y = grid_y[mask_in_bounds]
 
         return grid_x, grid_y
 
@@ -220,11 +262,12 @@ class LayoutOptimizationBoundaryGrid(LayoutOptimization):
         rotate_y = (rotate_y - np.mean(rotate_y)) + center_y
 
         # get rid of points outside of boundary polygon
-        meets_constraints = np.zeros(len(rotate_x),dtype=bool)
-        for i in range(len(rotate_x)):
-            pt = Point(rotate_x[i],rotate_y[i])
-            if shrunk_poly.contains(pt) or shrunk_poly.touches(pt):
-                meets_constraints[i] = True
+        meets_constraints = points_in_bounds(
+            rotate_x,
+            rotate_y,
+            prepare_boundary(shrunk_poly),
+            include_boundary=True,
+        )
 
         # arrange final x,y points
         return_x = rotate_x[meets_constraints]
@@ -612,7 +655,167 @@ class LayoutOptimizationBoundaryGrid(LayoutOptimization):
             self.boundary_spacing,
         )
 
-        self.fmodel.set(layout=(layout_x, layout_y))
+        self.fmodel.set(layout_x=layout_x, layout_y=layout_y)
+
+    def search_parameters(
+        self,
+        parameter_values,
+        n_turbines=None,
+        min_dist=None,
+        use_value=False,
+        interface="multiprocessing",
+        max_workers=None,
+        layouts_per_task=16,
+        checkpoint_file=None,
+    ):
+        """
+        Search the grid parameters for the layout with the highest AEP (or AVP) by
+        evaluating every combination of the given parameter values. Parameters that are not
+        given keep their current values.
+
+        Combinations that generate the same layout are evaluated once. The layouts are
+        evaluated in batches with FlorisModel.run_layouts(), grouped by number of
+        turbines, and the batches are spread over parallel workers. If a checkpoint_file is
+        given, the objective of each evaluated layout is appended to it as soon as its batch
+        completes, and the layouts already in the file are not evaluated again, so that an
+        interrupted search resumes where it stopped.
+
+        Once done, the parameters of the best layout are set with reinitialize_bg() and the
+        layout of the FLORIS model is set with reinitialize_xy().
+
+        Args:
+            parameter_values (dict): Values to search for each parameter, keyed by the
+                parameter names of boundary_grid(), for example
+                {"x_spacing": [500.0, 600.0], "rotation": [0.0, 0.2, 0.4]}.
+            n_turbines (int, optional): If given, only layouts with this number of
+                turbines are feasible. Defaults to None.
+            min_dist (float, optional): If given, only layouts with all turbines at least
+                min_dist apart are feasible (m). Defaults to None.
+            use_value (bool, optional): If True, maximize the annual value production
+                using the value array of the wind data of the FLORIS model, rather than the
+                AEP. Defaults to False.
+            interface (str, optional): Either 'multiprocessing' to evaluate batches in a
+                process pool or None to evaluate them serially. Defaults to
+                'multiprocessing'.
+            max_workers (int, optional): Number of parallel workers. Defaults to None,
+                which uses all available cores.
+            layouts_per_task (int, optional): Maximum number of layouts evaluated in each
+                batch. Defaults to 16.
+            checkpoint_file (str, optional): Path to a CSV file that stores the objective
+                of each evaluated layout. Defaults to None.
+
+        Returns:
+            pd.DataFrame: One row per parameter combination with the parameter values, the
+            number of turbines, whether the layout is feasible and its objective, which is
+            NaN for infeasible layouts.
+        """
+        unknown = set(parameter_values) - set(SEARCH_PARAMETERS)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters {sorted(unknown)}. "
+                f"Parameters that can be searched are {SEARCH_PARAMETERS}."
+            )
+        if interface not in ["multiprocessing", None]:
+            raise ValueError(
+                f"Interface '{interface}' not recognized. "
+                "Please use 'multiprocessing' or None."
+            )
+
+        # Generate the layout of every combination of parameter values
+        names = list(parameter_values)
+        rows = []
+        layouts = {}
+        for values in itertools.product(*[parameter_values[name] for name in names]):
+            parameters = {name: getattr(self, name) for name in SEARCH_PARAMETERS}
+            parameters.update(zip(names, values))
+            layout_x, layout_y = self.boundary_grid(**parameters)
+            feasible = len(layout_x) > 0
+            if n_turbines is not None:
+                feasible = feasible and len(layout_x) == n_turbines
+            if min_dist is not None:
+                feasible = feasible and min_dist_satisfied(layout_x, layout_y, min_dist)
+            key = _layout_key(layout_x, layout_y)
+            if feasible:
+                layouts[key] = (layout_x, layout_y)
+            rows.append(
+                {
+                    **parameters,
+                    "n_turbines": len(layout_x),
+                    "feasible": feasible,
+                    "layout_key": key,
+                }
+            )
+
+        # Read the objectives of the layouts evaluated in an earlier search
+        objectives = {}
+        if checkpoint_file is not None and os.path.exists(checkpoint_file):
+            df_checkpoint = pd.read_csv(checkpoint_file)
+            objectives.update(zip(df_checkpoint["layout_key"], df_checkpoint["objective"]))
+        keys = [key for key in layouts if key not in objectives]
+        self.logger.info(
+            f"Evaluating {len(keys)} layouts for {len(rows)} parameter combinations "
+            f"({len(layouts) - len(keys)} feasible layouts read from the checkpoint)."
+        )
+
+        # Batch layouts with the same number of turbines
+        tasks = []
+        fmodel_dict = self.fmodel.core.as_dict()
+        for n in np.unique([len(layouts[key][0]) for key in keys]):
+            keys_n = [key for key in keys if len(layouts[key][0]) == n]
+            for i in range(0, len(keys_n), layouts_per_task):
+                keys_task = keys_n[i:i + layouts_per_task]
+                tasks.append(
+                    (
+                        fmodel_dict,
+                        self.fmodel.wind_data,
+                        keys_task,
+                        np.array([layouts[key][0] for key in keys_task]),
+                        np.array([layouts[key][1] for key in keys_task]),
+                        use_value,
+                    )
+                )
+
+        def record(keys_task, objectives_task):
+            objectives.update(zip(keys_task, objectives_task))
+            if checkpoint_file is not None:
+                pd.DataFrame({"layout_key": keys_task, "objective": objectives_task}).to_csv(
+                    checkpoint_file,
+                    mode="a",
+                    header=not os.path.exists(checkpoint_file),
+                    index=False,
+                )
+
+        if interface == "multiprocessing" and len(tasks) > 1:
+            import multiprocessing as mp
+
+            if max_workers is None:
+                max_workers = mp.cpu_count()
+            with mp.Pool(max_workers) as p:
+                for keys_task, objectives_task in p.imap_unordered(
+                    _unpack_evaluate_layouts, tasks
+                ):
+                    record(keys_task, objectives_task)
+        else:
+            for task in tasks:
+                record(*_evaluate_layouts(*task))
+        self.n_layouts_evaluated = len(keys)
+
+        df_search = pd.DataFrame(rows)
+        df_search["objective"] = [
+            objectives[key] if feasible else np.nan
+            for key, feasible in zip(df_search["layout_key"], df_search["feasible"])
+        ]
+        df_search = df_search.drop(columns="layout_key")
+
+        # Apply the best parameters
+        if df_search["feasible"].any():
+            best = df_search.loc[df_search["objective"].idxmax()]
+            self.reinitialize_bg(**{name: best[name] for name in names})
+            self.reinitialize_xy()
+        else:
+            self.logger.warning("No feasible layout found; the parameters are not changed.")
+
+        return df_search
 
     def plot_layout(self):
         plt.figure(figsize=(9, 6))
@@ -628,21 +831,8 @@ class LayoutOptimizationBoundaryGrid(LayoutOptimization):
         plt.tick_params(which="both", labelsize=fontsize)
 
     def space_constraint(self, x, y, min_dist, rho=500):
-        # Calculate distances between turbines
-        locs = np.vstack((x, y)).T
-        distances = cdist(locs, locs)
-        arange = np.arange(distances.shape[0])
-        distances[arange, arange] = 1e10
-        dist = np.min(distances, axis=0)
-
-        g = 1 - np.array(dist) / min_dist
-
-        # Following code copied from OpenMDAO KSComp().
-        # Constraint is satisfied when KS_constraint <= 0
-        g_max = np.max(np.atleast_2d(g), axis=-1)[:, np.newaxis]
-        g_diff = g - g_max
-        exponents = np.exp(rho * g_diff)
-        summation = np.sum(exponents, axis=-1)[:, np.newaxis]
-        KS_constraint = g_max + 1.0 / rho * np.log(summation)
-
-        return KS_constraint[0][0], dist
+        # Constraint is satisfied when the KS aggregate is <= 0
+        dist, _ = nearest_turbine_distances(x, y)
+        KS_constraint = ks_aggregate(1 - dist / min_dist, rho=rho)
+
+        return KS_constraint, dist
@@ -1,9 +1,8 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial.distance import cdist
-from shapely.geometry import Point
 
+from . import layout_constraints
 from .layout_optimization_base import LayoutOptimization, list_depth
 
 
@@ -190,34 +189,17 @@ class LayoutOptimizationPyOptSparse(LayoutOptimization):
         return funcs
 
     def space_constraint(self, x, y, rho=500):
-        # Calculate distances between turbines
-        locs = np.vstack((x, y)).T
-        distances = cdist(locs, locs)
-        arange = np.arange(distances.shape[0])
-        distances[arange, arange] = 1e10
-        dist = np.min(distances, axis=0)
-
-        g = 1 - np.array(dist) / self.min_dist
-
-        # Following code copied from OpenMDAO KSComp().
-        # Constraint is satisfied when KS_constraint <= 0
-        g_max = np.max(np.atleast_2d(g), axis=-1)[:, np.newaxis]
-        g_diff = g - g_max
-        exponents = np.exp(rho * g_diff)
-        summation = np.sum(exponents, axis=-1)[:, np.newaxis]
-        KS_constraint = g_max + 1.0 / rho * np.log(summation)
-
-        return KS_constraint[0][0]
+        # Constraint is satisfied when the KS aggregate is <= 0
+        return layout_constraints.space_constraint(x, y, self.min_dist, rho=rho)
 
     def distance_from_boundaries(self, x, y):
-        boundary_con = np.zeros(self.nturbs)
-        for i in range(self.nturbs):
-            loc = Point(x[i], y[i])
-            boundary_con[i] = loc.distance(self._boundary_line)
-            if self._boundary_polygon.contains(loc) is True:
-                boundary_con[i] *= -1.0
-
-        return boundary_con
+        # Constraint is satisfied when the distance is <= 0, i.e. inside the boundary
+        return -1 * layout_constraints.distance_from_boundaries(
+            x,
+            y,
+            self._boundary_polygon,
+            self._boundary_line,
+        )
 
     def _get_initial_and_final_locs(self):
         x_initial = self._unnorm(self.x0, self.xmin, self.xmax)
@@ -13,19 +13,28 @@
 # See https://floris.readthedocs.io for documentation
 
 
+import copy
 from multiprocessing import Pool
 from time import perf_counter as timerpc
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial.distance import cdist, pdist
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Polygon
 
-from floris import FlorisModel
+from floris import FlorisModel, WindRoseWRG
+from floris.core import power
+from floris.core.rotor_velocity import average_velocity
+from floris.floris_model import HOURS_PER_YEAR
 from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
     YawOptimizationGeometric,
 )
 
+from .layout_constraints import (
+    min_dist_satisfied,
+    points_in_bounds,
+    prepare_boundary,
+    SpacingTree,
+)
 from .layout_optimization_base import LayoutOptimization
 
 
@@ -39,12 +48,10 @@ def _load_local_floris_object(
     return fmodel
 
 def test_min_dist(layout_x, layout_y, min_dist):
-    coords = np.array([layout_x,layout_y]).T
-    dist = pdist(coords)
-    return dist.min() >= min_dist
+    return min_dist_satisfied(layout_x, layout_y, min_dist)
 
 def test_point_in_bounds(test_x, test_y, poly_outer):
-    return poly_outer.contains(Point(test_x, test_y))
+    return bool(points_in_bounds(test_x, test_y, poly_outer))
 
 # Return in MW
 def _get_objective(
@@ -63,6 +70,260 @@ def _get_objective(
 
     return fmodel.get_farm_AVP() if use_value else fmodel.get_farm_AEP()
 
+def _get_objectives(
+        layouts_x,
+        layouts_y,
+        fmodel,
+        yaw_angles=None,
+        use_value=False
+):
+    # The frequencies of a WindRoseWRG depend on the layout, so evaluate layouts one by one
+    if isinstance(fmodel.wind_data, WindRoseWRG):
+        return np.array(
+            [
+                _get_objective(layout_x, layout_y, fmodel, yaw_angles, use_value)
+                for layout_x, layout_y in zip(layouts_x, layouts_y)
+            ]
+        )
+
+    # Evaluate all layouts in one batched run, weighted as in get_farm_AEP and get_farm_AVP
+    n_layouts = len(layouts_x)
+    if yaw_angles is not None:
+        yaw_angles = np.repeat(np.array(yaw_angles)[None, :, :], n_layouts, axis=0)
+    turbine_powers = fmodel.run_layouts(layouts_x, layouts_y, yaw_angles=yaw_angles)
+    return fmodel._get_expected_value(turbine_powers, use_value=use_value) * HOURS_PER_YEAR
+
+class _IncrementalObjective:
+    """
+    Estimates the objective of layouts that differ from the current layout by the position
+    of a single turbine. The rotor-averaged velocity deficit that each turbine causes at each
+    other turbine is cached for every condition, with each pair solved in isolation from the
+    rest of the farm and with the turbine types and hub heights of its source and target.
+    When a turbine moves, only the deficits it causes and those it experiences are solved
+    again, which are 2 (N - 1) two-turbine solves rather than a solve of all N turbines. The
+    turbine velocities then follow from combining the cached deficits with the combination
+    model of the wake model, and the turbine powers from the turbine power curves.
+
+    As the turbines upstream of each source are ignored when solving the pairs, the estimate
+    differs from the full solve of the layout. It is meant to screen candidate moves, which
+    are confirmed with a full solve.
+    """
+    def __init__(self, fmodel, layout_x, layout_y, yaw_angles=None, use_value=False):
+        self.fmodel = fmodel
+        flow_field = fmodel.core.flow_field
+        self.n_findex = flow_field.n_findex
+        self.n_turbines = len(layout_x)
+        self.use_value = use_value
+
+        # Models of two turbines, a source and a target, with a condition for each of the
+        # pairs of a moved turbine with the other turbines. A model is built for each
+        # combination of the turbine types of the source and the target when first needed.
+        self._n_pairs = 2 * (self.n_turbines - 1)
+        self._fmodels_pairs = {}
+        farm = fmodel.core.farm
+        self._turbine_definitions = farm.turbine_definitions
+        self._turbine_types = np.array(
+            [definition["turbine_type"] for definition in farm.turbine_definitions]
+        )
+        self._hub_heights = np.array(farm.coordinates[:, 2], dtype=float)
+
+        # Solve the model once to get the free stream velocities of the turbines
+        fmodel.set(layout_x=layout_x, layout_y=layout_y, yaw_angles=yaw_angles)
+        fmodel.run()
+        self._free_stream_velocities = average_velocity(
+            np.take_along_axis(
+                fmodel.core.flow_field.u_initial_sorted,
+                fmodel.core.grid.unsorted_indices,
+                axis=1,
+            ),
+            method=fmodel.core.grid.average_method,
+            cubature_weights=fmodel.core.grid.cubature_weights,
+        )
+
+        self.layout_x = np.array(layout_x, dtype=float)
+        self.layout_y = np.array(layout_y, dtype=float)
+        self.yaw_angles = self._unpack_yaw_angles(yaw_angles)
+        self.deficits = np.zeros((self.n_findex, self.n_turbines, self.n_turbines))
+
+        # Solve all pairs
+        sources, targets = np.nonzero(~np.eye(self.n_turbines, dtype=bool))
+        self._update_deficits(
+            self.deficits,
+            sources,
+            targets,
+            self.layout_x,
+            self.layout_y,
+            self.yaw_angles,
+        )
+        self.objective = self._estimate(self.deficits, self.yaw_angles)
+        self._pending = None
+
+    def _unpack_yaw_angles(self, yaw_angles):
+        if yaw_angles is None:
+            return np.zeros((self.n_findex, self.n_turbines))
+        return np.array(yaw_angles, dtype=float)
+
+    def _get_fmodel_pairs(self, source_type, target_type):
+        # Model of the pairs of a source and a target of the given turbine types
+        key = (source_type, target_type)
+        if key not in self._fmodels_pairs:
+            source_definition, target_definition = (
+                self._turbine_definitions[np.flatnonzero(self._turbine_types == t)[0]]
+                for t in key
+            )
+            flow_field = self.fmodel.core.flow_field
+            fmodel_pairs = copy.deepcopy(self.fmodel)
+            fmodel_pairs._wind_data = None # Accessing private attribute!
+            fmodel_pairs.reset_operation()
+            fmodel_pairs.set(
+                layout_x=[0.0, 0.0],
+                layout_y=[0.0, 0.0],
+                turbine_type=[source_definition, target_definition],
+                reference_wind_height=flow_field.reference_wind_height,
+                wind_directions=np.tile(flow_field.wind_directions, self._n_pairs),
+                wind_speeds=np.tile(flow_field.wind_speeds, self._n_pairs),
+                turbulence_intensities=np.tile(
+                    flow_field.turbulence_intensities, self._n_pairs
+                ),
+            )
+            self._fmodels_pairs[key] = fmodel_pairs
+        return self._fmodels_pairs[key]
+
+    def _update_deficits(self, deficits, sources, targets, layout_x, layout_y, yaw_angles):
+        # Solve the pairs of each combination of turbine types, as many at a time as the
+        # model of the pairs holds
+        source_types = self._turbine_types[sources]
+        target_types = self._turbine_types[targets]
+        for source_type, target_type in sorted(set(zip(source_types, target_types))):
+            pairs = np.flatnonzero((source_types == source_type) & (target_types == target_type))
+            fmodel_pairs = self._get_fmodel_pairs(source_type, target_type)
+            for i in range(0, len(pairs), self._n_pairs):
+                ids = np.resize(pairs[i:i + self._n_pairs], self._n_pairs)
+                self._solve_pairs(
+                    fmodel_pairs,
+                    deficits,
+                    sources[ids],
+                    targets[ids],
+                    layout_x,
+                    layout_y,
+                    yaw_angles,
+                )
+
+    def _solve_pairs(
+        self,
+        fmodel_pairs,
+        deficits,
+        sources,
+        targets,
+        layout_x,
+        layout_y,
+        yaw_angles,
+    ):
+        # Solve the pairs of sources and targets and store the deficits
+        coordinates = np.zeros((len(sources), self.n_findex, 2, 3))
+        coordinates[:, :, 0, 0] = layout_x[sources, None]
+        coordinates[:, :, 0, 1] = layout_y[sources, None]
+        coordinates[:, :, 0, 2] = self._hub_heights[sources, None]
+        coordinates[:, :, 1, 0] = layout_x[targets, None]
+        coordinates[:, :, 1, 1] = layout_y[targets, None]
+        coordinates[:, :, 1, 2] = self._hub_heights[targets, None]
+        coordinates = np.reshape(coordinates, (-1, 2, 3))
+
+        yaw_angles_pairs = np.stack([yaw_angles[:, sources].T, yaw_angles[:, targets].T], axis=2)
+
+        core = fmodel_pairs.core
+        core.set_turbine_coordinates(coordinates)
+        core.farm.set_yaw_angles(np.reshape(yaw_angles_pairs, (-1, 2)))
+        core.initialize_domain()
+        core.steady_state_atmospheric_condition()
+
+        velocities = fmodel_pairs.turbine_average_velocities[:, 1]
+        free_stream_velocities = average_velocity(
+            np.take_along_axis(
+                core.flow_field.u_initial_sorted,
+                core.grid.unsorted_indices,
+                axis=1,
+            ),
+            method=core.grid.average_method,
+            cubature_weights=core.grid.cubature_weights,
+        )[:, 1]
+        pair_deficits = np.reshape(
+            1.0 - velocities / free_stream_velocities,
+            (len(sources), self.n_findex),
+        )
+        deficits[:, sources, targets] = pair_deficits.T
+
+    def _estimate(self, deficits, yaw_angles):
+        # Combine the deficits at each turbine, as fractions of the free stream velocity
+        combination = self.fmodel.core.wake.combination_function
+        wake = np.zeros((self.n_findex, self.n_turbines))
+        for source in range(self.n_turbines):
+            wake = combination(wake, deficits[:, source, :])
+        velocities = self._free_stream_velocities * (1.0 - wake)
+
+        farm = self.fmodel.core.farm
+        turbine_powers = power(
+            velocities=velocities[:, :, None, None],
+            turbulence_intensities=(
+                self.fmodel.core.flow_field.turbulence_intensities[:, None, None, None]
+                * np.ones_like(velocities[:, :, None, None])
+            ),
+            air_density=self.fmodel.core.flow_field.air_density,
+            power_functions=farm.turbine_power_functions,
+            yaw_angles=yaw_angles,
+            tilt_angles=farm.tilt_angles,
+            power_setpoints=farm.power_setpoints,
+            awc_modes=farm.awc_modes,
+            awc_amplitudes=farm.awc_amplitudes,
+            tilt_interps=farm.turbine_tilt_interps,
+            turbine_type_map=farm.turbine_type_map,
+            turbine_power_thrust_tables=farm.turbine_power_thrust_tables,
+            correct_cp_ct_for_tilt=farm.correct_cp_ct_for_tilt,
+            multidim_condition=self.fmodel.core.flow_field.multidim_conditions,
+        )
+
+        # Same as FlorisModel.get_farm_AEP() and get_farm_AVP()
+        return (
+            self.fmodel._get_expected_value(turbine_powers, use_value=self.use_value)
+            * HOURS_PER_YEAR
+        )
+
+    def evaluate_move(self, turbine, layout_x, layout_y, yaw_angles=None):
+        """
+        Estimate the objective of the current layout with the given turbine moved to its
+        position in layout_x and layout_y. The move is only stored by accept().
+        """
+        layout_x = np.array(layout_x, dtype=float)
+        layout_y = np.array(layout_y, dtype=float)
+        yaw_angles = self._unpack_yaw_angles(yaw_angles)
+
+        # The deficits of the moved turbine and of turbines with new yaw angles are solved
+        deficits = self.deficits.copy()
+        changed_yaw = np.any(yaw_angles != self.yaw_angles, axis=0)
+        for t in np.union1d([turbine], np.flatnonzero(changed_yaw)):
+            others = np.delete(np.arange(self.n_turbines), t)
+            self._update_deficits(
+                deficits,
+                np.concatenate([np.full_like(others, t), others]),
+                np.concatenate([others, np.full_like(others, t)]),
+                layout_x,
+                layout_y,
+                yaw_angles,
+            )
+
+        objective = self._estimate(deficits, yaw_angles)
+        self._pending = (layout_x, layout_y, yaw_angles, deficits, objective)
+        return objective
+
+    def accept(self):
+        """
+        Make the layout of the last evaluated move the current layout.
+        """
+        self.layout_x, self.layout_y, self.yaw_angles, self.deficits, self.objective = (
+            self._pending
+        )
+        self._pending = None
+
 def _gen_dist_based_init(
     N, # Number of turbins to place
     step_size, #m, courseness of search grid
@@ -81,39 +342,45 @@ def _gen_dist_based_init(
 
     # Set random seed
     np.random.seed(s)
+    prepare_boundary(poly_outer)
 
     # Choose the initial point randomly
     init_x = float(np.random.randint(int(min_x),int(max_x)))
     init_y = float(np.random.randint(int(min_y),int(max_y)))
-    while not (poly_outer.contains(Point([init_x,init_y]))):
+    while not points_in_bounds(init_x, init_y, poly_outer):
         init_x = float(np.random.randint(int(min_x),int(max_x)))
         init_y = float(np.random.randint(int(min_y),int(max_y)))
 
     # Intialize the layout arrays
     layout_x = np.array([init_x])
     layout_y = np.array([init_y])
-    layout = np.array([layout_x, layout_y]).T
+
+    # Candidate points of the search grid that are in bounds, ordered by x then y
+    grid_x, grid_y = np.meshgrid(
+        np.arange(min_x, max_x, step_size),
+        np.arange(min_y, max_y, step_size),
+        indexing="ij",
+    )
+    mask_in_bounds = points_in_bounds(grid_x.flatten(), grid_y.flatten(), poly_outer)
+    grid_x = grid_x.flatten()[mask_in_bounds]
+    grid_y = grid_y.flatten()[mask_in_bounds]
+
+    # Distance from each candidate point to the nearest turbine placed so far
+    min_dist = np.sqrt((grid_x - init_x)**2 + (grid_y - init_y)**2)
 
     # Now add the remaining points
     for i in range(1,N):
 
         print("Placing turbine {0} of {1}.".format(i, N))
         # Add a new turbine being as far as possible from current
-        max_dist = 0.
-        for x in np.arange(min_x, max_x,step_size):
-            for y in np.arange(min_y, max_y,step_size):
-                if poly_outer.contains(Point([x,y])):
-                    test_dist = cdist([[x,y]],layout)
-                    min_dist = np.min(test_dist)
-                    if min_dist > max_dist:
-                        max_dist = min_dist
-                        save_x = x
-                        save_y = y
+        idx = np.argmax(min_dist)
+        save_x = grid_x[idx]
+        save_y = grid_y[idx]
+        min_dist = np.minimum(min_dist, np.sqrt((grid_x - save_x)**2 + (grid_y - save_y)**2))
 
         # Add point to the layout
         layout_x = np.append(layout_x,[save_x])
         layout_y = np.append(layout_y,[save_y])
-        layout = np.array([layout_x, layout_y]).T
 
     # Return the layout
     return layout_x, layout_y
@@ -137,6 +404,10 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         use_dist_based_init=True,
         random_seed=None,
         use_value=False,
+        incremental_evaluation=False,
+        screening_wind_data=None,
+        screening_turbine_grid_points=None,
+        screening_margin=0.0,
     ):
         """
         Optimize layout using genetic random search algorithm. Details of the algorithm can be found
@@ -184,6 +455,27 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                 is to maximize annual value production using the value array in the
                 FLORIS model's WindData object. If False, the optimization
                 objective is to maximize AEP. Defaults to False.
+            incremental_evaluation (bool, optional): If True, each candidate move is
+                first screened with an estimate of the objective built from cached pairwise
+                wake deficits, so that a move only solves the pairs of the moved turbine
+                with the other turbines. Only moves that the estimate finds to improve the
+                objective are confirmed with a full solve of the farm. Not available with
+                heterogeneous inflow or a WindRoseWRG. Defaults to False.
+            screening_wind_data (WindDataBase, optional): Coarser wind data, such as the
+                wind rose of the FLORIS model downsampled with WindRose.downsample(), to
+                screen each candidate move with before it is evaluated on the full wind data.
+                Defaults to None, in which case the full wind data is used for screening if
+                screening_turbine_grid_points is given and no screening is done otherwise.
+            screening_turbine_grid_points (int, optional): Number of rotor grid points in
+                each direction used to screen candidate moves, for example 1 to evaluate
+                each turbine at its hub. Defaults to None, in which case the rotor grid of
+                the FLORIS model is used for screening.
+            screening_margin (float, optional): Fraction of the current objective by which
+                the screened objective of a candidate move may fall short of that of the
+                current layout and still be confirmed at full fidelity. Larger margins
+                confirm more moves and are less likely to discard improvements that the
+                screening misjudges. Applies to both incremental_evaluation and
+                multi-fidelity screening. Defaults to 0.0.
         """
         # The parallel computing interface to use
         if interface == "mpi4py":
@@ -229,7 +521,7 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
 
         # Store the rotor diameter and number of turbines
         self.D = fmodel.core.farm.rotor_diameters.max()
-        if not all(fmodel.core.farm.rotor_diameters == self.D):
+        if not np.all(fmodel.core.farm.rotor_diameters == self.D):
             self.logger.warning("Using largest rotor diameter for min_dist_D and distance_pmf.")
         self.N_turbines = fmodel.n_turbines
 
@@ -255,6 +547,39 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             self._obj_name = "AEP"
             self._obj_unit = "[GWh]"
 
+        # The cached pairwise wake deficits assume that the inflow does not depend on
+        # the turbine positions, and the estimate weights the farm power with frequencies
+        # that do not depend on the layout
+        if incremental_evaluation:
+            if self.fmodel.core.flow_field.heterogeneous_inflow_config is not None:
+                raise ValueError(
+                    "incremental_evaluation is not available with heterogeneous inflow."
+                )
+            if isinstance(self.fmodel.wind_data, WindRoseWRG):
+                raise ValueError("incremental_evaluation is not available with a WindRoseWRG.")
+        self.incremental_evaluation = incremental_evaluation
+
+        # Set up the lower fidelity model used to screen candidate moves
+        if screening_wind_data is not None or screening_turbine_grid_points is not None:
+            if incremental_evaluation:
+                raise ValueError(
+                    "incremental_evaluation cannot be combined with screening_wind_data or "
+                    "screening_turbine_grid_points."
+                )
+            self.screening_fmodel_dict = copy.deepcopy(self.fmodel.core.as_dict())
+            if screening_turbine_grid_points is not None:
+                self.screening_fmodel_dict["solver"]["turbine_grid_points"] = (
+                    screening_turbine_grid_points
+                )
+            if screening_wind_data is None:
+                screening_wind_data = self.fmodel.wind_data
+        else:
+            self.screening_fmodel_dict = None
+        self.screening_wind_data = screening_wind_data
+        if screening_margin < 0.0:
+            raise ValueError("screening_margin must be non-negative.")
+        self.screening_margin = screening_margin
+
         # Save min_dist_D
         self.min_dist_D = self.min_dist / self.D
 
@@ -474,15 +799,14 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             self.x_candidate[i, :] = out[i][0]
             self.y_candidate[i, :] = out[i][1]
 
-        # Get the objective function values for each candidate layout
-        for i in range(self.n_individuals):
-            self.objective_candidate[i] = _get_objective(
-                self.x_candidate[i, :],
-                self.y_candidate[i, :],
-                self.fmodel,
-                self._get_geoyaw_angles(),
-                self.use_value,
-            )
+        # Get the objective function values for all candidate layouts at once
+        self.objective_candidate[:] = _get_objectives(
+            self.x_candidate,
+            self.y_candidate,
+            self.fmodel,
+            self._get_geoyaw_angles(),
+            self.use_value,
+        )
 
         t2 = timerpc()
         print(f"  Time to generate initial layouts: {t2-t1:.3f} s")
@@ -505,6 +829,10 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         self.objective_candidate_log = [self.objective_candidate.copy()]
         self.num_objective_calls_log = []
         self._num_objective_calls = [0]*self.n_individuals
+        self.num_full_objective_calls_log = []
+        self._num_full_objective_calls = [0]*self.n_individuals
+        self.num_accepted_moves_log = []
+        self._num_accepted_moves = [0]*self.n_individuals
 
     def _run_optimization_generation(self):
         """
@@ -538,7 +866,11 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                 self.enable_geometric_yaw,
                 multi_random_seeds[i],
                 self.use_value,
-                self.debug
+                self.debug,
+                self.incremental_evaluation,
+                self.screening_fmodel_dict,
+                self.screening_wind_data,
+                self.screening_margin,
             )
                 for i in range(self.n_individuals)
         ]
@@ -556,8 +888,17 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             self.x_candidate[i, :] = out[i][1]
             self.y_candidate[i, :] = out[i][2]
             self._num_objective_calls[i] = out[i][3]
+            self._num_full_objective_calls[i] = out[i][4]
+            self._num_accepted_moves[i] = out[i][5]
         self.objective_candidate_log.append(self.objective_candidate)
-        self.num_objective_calls_log.append(self._num_objective_calls)
+        self.num_objective_calls_log.append(self._num_objective_calls.copy())
+        self.num_full_objective_calls_log.append(self._num_full_objective_calls.copy())
+        self.num_accepted_moves_log.append(self._num_accepted_moves.copy())
+        self._log_screening_statistics(
+            self._num_objective_calls,
+            self._num_full_objective_calls,
+            self._num_accepted_moves,
+        )
 
         # Evaluate the individuals for this step
         self._evaluate_opt_step()
@@ -572,6 +913,13 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         self.x_opt = self.x_candidate[0, :]
         self.y_opt = self.y_candidate[0, :]
 
+        # Log the screening statistics of the whole optimization
+        self._log_screening_statistics(
+            np.sum(self.num_objective_calls_log),
+            np.sum(self.num_full_objective_calls_log),
+            np.sum(self.num_accepted_moves_log),
+        )
+
         # Print the final result
         increase = 100 * (self.objective_final - self.objective_initial) / self.objective_initial
         print(
@@ -579,6 +927,32 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             f" {self._obj_unit} ({increase:+.2f}%)"
         )
 
+    def _log_screening_statistics(
+        self,
+        num_objective_calls,
+        num_full_objective_calls,
+        num_accepted_moves,
+    ):
+        """
+        Log how many of the screened candidate moves were confirmed at full fidelity and
+        how many of the confirmed moves improved the objective.
+        """
+        if not self.incremental_evaluation and self.screening_fmodel_dict is None:
+            return
+
+        num_objective_calls = np.sum(num_objective_calls)
+        num_full_objective_calls = np.sum(num_full_objective_calls)
+        num_accepted_moves = np.sum(num_accepted_moves)
+        confirmed_rate = 100 * num_full_objective_calls / max(num_objective_calls, 1)
+        hit_rate = 100 * num_accepted_moves / max(num_full_objective_calls, 1)
+        self.logger.info(
+            f"Screening confirmed {num_full_objective_calls} of {num_objective_calls} "
+            f"candidate moves ({confirmed_rate:.1f}%), saving "
+            f"{num_objective_calls - num_full_objective_calls} full objective calls. "
+            f"{num_accepted_moves} confirmed moves improved the objective "
+            f"(hit rate {hit_rate:.1f}%)."
+        )
+
     def _test_optimize(self):
         """
         Perform a fixed number of iterations with a single worker for
@@ -647,7 +1021,11 @@ def _single_individual_opt(
     enable_geometric_yaw,
     s,
     use_value,
-    debug
+    debug,
+    incremental_evaluation=False,
+    screening_fmodel_dict=None,
+    screening_wind_data=None,
+    screening_margin=0.0,
 ):
     # Set random seed
     np.random.seed(s)
@@ -657,10 +1035,17 @@ def _single_individual_opt(
     stop_time = single_opt_start_time + seconds_per_iteration
 
     num_objective_calls = 0
+    num_full_objective_calls = 0
+    num_accepted_moves = 0
 
     # Get the fmodel
     fmodel_ = _load_local_floris_object(fmodel_dict, wind_data)
 
+    # Check the boundary against the prepared polygon and the spacing with a KD-tree that
+    # is updated as turbines move
+    prepare_boundary(poly_outer)
+    spacing_tree = SpacingTree(layout_x, layout_y, min_dist)
+
     # Initialize local variables
     num_turbines = len(layout_x)
     get_new_point = True # Will always be true, due to hardcoded use_momentum
@@ -676,6 +1061,40 @@ def _single_individual_opt(
     else: # yaw_angles will always be none
         yaw_angles = None
 
+    # Cache the pairwise wake deficits of the current layout to screen single turbine moves
+    if incremental_evaluation:
+        if enable_geometric_yaw:
+            yaw_opt.fmodel_subset.set(layout_x=layout_x, layout_y=layout_y)
+            yaw_angles = np.vstack(yaw_opt.optimize()['yaw_angles_opt'])
+        incremental_objective = _IncrementalObjective(
+            fmodel_,
+            layout_x,
+            layout_y,
+            yaw_angles,
+            use_value,
+        )
+
+    # Get the lower fidelity model and objective used to screen moves
+    if screening_fmodel_dict is not None:
+        fmodel_screening = _load_local_floris_object(screening_fmodel_dict, screening_wind_data)
+        if enable_geometric_yaw:
+            yaw_opt_screening = YawOptimizationGeometric(
+                fmodel_screening,
+                minimum_yaw_angle=-30.0,
+                maximum_yaw_angle=30.0,
+            )
+            yaw_opt_screening.fmodel_subset.set(layout_x=layout_x, layout_y=layout_y)
+            yaw_angles_screening = np.vstack(yaw_opt_screening.optimize()['yaw_angles_opt'])
+        else:
+            yaw_angles_screening = None
+        screening_objective = _get_objective(
+            layout_x,
+            layout_y,
+            fmodel_screening,
+            yaw_angles_screening,
+            use_value,
+        )
+
     # We have a beta feature to maintain momentum, i.e., if a move improves
     # the objective, we try to keep moving in that direction. This is currently
     # disabled.
@@ -718,20 +1137,17 @@ def _single_individual_opt(
             get_new_point = True
             continue
 
+        # Acceptable distances?
+        if not spacing_tree.test_move(tr, test_x, test_y):
+            get_new_point = True
+            continue
+
         # Make a new layout
         original_x = layout_x[tr]
         original_y = layout_y[tr]
         layout_x[tr] = test_x
         layout_y[tr] = test_y
 
-        # Acceptable distances?
-        if not test_min_dist(layout_x, layout_y,min_dist):
-            # Revert and continue
-            layout_x[tr] = original_x
-            layout_y[tr] = original_y
-            get_new_point = True
-            continue
-
         # Does it improve the objective?
         if enable_geometric_yaw: # Select appropriate yaw angles
             yaw_opt.fmodel_subset.set(layout_x=layout_x, layout_y=layout_y)
@@ -739,11 +1155,56 @@ def _single_individual_opt(
             yaw_angles = np.vstack(df_opt['yaw_angles_opt'])
 
         num_objective_calls += 1
-        test_objective = _get_objective(layout_x, layout_y, fmodel_, yaw_angles, use_value)
+        if incremental_evaluation:
+            # Screen the move with the estimate from the cached wake deficits
+            estimated_objective = incremental_objective.evaluate_move(
+                tr,
+                layout_x,
+                layout_y,
+                yaw_angles,
+            )
+            promising = estimated_objective > (
+                incremental_objective.objective
+                - screening_margin * np.abs(incremental_objective.objective)
+            )
+        elif screening_fmodel_dict is not None:
+            # Screen the move with the lower fidelity model
+            if enable_geometric_yaw:
+                yaw_opt_screening.fmodel_subset.set(layout_x=layout_x, layout_y=layout_y)
+                test_yaw_angles_screening = np.vstack(
+                    yaw_opt_screening.optimize()['yaw_angles_opt']
+                )
+            else:
+                test_yaw_angles_screening = None
+            test_screening_objective = _get_objective(
+                layout_x,
+                layout_y,
+                fmodel_screening,
+                test_yaw_angles_screening,
+                use_value,
+            )
+            promising = test_screening_objective > (
+                screening_objective - screening_margin * np.abs(screening_objective)
+            )
+        else:
+            promising = True
+
+        # Only confirm promising moves at full fidelity
+        if promising:
+            num_full_objective_calls += 1
+            test_objective = _get_objective(layout_x, layout_y, fmodel_, yaw_angles, use_value)
+        else:
+            test_objective = -np.inf
 
         if test_objective > current_objective:
             # Accept the change
             current_objective = test_objective
+            num_accepted_moves += 1
+            spacing_tree.move(tr, test_x, test_y)
+            if incremental_evaluation:
+                incremental_objective.accept()
+            elif screening_fmodel_dict is not None:
+                screening_objective = test_screening_objective
 
             # If not a random point this cycle and it did improve things
             # try not getting a new point
@@ -757,4 +1218,11 @@ def _single_individual_opt(
             get_new_point = True
 
     # Return the best result from this individual
-    return current_objective, layout_x, layout_y, num_objective_calls
+    return (
+        current_objective,
+        layout_x,
+        layout_y,
+        num_objective_calls,
+        num_full_objective_calls,
+        num_accepted_moves,
+    )
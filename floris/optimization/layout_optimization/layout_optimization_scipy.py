@@ -2,9 +2,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.optimize import minimize
-from scipy.spatial.distance import cdist
-from shapely.geometry import Point
 
+from .layout_constraints import distance_from_boundaries, space_constraint
 from .layout_optimization_base import LayoutOptimization, list_depth
 
 
@@ -148,10 +147,12 @@ class LayoutOptimizationScipy(LayoutOptimization):
         tmp1 = {
             "type": "ineq",
             "fun": lambda x, *args: self._space_constraint(x),
+            "jac": lambda x, *args: self._space_constraint_jac(x),
         }
         tmp2 = {
             "type": "ineq",
             "fun": lambda x: self._distance_from_boundaries(x),
+            "jac": lambda x: self._distance_from_boundaries_jac(x),
         }
 
         self.cons = [tmp1, tmp2]
@@ -159,54 +160,46 @@ class LayoutOptimizationScipy(LayoutOptimization):
     def _set_opt_bounds(self):
         self.bnds = [(0.0, 1.0) for _ in range(2 * self.nturbs)]
 
-    def _space_constraint(self, x_in, rho=500):
-        x = [
-            self._unnorm(valx, self.xmin, self.xmax)
-            for valx in x_in[0 : self.nturbs]
-        ]
-        y =  [
-            self._unnorm(valy, self.ymin, self.ymax)
-            for valy in x_in[self.nturbs : 2 * self.nturbs]
-        ]
+    def _unnorm_locs(self, x_in):
+        x = self._unnorm(x_in[0 : self.nturbs], self.xmin, self.xmax)
+        y = self._unnorm(x_in[self.nturbs : 2 * self.nturbs], self.ymin, self.ymax)
+        return x, y
 
-        # Calculate distances between turbines
-        locs = np.vstack((x, y)).T
-        distances = cdist(locs, locs)
-        arange = np.arange(distances.shape[0])
-        distances[arange, arange] = 1e10
-        dist = np.min(distances, axis=0)
+    def _space_constraint(self, x_in, rho=500):
+        x, y = self._unnorm_locs(x_in)
 
-        g = 1 - np.array(dist) / self.min_dist
+        # Constraint is satisfied when the KS aggregate is <= 0
+        return -1 * space_constraint(x, y, self.min_dist, rho=rho)
 
-        # Following code copied from OpenMDAO KSComp().
-        # Constraint is satisfied when KS_constraint <= 0
-        g_max = np.max(np.atleast_2d(g), axis=-1)[:, np.newaxis]
-        g_diff = g - g_max
-        exponents = np.exp(rho * g_diff)
-        summation = np.sum(exponents, axis=-1)[:, np.newaxis]
-        KS_constraint = g_max + 1.0 / rho * np.log(summation)
+    def _space_constraint_jac(self, x_in, rho=500):
+        x, y = self._unnorm_locs(x_in)
+        _, jac = space_constraint(x, y, self.min_dist, rho=rho, jacobian=True)
 
-        return -1*KS_constraint[0][0]
+        # Chain rule for the normalized optimization variables
+        jac[0 : self.nturbs] *= self.xmax - self.xmin
+        jac[self.nturbs : 2 * self.nturbs] *= self.ymax - self.ymin
+        return -1 * jac
 
     def _distance_from_boundaries(self, x_in):
-        x = [
-            self._unnorm(valx, self.xmin, self.xmax)
-            for valx in x_in[0 : self.nturbs]
-        ]
-        y =  [
-            self._unnorm(valy, self.ymin, self.ymax)
-            for valy in x_in[self.nturbs : 2 * self.nturbs]
-        ]
-        boundary_con = np.zeros(self.nturbs)
-        for i in range(self.nturbs):
-            loc = Point(x[i], y[i])
-            boundary_con[i] = loc.distance(self._boundary_line)
-            if self._boundary_polygon.contains(loc) is True:
-                boundary_con[i] *= 1.0
-            else:
-                boundary_con[i] *= -1.0
-
-        return boundary_con
+        x, y = self._unnorm_locs(x_in)
+        return distance_from_boundaries(x, y, self._boundary_polygon, self._boundary_line)
+
+    def _distance_from_boundaries_jac(self, x_in):
+        x, y = self._unnorm_locs(x_in)
+        _, jac_xy = distance_from_boundaries(
+            x,
+            y,
+            self._boundary_polygon,
+            self._boundary_line,
+            jacobian=True,
+        )
+
+        # Each constraint only depends on the position of its own turbine
+        jac = np.zeros((self.nturbs, 2 * self.nturbs))
+        turbines = np.arange(self.nturbs)
+        jac[turbines, turbines] = jac_xy[:, 0] * (self.xmax - self.xmin)
+        jac[turbines, self.nturbs + turbines] = jac_xy[:, 1] * (self.ymax - self.ymin)
+        return jac
 
     def _get_initial_and_final_locs(self):
         x_initial = [
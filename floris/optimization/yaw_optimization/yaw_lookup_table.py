@@ -0,0 +1,272 @@
+
+import numpy as np
+import pandas as pd
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import cKDTree
+
+from floris.logging_manager import LoggingManager
+
+
+class YawLookupTable(LoggingManager):
+    """
+    YawLookupTable stores the optimal yaw angles found for a set of ambient conditions,
+    typically the df_opt returned by the optimize() method of a YawOptimization object,
+    and looks up the yaw angles for new combinations of wind direction, wind speed and
+    turbulence intensity. Wind direction is treated as periodic.
+
+    The table can be queried directly to set the yaw angles of a FlorisModel, or used to
+    warm start a new optimization: get_yaw_angles() provides x0 and get_bounds() provides
+    a narrowed minimum_yaw_angle and maximum_yaw_angle around the tabulated optimum.
+    """
+
+    def __init__(
+        self,
+        wind_directions,
+        wind_speeds,
+        turbulence_intensities,
+        yaw_angles,
+        scales=None,
+    ):
+        """
+        Instantiate a YawLookupTable from arrays of conditions and optimal yaw angles.
+        Conditions that appear multiple times are merged by averaging their yaw angles.
+
+        Args:
+            wind_directions (iterable): Wind directions (deg) of the tabulated conditions.
+            wind_speeds (iterable): Wind speeds (m/s) of the tabulated conditions.
+            turbulence_intensities (iterable): Turbulence intensities of the tabulated
+                conditions.
+            yaw_angles (iterable): Optimal yaw angles (deg) with shape
+                (n_conditions, n_turbines).
+            scales (iterable, optional): Differences in wind direction, wind speed and
+                turbulence intensity that are considered equally far apart when looking up
+                conditions. If None, the median step between the unique tabulated values
+                of each variable is used. Defaults to None.
+        """
+        conditions = np.column_stack(
+            [
+                np.mod(np.array(wind_directions, dtype=float), 360.0),
+                np.array(wind_speeds, dtype=float),
+                np.array(turbulence_intensities, dtype=float),
+            ]
+        )
+        yaw_angles = np.array(yaw_angles, dtype=float)
+        if yaw_angles.ndim != 2 or yaw_angles.shape[0] != conditions.shape[0]:
+            raise ValueError(
+                "yaw_angles must have shape (n_conditions, n_turbines) and "
+                "match the number of conditions."
+            )
+
+        # Merge repeated conditions
+        conditions, inverse = np.unique(conditions, axis=0, return_inverse=True)
+        inverse = np.reshape(inverse, -1)
+        counts = np.bincount(inverse)
+        yaw_angles_merged = np.zeros((len(conditions), yaw_angles.shape[1]))
+        np.add.at(yaw_angles_merged, inverse, yaw_angles)
+        yaw_angles_merged /= counts[:, None]
+
+        self.wind_directions = conditions[:, 0]
+        self.wind_speeds = conditions[:, 1]
+        self.turbulence_intensities = conditions[:, 2]
+        self.yaw_angles = yaw_angles_merged
+        self.n_turbines = yaw_angles.shape[1]
+
+        # Only the variables that vary across the table are used for the lookup
+        self._dims = [i for i in range(3) if len(np.unique(conditions[:, i])) > 1]
+        if scales is None:
+            scales = [
+                np.median(np.diff(np.unique(conditions[:, i]))) if i in self._dims else 1.0
+                for i in range(3)
+            ]
+        self.scales = np.array(scales, dtype=float)
+
+        self._build_interpolants()
+
+    @classmethod
+    def from_df_opt(cls, df_opt, scales=None):
+        """
+        Create a YawLookupTable from the output of YawOptimization.optimize().
+
+        Args:
+            df_opt (pd.DataFrame): Table with the columns wind_direction, wind_speed,
+                turbulence_intensity and yaw_angles_opt.
+            scales (iterable, optional): See YawLookupTable. Defaults to None.
+
+        Returns:
+            YawLookupTable: The lookup table.
+        """
+        return cls(
+            df_opt["wind_direction"].values,
+            df_opt["wind_speed"].values,
+            df_opt["turbulence_intensity"].values,
+            np.vstack(df_opt["yaw_angles_opt"].values),
+            scales=scales,
+        )
+
+    @classmethod
+    def read_csv(cls, file_path, scales=None):
+        """
+        Read a YawLookupTable written by to_csv().
+
+        Args:
+            file_path (str): Path to the CSV file.
+            scales (iterable, optional): See YawLookupTable. Defaults to None.
+
+        Returns:
+            YawLookupTable: The lookup table.
+        """
+        df = pd.read_csv(file_path)
+        yaw_columns = [c for c in df.columns if c.startswith("yaw_angle_")]
+        return cls(
+            df["wind_direction"].values,
+            df["wind_speed"].values,
+            df["turbulence_intensity"].values,
+            df[yaw_columns].values,
+            scales=scales,
+        )
+
+    def to_csv(self, file_path):
+        """
+        Write the table to a CSV file with one row per condition and one yaw angle
+        column per turbine.
+
+        Args:
+            file_path (str): Path to the CSV file.
+        """
+        df = pd.DataFrame(
+            {
+                "wind_direction": self.wind_directions,
+                "wind_speed": self.wind_speeds,
+                "turbulence_intensity": self.turbulence_intensities,
+            }
+        )
+        for i in range(self.n_turbines):
+            df[f"yaw_angle_{i:03d}"] = self.yaw_angles[:, i]
+        df.to_csv(file_path, index=False)
+
+    def _build_interpolants(self):
+        points = self._scaled_points(
+            self.wind_directions,
+            self.wind_speeds,
+            self.turbulence_intensities,
+        )
+        values = self.yaw_angles
+
+        # Append copies shifted by a full rotation so that lookups wrap around 360 deg
+        if 0 in self._dims:
+            shift = np.zeros(len(self._dims))
+            shift[0] = 360.0 / self.scales[0]
+            points = np.vstack([points - shift, points, points + shift])
+            values = np.vstack([values, values, values])
+
+        self._points = points
+        self._values = values
+        self._tree = cKDTree(points) if len(self._dims) > 0 else None
+        self._linear_interpolant = (
+            LinearNDInterpolator(points, values) if len(self._dims) > 1 else None
+        )
+
+    def _scaled_points(self, wind_directions, wind_speeds, turbulence_intensities):
+        conditions = [
+            np.mod(np.atleast_1d(np.array(wind_directions, dtype=float)), 360.0),
+            np.atleast_1d(np.array(wind_speeds, dtype=float)),
+            np.atleast_1d(np.array(turbulence_intensities, dtype=float)),
+        ]
+        conditions = np.broadcast_arrays(*conditions)
+        return np.column_stack([conditions[i] / self.scales[i] for i in self._dims])
+
+    def get_yaw_angles(
+        self,
+        wind_directions,
+        wind_speeds,
+        turbulence_intensities,
+        method="linear",
+    ):
+        """
+        Look up the yaw angles for a set of conditions.
+
+        Args:
+            wind_directions (iterable): Wind directions (deg).
+            wind_speeds (iterable): Wind speeds (m/s).
+            turbulence_intensities (iterable): Turbulence intensities.
+            method (str, optional): Either 'nearest' to return the yaw angles of the
+                closest tabulated condition, or 'linear' to interpolate linearly between
+                the tabulated conditions. Conditions outside the span of the table fall back
+                to the nearest tabulated condition. Defaults to 'linear'.
+
+        Returns:
+            np.ndarray: Yaw angles (deg) with shape (n_conditions, n_turbines).
+        """
+        if method not in ["nearest", "linear"]:
+            raise ValueError(
+                f"Unknown interpolation method: '{method}'. "
+                "Valid methods are 'nearest' and 'linear'."
+            )
+
+        points = self._scaled_points(wind_directions, wind_speeds, turbulence_intensities)
+        n_conditions = points.shape[0]
+        if self._tree is None:
+            return np.tile(self._values, (n_conditions, 1))
+
+        _, ids_nearest = self._tree.query(points)
+        yaw_angles = self._values[ids_nearest]
+        if method == "nearest":
+            return yaw_angles
+
+        if self._linear_interpolant is None:
+            # A single variable varies across the table; the tabulated points are sorted
+            ids_sorted = np.argsort(self._points[:, 0])
+            xp = self._points[ids_sorted, 0]
+            return np.column_stack(
+                [
+                    np.interp(points[:, 0], xp, self._values[ids_sorted, i])
+                    for i in range(self.n_turbines)
+                ]
+            )
+
+        yaw_angles_linear = self._linear_interpolant(points)
+        ids = ~np.isnan(yaw_angles_linear).any(axis=1)
+        yaw_angles[ids] = yaw_angles_linear[ids]
+        return yaw_angles
+
+    def get_bounds(
+        self,
+        wind_directions,
+        wind_speeds,
+        turbulence_intensities,
+        margin=5.0,
+        minimum_yaw_angle=0.0,
+        maximum_yaw_angle=25.0,
+        method="linear",
+    ):
+        """
+        Get yaw angle bounds that narrow the search of an optimizer to the neighbourhood
+        of the tabulated optimum. The bounds can be passed as minimum_yaw_angle and
+        maximum_yaw_angle to a YawOptimization object, such as YawOptimizationSR, which then
+        spends its evaluations near the expected optimum.
+
+        Args:
+            wind_directions (iterable): Wind directions (deg).
+            wind_speeds (iterable): Wind speeds (m/s).
+            turbulence_intensities (iterable): Turbulence intensities.
+            margin (float, optional): Distance (deg) of the bounds from the looked up yaw
+                angles. Defaults to 5.0.
+            minimum_yaw_angle (float or ndarray, optional): Lower limit (deg) the bounds
+                are clipped to. Defaults to 0.0.
+            maximum_yaw_angle (float or ndarray, optional): Upper limit (deg) the bounds
+                are clipped to. Defaults to 25.0.
+            method (str, optional): See get_yaw_angles(). Defaults to 'linear'.
+
+        Returns:
+            tuple: The lower and upper bounds (deg), each with shape
+            (n_conditions, n_turbines).
+        """
+        yaw_angles = self.get_yaw_angles(
+            wind_directions,
+            wind_speeds,
+            turbulence_intensities,
+            method=method,
+        )
+        yaw_lbs = np.clip(yaw_angles - margin, minimum_yaw_angle, maximum_yaw_angle)
+        yaw_ubs = np.clip(yaw_angles + margin, minimum_yaw_angle, maximum_yaw_angle)
+        return yaw_lbs, yaw_ubs
@@ -8,7 +8,7 @@ import pandas as pd
 from floris.core.turbine.operation_models import POWER_SETPOINT_DISABLED
 from floris.logging_manager import LoggingManager
 
-from .yaw_optimization_tools import derive_downstream_turbines
+from .yaw_optimization_tools import derive_downstream_turbines_mask
 
 
 class YawOptimization(LoggingManager):
@@ -243,12 +243,13 @@ class YawOptimization(LoggingManager):
 
         # Define which turbines to optimize for
         if self.exclude_downstream_turbines:
-            for iw, wd in enumerate(self.fmodel.core.flow_field.wind_directions):
-                # Remove turbines from turbs_to_opt that are downstream
-                downstream_turbines = derive_downstream_turbines(self.fmodel, wd)
-                downstream_turbines = np.array(downstream_turbines, dtype=int)
-                self.turbs_to_opt[iw, downstream_turbines] = False
-                turbs_to_opt_subset = copy.deepcopy(self.turbs_to_opt)  # Update
+            # Remove turbines from turbs_to_opt that are downstream
+            downstream_turbines = derive_downstream_turbines_mask(
+                self.fmodel,
+                self.fmodel.core.flow_field.wind_directions,
+            )
+            self.turbs_to_opt[downstream_turbines] = False
+            turbs_to_opt_subset = copy.deepcopy(self.turbs_to_opt)  # Update
 
         # Set up a template yaw angles array with default solutions. The default
         # solutions are either 0.0 or the allowable yaw angle closest to 0.0 deg.
@@ -309,6 +310,7 @@ class YawOptimization(LoggingManager):
             turbine_weights=None,
             heterogeneous_speed_multipliers=None,
             power_setpoints=None,
+            resume_from=None,
         ):
         """
         Calculate the wind farm power production assuming the predefined
@@ -327,6 +329,10 @@ class YawOptimization(LoggingManager):
                 powers. Defaults to None.
             heterogeneous_speed_multipliers (iterable, optional): Array or list of speed up factors
                 for heterogeneous inflow. Defaults to None.
+            resume_from (SequentialSolverCheckpoint, optional): Solver state with one entry
+                per condition from which to resume the solve. Only the turbines at or
+                downstream of the checkpoint may differ from the solve that recorded it.
+                Defaults to None.
 
 
         Returns:
@@ -363,7 +369,11 @@ class YawOptimization(LoggingManager):
             yaw_angles=yaw_angles,
             power_setpoints=power_setpoints,
         )
-        fmodel_subset.run()
+        if resume_from is None:
+            fmodel_subset.run()
+        else:
+            fmodel_subset.core.initialize_domain()
+            fmodel_subset.core.steady_state_atmospheric_condition(resume_from=resume_from)
         turbine_power = fmodel_subset.get_turbine_powers()
 
         # Multiply with turbine weighing terms
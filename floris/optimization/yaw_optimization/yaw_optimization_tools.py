@@ -1,9 +1,75 @@
-
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 
+# Upper limit on the number of (wind direction, turbine, turbine) pairs that are compared
+# at once in derive_downstream_turbines_mask
+DOWNSTREAM_MASK_CHUNK_ELEMENTS = 2 ** 22
+
+
+def _rotate_layout(x, y, wind_directions):
+    wind_directions = np.asarray(wind_directions, dtype=float)[:, None]
+    x_rot = (
+        np.cos((wind_directions - 270.0) * np.pi / 180.0) * x
+        - np.sin((wind_directions - 270.0) * np.pi / 180.0) * y
+    )
+    y_rot = (
+        np.sin((wind_directions - 270.0) * np.pi / 180.0) * x
+        + np.cos((wind_directions - 270.0) * np.pi / 180.0) * y
+    )
+    return x_rot, y_rot
+
+
+def derive_downstream_turbines_mask(fmodel, wind_directions, wake_slope=0.30):
+    """Determine which turbines have no effect on other turbines in the farm
+    for each of a series of wind directions. This is the vectorized form of
+    :py:func:`derive_downstream_turbines`, using the same simplified, linearly
+    diverging wake profiles. Each unique wind direction is only evaluated once,
+    since the rows of a wind rose repeat the wind directions across wind speeds.
+
+    Args:
+        fmodel (FlorisModel): A FlorisModel object.
+        wind_directions (iterable): The wind directions in the FLORIS frame
+        of reference for which the downstream turbines are to be determined.
+        wake_slope (float, optional): linear slope of the wake (dy/dx)
+
+    Returns:
+        is_downstream (np.ndarray): Boolean array with shape
+        (len(wind_directions), n_turbines) that is True for the turbines with a
+        wake that does not affect any other turbine inside the farm.
+    """
+    x = np.asarray(fmodel.layout_x, dtype=float)
+    y = np.asarray(fmodel.layout_y, dtype=float)
+    D = fmodel.core.farm.rotor_diameters_sorted[0][0]
+    n_turbs = len(x)
+
+    unique_wind_directions, inverse = np.unique(
+        np.atleast_1d(wind_directions),
+        return_inverse=True,
+    )
+    is_downstream_unique = np.zeros((len(unique_wind_directions), n_turbs), dtype=bool)
+
+    chunk_size = max(1, DOWNSTREAM_MASK_CHUNK_ELEMENTS // max(1, n_turbs ** 2))
+    for start in range(0, len(unique_wind_directions), chunk_size):
+        stop = start + chunk_size
+        x_rot, y_rot = _rotate_layout(x, y, unique_wind_directions[start:stop])
+
+        # Wake of turbine i (axis 1) evaluated at turbine j (axis 2)
+        x0 = x_rot[:, :, None]
+        y0 = y_rot[:, :, None]
+        xt = x_rot[:, None, :]
+        yt = y_rot[:, None, :]
+        in_wake = (
+            (xt >= x0 + 0.01)
+            & (yt < (y0 + D) + (xt - x0) * wake_slope)
+            & (yt > (y0 - D) - (xt - x0) * wake_slope)
+        )
+        is_downstream_unique[start:stop] = ~np.any(in_wake, axis=2)
+
+    return is_downstream_unique[inverse.reshape(-1)]
+
+
 def derive_downstream_turbines(fmodel, wind_direction, wake_slope=0.30, plot_lines=False):
     """Determine which turbines have no effect on other turbines in the
     farm, i.e., which turbines have wakes that do not impact the other
@@ -43,15 +109,15 @@ def derive_downstream_turbines(fmodel, wind_direction, wake_slope=0.30, plot_lin
     n_turbs = len(x)
 
     # Rotate farm and determine freestream/waked turbines
-    is_downstream = [False for _ in range(n_turbs)]
-    x_rot = (
-        np.cos((wind_direction - 270.0) * np.pi / 180.0) * x
-        - np.sin((wind_direction - 270.0) * np.pi / 180.0) * y
-    )
-    y_rot = (
-        np.sin((wind_direction - 270.0) * np.pi / 180.0) * x
-        + np.cos((wind_direction - 270.0) * np.pi / 180.0) * y
-    )
+    x_rot, y_rot = _rotate_layout(x, y, [wind_direction])
+    x_rot = x_rot[0]
+    y_rot = y_rot[0]
+    is_downstream = derive_downstream_turbines_mask(
+        fmodel,
+        [wind_direction],
+        wake_slope=wake_slope,
+    )[0]
+    turbs_downstream = list(np.where(is_downstream)[0])
 
     if plot_lines:
         fig, ax = plt.subplots()
@@ -65,58 +131,24 @@ def derive_downstream_turbines(fmodel, wind_direction, wake_slope=0.30, plot_lin
             ax.text(x_rot[ii], y_rot[ii], "T%03d" % ii)
         ax.axis("equal")
 
-    srt = np.argsort(x_rot)
-    x_rot_srt = x_rot[srt]
-    y_rot_srt = y_rot[srt]
-    for ii in range(n_turbs):
-        x0 = x_rot_srt[ii]
-        y0 = y_rot_srt[ii]
-
-        def wake_profile_ub_turbii(x):
-            y = (y0 + D[ii]) + (x - x0) * wake_slope
-            if isinstance(y, (float, np.float64, np.float32)):
-                if x < (x0 + 0.01):
-                    y = -np.inf
-            else:
-                y[x < x0 + 0.01] = -np.inf
-            return y
-
-        def wake_profile_lb_turbii(x):
-            y = (y0 - D[ii]) - (x - x0) * wake_slope
-            if isinstance(y, (float, np.float64, np.float32)):
-                if x < (x0 + 0.01):
-                    y = -np.inf
-            else:
-                y[x < x0 + 0.01] = -np.inf
-            return y
-
-        def determine_if_in_wake(xt, yt):
-            return (yt < wake_profile_ub_turbii(xt)) & (yt > wake_profile_lb_turbii(xt))
-
-        is_downstream[ii] = not any(
-            determine_if_in_wake(x_rot_srt[iii], y_rot_srt[iii]) for iii in range(n_turbs)
-        )
-
-        if plot_lines:
-            x1 = np.max(x_rot_srt) + 500.0
+        x1 = np.max(x_rot) + 500.0
+        for ii in range(n_turbs):
+            x0 = x_rot[ii]
+            y0 = y_rot[ii]
+            dx = np.array([0.02, x1 - x0])
             ax.fill_between(
                 [x0, x1, x1, x0],
                 [
-                    wake_profile_ub_turbii(x0 + 0.02),
-                    wake_profile_ub_turbii(x1),
-                    wake_profile_lb_turbii(x1),
-                    wake_profile_lb_turbii(x0 + 0.02),
+                    (y0 + D[ii]) + dx[0] * wake_slope,
+                    (y0 + D[ii]) + dx[1] * wake_slope,
+                    (y0 - D[ii]) - dx[1] * wake_slope,
+                    (y0 - D[ii]) - dx[0] * wake_slope,
                 ],
                 alpha=0.1,
                 color="k",
                 edgecolor=None,
             )
 
-    usrt = np.argsort(srt)
-    is_downstream = [is_downstream[i] for i in usrt]
-    turbs_downstream = list(np.where(is_downstream)[0])
-
-    if plot_lines:
         ax.set_title("wind_direction = %03d" % wind_direction)
         ax.set_xlim([np.min(x_rot) - 500.0, x1])
         ax.set_ylim([np.min(y_rot) - 500.0, np.max(y_rot) + 500.0])
@@ -7,6 +7,10 @@ from floris.utilities import rotate_coordinates_rel_west
 from .yaw_optimization_base import YawOptimization
 
 
+# Maximum number of pairwise distances evaluated at once
+GEOMETRIC_YAW_CHUNK_ELEMENTS = 2**22
+
+
 class YawOptimizationGeometric(YawOptimization):
     """
     YawOptimizationGeometric is a subclass of
@@ -44,21 +48,22 @@ class YawOptimizationGeometric(YawOptimization):
             opt_yaw_angles (np.array): Optimal yaw angles in degrees. This
             array is equal in length to the number of turbines in the farm.
         """
-        # Loop through every WD individually. WS ignored!
+        # Evaluate all WDs at once. WS ignored!
         wd_array = self.fmodel_subset.core.flow_field.wind_directions
 
         active_turbines = self.fmodel_subset.core.farm.power_setpoints > POWER_SETPOINT_DISABLED
-        for nwdi, wd in enumerate(wd_array):
-            self._yaw_angles_opt_subset[nwdi, active_turbines[nwdi]] = geometric_yaw(
-                self.fmodel_subset.layout_x[active_turbines[nwdi]],
-                self.fmodel_subset.layout_y[active_turbines[nwdi]],
-                wd,
-                self.fmodel.core.farm.turbine_definitions[0]["rotor_diameter"],
-                top_left_yaw_upper=self.maximum_yaw_angle[0, 0],
-                bottom_left_yaw_upper=self.maximum_yaw_angle[0, 0],
-                top_left_yaw_lower=self.minimum_yaw_angle[0, 0],
-                bottom_left_yaw_lower=self.minimum_yaw_angle[0, 0],
-            )
+        yaw_angles = geometric_yaw_array(
+            self.fmodel_subset.layout_x,
+            self.fmodel_subset.layout_y,
+            wd_array,
+            self.fmodel.core.farm.turbine_definitions[0]["rotor_diameter"],
+            active_turbines=active_turbines,
+            top_left_yaw_upper=self.maximum_yaw_angle[0, 0],
+            bottom_left_yaw_upper=self.maximum_yaw_angle[0, 0],
+            top_left_yaw_lower=self.minimum_yaw_angle[0, 0],
+            bottom_left_yaw_lower=self.minimum_yaw_angle[0, 0],
+        )
+        self._yaw_angles_opt_subset[active_turbines] = yaw_angles[active_turbines]
 
         # Finalize optimization, i.e., retrieve full solutions
         df_opt = self._finalize()
@@ -103,23 +108,123 @@ def geometric_yaw(
     bottom_left_yaw_lower: yaw angle associated with bottom left point
     bottom_right_yaw_lower: yaw angle associated with bottom right point
     """
+    return geometric_yaw_array(
+        turbine_x,
+        turbine_y,
+        np.array([wind_direction]),
+        rotor_diameter,
+        left_x=left_x,
+        top_left_y=top_left_y,
+        right_x=right_x,
+        top_right_y=top_right_y,
+        top_left_yaw_upper=top_left_yaw_upper,
+        top_right_yaw_upper=top_right_yaw_upper,
+        bottom_left_yaw_upper=bottom_left_yaw_upper,
+        bottom_right_yaw_upper=bottom_right_yaw_upper,
+        top_left_yaw_lower=top_left_yaw_lower,
+        top_right_yaw_lower=top_right_yaw_lower,
+        bottom_left_yaw_lower=bottom_left_yaw_lower,
+        bottom_right_yaw_lower=bottom_right_yaw_lower,
+    )[0]
+
+def geometric_yaw_array(
+    turbine_x,
+    turbine_y,
+    wind_directions,
+    rotor_diameter,
+    active_turbines=None,
+    left_x=0.0,
+    top_left_y=1.0,
+    right_x=25.0,
+    top_right_y=1.0,
+    top_left_yaw_upper=30.0,
+    top_right_yaw_upper=0.0,
+    bottom_left_yaw_upper=30.0,
+    bottom_right_yaw_upper=0.0,
+    top_left_yaw_lower=-30.0,
+    top_right_yaw_lower=0.0,
+    bottom_left_yaw_lower=-30.0,
+    bottom_right_yaw_lower=0.0,
+):
+    """
+    Vectorized form of geometric_yaw for a series of wind directions. Conditions that
+    share a wind direction and set of active turbines share their yaw angles, so the
+    rotated pairwise distances are computed once for each unique combination.
 
-    nturbs = len(turbine_x)
-    turbine_coordinates_array = np.zeros((nturbs,3))
-    turbine_coordinates_array[:,0] = turbine_x[:]
-    turbine_coordinates_array[:,1] = turbine_y[:]
+    turbine_x: unrotated x turbine coords
+    turbine_y: unrotated y turbine coords
+    wind_directions: array of wind directions, degrees, with shape (n_findex,)
+    rotor_diameter: float
+    active_turbines: boolean array with shape (n_findex, n_turbines). Inactive
+        turbines are ignored, as if removed from the farm, and have a yaw angle of 0.
+        Defaults to None, in which case all turbines are active.
+    For the remaining arguments, see geometric_yaw.
 
-    rotated_x, rotated_y, _, _, _ = rotate_coordinates_rel_west(
-        np.array([wind_direction]),
-        turbine_coordinates_array
-    )
-    processed_x, processed_y = _process_layout(rotated_x[0], rotated_y[0], rotor_diameter)
-    yaw_array = np.zeros(nturbs)
-    for i in range(nturbs):
-        # TODO: fix shape of top left yaw etc?
-        yaw_array[i] = _get_yaw_angles(
-            processed_x[i],
-            processed_y[i],
+    Returns an array of yaw angles with shape (n_findex, n_turbines).
+    """
+    turbine_x = np.array(turbine_x, dtype=float)
+    turbine_y = np.array(turbine_y, dtype=float)
+    wind_directions = np.atleast_1d(np.array(wind_directions, dtype=float))
+    n_findex = len(wind_directions)
+    nturbs = len(turbine_x)
+    if active_turbines is None:
+        active_turbines = np.ones((n_findex, nturbs), dtype=bool)
+    active_turbines = np.broadcast_to(np.array(active_turbines, dtype=bool), (n_findex, nturbs))
+
+    # Find the unique combinations of wind direction and active turbines
+    if np.all(active_turbines == active_turbines[0]):
+        wd_unique, inverse = np.unique(wind_directions, return_inverse=True)
+        active_unique = np.broadcast_to(active_turbines[0], (len(wd_unique), nturbs))
+    else:
+        conditions = np.column_stack([wind_directions, np.packbits(active_turbines, axis=1)])
+        _, ids_unique, inverse = np.unique(
+            conditions,
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        wd_unique = wind_directions[ids_unique]
+        active_unique = active_turbines[ids_unique]
+    inverse = np.reshape(inverse, -1)
+    any_active = np.any(active_unique, axis=1)
+
+    # Rotate about the center of the active turbines, as if the others were removed
+    with np.errstate(invalid="ignore"):
+        x_center = (
+            np.min(np.where(active_unique, turbine_x, np.inf), axis=1)
+            + np.max(np.where(active_unique, turbine_x, -np.inf), axis=1)
+        ) / 2
+        y_center = (
+            np.min(np.where(active_unique, turbine_y, np.inf), axis=1)
+            + np.max(np.where(active_unique, turbine_y, -np.inf), axis=1)
+        ) / 2
+    x_center = np.where(any_active, x_center, 0.0)[:, None]
+    y_center = np.where(any_active, y_center, 0.0)[:, None]
+
+    turbine_coordinates_array = np.zeros((nturbs, 3))
+    turbine_coordinates_array[:, 0] = turbine_x
+    turbine_coordinates_array[:, 1] = turbine_y
+
+    # Evaluate the unique conditions in chunks to bound the size of the pairwise arrays
+    yaw_array = np.zeros((len(wd_unique), nturbs))
+    chunk_size = max(1, GEOMETRIC_YAW_CHUNK_ELEMENTS // max(nturbs ** 2, 1))
+    for i0 in range(0, len(wd_unique), chunk_size):
+        ids = slice(i0, i0 + chunk_size)
+        rotated_x, rotated_y, _, _, _ = rotate_coordinates_rel_west(
+            wd_unique[ids],
+            np.broadcast_to(turbine_coordinates_array, (len(wd_unique[ids]), nturbs, 3)),
+            x_center_of_rotation=x_center[ids],
+            y_center_of_rotation=y_center[ids],
+        )
+        processed_x, processed_y = _process_layout(
+            rotated_x,
+            rotated_y,
+            rotor_diameter,
+            active_turbines=active_unique[ids],
+        )
+        yaw_array[ids] = _get_yaw_angles(
+            processed_x,
+            processed_y,
             left_x,
             top_left_y,
             right_x,
@@ -133,14 +238,16 @@ def geometric_yaw(
             bottom_left_yaw_lower,
             bottom_right_yaw_lower,
         )
+    yaw_array[~active_unique] = 0.0
 
-    return yaw_array
+    return yaw_array[inverse]
 
 def _process_layout(
     turbine_x,
     turbine_y,
     rotor_diameter,
-    spread=0.1
+    spread=0.1,
+    active_turbines=None,
 ):
     """
     returns the distance from each turbine to the nearest downstream waked turbine
@@ -148,50 +255,34 @@ def _process_layout(
     wake spread, but this could/should be modified to be the same as the trapezoid rule
     used to determine the yaw angles.
 
-    turbine_x: turbine x coords (rotated)
-    turbine_y: turbine y coords (rotated)
+    turbine_x: turbine x coords (rotated), with the turbines along the last axis
+    turbine_y: turbine y coords (rotated), with the turbines along the last axis
     rotor_diameter: turbine rotor diameter (float)
     spread=0.1: Jensen alpha wake spread value
+    active_turbines=None: boolean array shaped like turbine_x. Inactive turbines
+        are not considered as waked turbines.
     """
-    len(turbine_x)
-
-    # # Intialize storage
-    # dx = np.zeros(nturbs) + 1E10
-    # dy = np.zeros(nturbs)
-
-    # for waking_index in range(nturbs):
-    #     for waked_index in range(nturbs):
-    #         if turbine_x[waked_index] > turbine_x[waking_index]:
-    #             r = spread*(turbine_x[waked_index]-turbine_x[waking_index]) + rotor_diameter/2.0
-    #             if abs(turbine_y[waked_index]-turbine_y[waking_index]) < (r+rotor_diameter/2.0):
-    #                 if (turbine_x[waked_index] - turbine_x[waking_index]) < dx[waking_index]:
-    #                     dx[waking_index] = turbine_x[waked_index] - turbine_x[waking_index]
-    #                     dy[waking_index] = turbine_y[waked_index]- turbine_y[waking_index]
-    #     if dx[waking_index] == 1E10:
-    #         dx[waking_index] = 0.0
-
-    # dx_ = dx
-    # dy_ = dy
-
-    # Compute distances
-    x_dists = turbine_x.reshape(-1,1).T - turbine_x.reshape(-1,1)
-    y_dists = turbine_y.reshape(-1,1).T - turbine_y.reshape(-1,1)
+    # Compute distances; the last axis holds the waked turbine
+    x_dists = turbine_x[..., None, :] - turbine_x[..., :, None]
+    y_dists = turbine_y[..., None, :] - turbine_y[..., :, None]
 
     # Any turbines upstream or at the turbine location are ineligble
     x_dists[x_dists <= 0.] = np.inf
 
     # Check within Jensen model spread
     in_Jensen_wake = (abs(y_dists) < spread * x_dists + rotor_diameter)
+    if active_turbines is not None:
+        in_Jensen_wake &= active_turbines[..., None, :]
     x_dists[~in_Jensen_wake] = np.inf
 
     # Get minimums (and arguments to select the correct y values also)
-    dx = x_dists.min(axis=1)
-    dy = y_dists[range(len(turbine_x)), x_dists.argmin(axis=1)]
+    dx = x_dists.min(axis=-1)
+    dy = np.take_along_axis(y_dists, x_dists.argmin(axis=-1)[..., None], axis=-1)[..., 0]
 
     # Handle last turbine downstream
-    furthest_ds_turb_idx = np.where(dx == np.inf)[0]
-    dx[furthest_ds_turb_idx] = 0.
-    dy[furthest_ds_turb_idx] = 0.
+    furthest_ds_turb = (dx == np.inf)
+    dx[furthest_ds_turb] = 0.
+    dy[furthest_ds_turb] = 0.
 
     return dx/rotor_diameter, dy/rotor_diameter
 
@@ -220,7 +311,8 @@ def _get_yaw_angles(
     ________________________________________
 
     x and y: dx and dy to the nearest downstream turbine in rotor diameteters with
-        turbines rotated so wind is coming left to right
+        turbines rotated so wind is coming left to right. Either floats or arrays of
+        equal shape, in which case the yaw angles are evaluated elementwise.
     left_x: where we start the trapezoid. Should be left as 0.
     top_left_y: trapezoid top left coord
     right_x: where to stop the trapezoid downstream.
@@ -235,21 +327,26 @@ def _get_yaw_angles(
     bottom_left_yaw_lower: yaw angle associated with bottom left point
     bottom_right_yaw_lower: yaw angle associated with bottom right point
     """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    dx = (x-left_x)/(right_x-left_x)
+    edge_y = top_left_y + (top_right_y-top_left_y)*dx
+
+    # Upper trapezoid, with a tolerance to handle numerical issues, or lower trapezoid
+    upper = (y >= -0.01)
+    top_yaw = np.where(
+        upper,
+        top_left_yaw_upper + (top_right_yaw_upper-top_left_yaw_upper)*dx,
+        top_left_yaw_lower + (top_right_yaw_lower-top_left_yaw_lower)*dx,
+    )
+    bottom_yaw = np.where(
+        upper,
+        bottom_left_yaw_upper + (bottom_right_yaw_upper-bottom_left_yaw_upper)*dx,
+        bottom_left_yaw_lower + (bottom_right_yaw_lower-bottom_left_yaw_lower)*dx,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yaw = bottom_yaw + (top_yaw-bottom_yaw)*abs(y)/edge_y
 
-    if x <= 0:
-        return 0.0
-    else:
-        dx = (x-left_x)/(right_x-left_x)
-        if dx >= 1.0:
-            return 0.0
-        edge_y = top_left_y + (top_right_y-top_left_y)*dx
-        if abs(y) > edge_y:
-            return 0.0
-        elif y >= -0.01: # Tolerance to handle numerical issues
-            top_yaw = top_left_yaw_upper + (top_right_yaw_upper-top_left_yaw_upper)*dx
-            bottom_yaw = bottom_left_yaw_upper + (bottom_right_yaw_upper-bottom_left_yaw_upper)*dx
-            return bottom_yaw + (top_yaw-bottom_yaw)*abs(y)/edge_y
-        elif y < -0.01:
-            top_yaw = top_left_yaw_lower + (top_right_yaw_lower-top_left_yaw_lower)*dx
-            bottom_yaw = bottom_left_yaw_lower + (bottom_right_yaw_lower-bottom_left_yaw_lower)*dx
-            return bottom_yaw + (top_yaw-bottom_yaw)*abs(y)/edge_y
+    # No yaw outside the trapezoid
+    return np.where((x <= 0) | (dx >= 1.0) | (abs(y) > edge_y), 0.0, yaw)
@@ -24,10 +24,26 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
         turbine_weights=None,
         exclude_downstream_turbines=True,
         verify_convergence=False,
+        checkpoint_upstream_state=True,
+        adaptive=False,
+        convergence_tolerance=1e-4,
     ):
         """
         Instantiate YawOptimizationSR object with a FlorisModel object
         and assign parameter values.
+
+        If checkpoint_upstream_state is True and the wake model uses the sequential
+        solver, the solver state upstream of the turbine being yawed is computed once
+        and every candidate yaw angle resumes the solve from there, rather than solving
+        the full farm from the first turbine. The results are unchanged.
+
+        If adaptive is True, a turbine is not evaluated in the remaining passes once
+        yawing it improved the farm power of a condition by less than
+        convergence_tolerance (relative) in a pass, and a condition is dropped entirely
+        once all of its turbines together improved its farm power by less than that.
+        Conditions that converge early, or in which no turbine is waked, then no longer
+        add evaluations to later passes. The statistics of each pass are stored in
+        pass_statistics by optimize().
         """
 
         # Initialize base class
@@ -68,6 +84,16 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
 
         # Save optimization choices to self
         self.Ny_passes = Ny_passes
+        self.checkpoint_upstream_state = (
+            checkpoint_upstream_state and self.fmodel_subset.core.uses_sequential_solver
+        )
+        self._upstream_checkpoint = None
+        self._fmodel_checkpoint = None
+        self.adaptive = adaptive
+        self.convergence_tolerance = convergence_tolerance
+        self.pass_statistics = None
+        self._n_evaluations = 0
+        self._active_subset = np.ones((self._n_findex_subset, self.nturbs), dtype=bool)
 
         # For each wind direction, determine the order of turbines
         self._get_turbine_orders()
@@ -85,6 +111,41 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
             turbines_ordered_array.append(turbines_ordered)
         self.turbines_ordered_array_subset = np.vstack(turbines_ordered_array)
 
+        # Position of each turbine in the order used by the solver
+        self._solver_positions_subset = self.fmodel_subset.core.grid.unsorted_indices[:, :, 0, 0]
+
+    def _update_upstream_checkpoint(self, turbine_depth):
+        """
+        Solve the turbines upstream of those manipulated at turbine_depth with the current
+        optimal yaw angles and record the solver state. Only these turbines and those
+        downstream of them differ between the candidates, so each candidate resumes the
+        solve from this state.
+        """
+        turbids = self.turbines_ordered_array_subset[:, turbine_depth]
+        checkpoint_index = int(np.min(
+            self._solver_positions_subset[np.arange(self._n_findex_subset), turbids]
+        ))
+
+        # The optimal yaw angles only changed at or downstream of the previous checkpoint
+        resume_from = self._upstream_checkpoint
+        if resume_from is not None and resume_from.index > checkpoint_index:
+            resume_from = None
+
+        # Only the yaw angles change between these solves, so the same model is reused
+        # rather than set() rebuilding it every time
+        if self._fmodel_checkpoint is None:
+            self._fmodel_checkpoint = copy.deepcopy(self.fmodel_subset)
+        core = self._fmodel_checkpoint.core
+
+        start_time = timerpc()
+        core.farm.set_yaw_angles(self._yaw_angles_opt_subset)
+        core.initialize_domain()
+        self._upstream_checkpoint = core.solve_to_checkpoint(
+            checkpoint_index,
+            resume_from=resume_from,
+        )
+        self.time_spent_in_floris += (timerpc() - start_time)
+
 
     def _calc_powers_with_memory(self, yaw_angles_subset, use_memory=True):
         # Define current optimal solutions and floris wind directions locally
@@ -139,6 +200,12 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
                 het_sm = np.tile(het_sm_orig, (Ny, 1))[~idx, :]
             else:
                 het_sm = None
+            if self._upstream_checkpoint is not None:
+                findices = np.arange(yaw_angles_subset.shape[0]) % self._n_findex_subset
+                resume_from = self._upstream_checkpoint.select(findices[~idx])
+            else:
+                resume_from = None
+            self._n_evaluations += int(np.sum(~idx))
             farm_powers[~idx] = self._calculate_farm_power(
                 wd_array=wd_array_subset[~idx],
                 ws_array=ws_array_subset[~idx],
@@ -147,6 +214,7 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
                 yaw_angles=yaw_angles_subset[~idx, :],
                 heterogeneous_speed_multipliers=het_sm,
                 power_setpoints=power_setpoints_subset[~idx, :],
+                resume_from=resume_from,
             )
             self.time_spent_in_floris += (timerpc() - start_time)
 
@@ -182,6 +250,10 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
             # if not self._turbs_to_opt_subset[iw, 0, turbid]:
             #     continue
 
+            # Converged turbines keep their optimal yaw angle, which is not evaluated again
+            if not self._active_subset[iw, turbid]:
+                continue
+
             # # Remove turbines that need not be optimized
             # turbines_ordered = [ti for ti in turbines_ordered if ti in self.turbs_to_opt]
 
@@ -227,10 +299,26 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
         wind speed and turbulence intensity.
         """
         self.print_progress = print_progress
+        self._upstream_checkpoint = None
+        self._active_subset[:, :] = True
+        self._n_evaluations = 0
+        pass_statistics = []
+        findex_range = np.arange(self._n_findex_subset)
 
         # For each pass, from front to back
         ii = 0
         for Nii in range(len(self.Ny_passes)):
+            farm_power_pass_start = self._farm_power_opt_subset.copy()
+            turbine_gains = np.zeros_like(self._yaw_angles_opt_subset)
+            n_evaluations_pass_start = self._n_evaluations
+            time_pass_start = self.time_spent_in_floris
+            pass_statistics.append({
+                "pass": Nii,
+                "Ny": self.Ny_passes[Nii],
+                "rows_remaining": int(np.sum(np.any(self._active_subset, axis=1))),
+                "turbines_remaining": int(np.sum(self._active_subset)),
+            })
+
             # Disturb yaw angles for one turbine at a time, from front to back
             for turbine_depth in range(self.nturbs):
                 p = 100.0 * ii / (len(self.Ny_passes) * self.nturbs)
@@ -241,12 +329,21 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
                         f"turbine_depth={turbine_depth} ({p:.1f}%)"
                     )
 
+                # Skip this turbine depth if it has converged for every condition
+                turbids_depth = self.turbines_ordered_array_subset[:, turbine_depth]
+                if not np.any(self._active_subset[findex_range, turbids_depth]):
+                    continue
+
                 # Create grid to evaluate yaw angles for one turbine == turbine_depth
                 evaluation_grid = self._generate_evaluation_grid(
                     pass_depth=Nii,
                     turbine_depth=turbine_depth
                 )
 
+                # Solve the turbines upstream of the ones being yawed only once
+                if self.checkpoint_upstream_state:
+                    self._update_upstream_checkpoint(turbine_depth)
+
                 # Evaluate grid of yaw angles, get farm powers and find optimal solutions
                 farm_powers = self._process_evaluation_grid()
 
@@ -277,6 +374,12 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
                 farm_powers_opt_prev = self._farm_power_opt_subset
                 yaw_angles_opt_prev = self._yaw_angles_opt_subset
 
+                # Relative farm power improvement from yawing the turbine at this depth
+                turbine_gains[findex_range, turbids_depth] = _relative_gain(
+                    farm_powers_opt_new,
+                    farm_powers_opt_prev,
+                )
+
                 # Now update optimal farm powers if better than previous
                 ids_better = (farm_powers_opt_new > farm_powers_opt_prev)
                 farm_power_opt = farm_powers_opt_prev
@@ -309,6 +412,38 @@ class YawOptimizationSR(YawOptimization, LoggingManager):
                 self._farm_power_opt_subset = farm_power_opt
                 self._yaw_angles_opt_subset = yaw_angles_opt
 
+            # Summarize the pass
+            n_evaluations = self._n_evaluations - n_evaluations_pass_start
+            pass_statistics[-1].update({
+                "evaluations": n_evaluations,
+                "evaluations_saved": (
+                    self.Ny_passes[Nii] * self._n_findex_subset * self.nturbs - n_evaluations
+                ),
+                "time_in_floris": self.time_spent_in_floris - time_pass_start,
+            })
+
+            # Stop evaluating the turbines and conditions that have converged
+            if self.adaptive:
+                row_gains = _relative_gain(self._farm_power_opt_subset, farm_power_pass_start)
+                self._active_subset &= (turbine_gains >= self.convergence_tolerance)
+                self._active_subset[row_gains < self.convergence_tolerance, :] = False
+
+        self.pass_statistics = pd.DataFrame(pass_statistics)
+
         # Finalize optimization, i.e., retrieve full solutions
+        self._upstream_checkpoint = None
         df_opt = self._finalize()
         return df_opt
+
+
+def _relative_gain(new, old):
+    """
+    Relative improvement of new over old, which is zero where new is not larger and infinite
+    where old is zero.
+    """
+    return np.divide(
+        new - old,
+        np.abs(old),
+        out=np.where(new > old, np.inf, 0.0),
+        where=(old != 0.0) & (new > old),
+    )
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import copy
 from pathlib import Path
 from time import perf_counter as timerpc
 
 import numpy as np
 
 from floris.core import State
-from floris.floris_model import FlorisModel
+from floris.floris_model import FlorisModel, SOLUTION_KEYS
 from floris.type_dec import (
     NDArrayFloat,
 )
@@ -141,7 +140,7 @@ class ParFlorisModel(FlorisModel):
                         )
                 else:
                     with self._PoolExecutor(self.max_workers) as p:
-                        self._fmodels_split = p.starmap(_parallel_run, parallel_run_inputs)
+                        self._solutions_split = p.starmap(_parallel_run, parallel_run_inputs)
             elif self.interface == "pathos":
                 if self.return_turbine_powers_only:
                     self._turbine_powers_split = self.pathos_pool.map(
@@ -149,7 +148,7 @@ class ParFlorisModel(FlorisModel):
                         parallel_run_inputs
                     )
                 else:
-                    self._fmodels_split = self.pathos_pool.map(
+                    self._solutions_split = self.pathos_pool.map(
                         _parallel_run_map,
                         parallel_run_inputs
                     )
@@ -163,11 +162,11 @@ class ParFlorisModel(FlorisModel):
                         self._turbine_powers_split = list(self._turbine_powers_split)
                 else:
                     with self._PoolExecutor(self.max_workers) as p:
-                        self._fmodels_split = p.map(
+                        self._solutions_split = p.map(
                             _parallel_run_map,
                             parallel_run_inputs
                         )
-                        self._fmodels_split = list(self._fmodels_split)
+                        self._solutions_split = list(self._solutions_split)
             t2 = timerpc()
             self._postprocessing()
             self.core.farm.finalize(self.core.grid.unsorted_indices)
@@ -175,17 +174,34 @@ class ParFlorisModel(FlorisModel):
             t3 = timerpc()
             self._print_timings(t0, t1, t2, t3)
 
-    def sample_flow_at_points(self, x: NDArrayFloat, y: NDArrayFloat, z: NDArrayFloat):
+    def sample_flow_at_points(
+        self,
+        x: NDArrayFloat,
+        y: NDArrayFloat,
+        z: NDArrayFloat,
+        chunk_size: int | None = None,
+        max_memory_mb: float | None = None,
+        return_components: bool = False,
+    ):
         """
         Sample the flow field at specified points.
 
+        The work is split over the wind conditions and, if there are fewer wind condition
+        splits than workers, also over the points. Each worker evaluates its points in
+        blocks as described in :py:meth:`FlorisModel.sample_flow_at_points`, so
+        max_memory_mb applies to each worker.
+
         Args:
             x: The x-coordinates of the points.
             y: The y-coordinates of the points.
             z: The z-coordinates of the points.
+            chunk_size: Maximum number of points to evaluate at once in each worker.
+            max_memory_mb: Approximate memory budget, in MB, for each worker.
+            return_components: If True, also return the v and w velocity components.
 
         Returns:
-            NDArrayFloat: The wind speeds at the specified points.
+            NDArrayFloat: The wind speeds at the specified points. If return_components is
+                True, a tuple of the u, v, and w components.
         """
         if self.return_turbine_powers_only:
             raise NotImplementedError(
@@ -195,16 +211,59 @@ class ParFlorisModel(FlorisModel):
 
         if self.interface is None:
             t0 = timerpc()
-            sampled_wind_speeds = super().sample_flow_at_points(x, y, z)
+            sampled_wind_speeds = super().sample_flow_at_points(
+                x,
+                y,
+                z,
+                chunk_size=chunk_size,
+                max_memory_mb=max_memory_mb,
+                return_components=return_components,
+            )
             t1 = timerpc()
             self._print_timings(t0, t1, None, None)
         else:
+            if not len(x) == len(y) == len(z):
+                raise ValueError("x, y, and z must be the same size")
+            x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
+
             t0 = timerpc()
             self.core.initialize_domain()
             parallel_run_inputs = self._preprocessing()
+
+            # Use any remaining workers to split over the points
+            n_point_splits = np.min(
+                [max(self.max_workers // len(parallel_run_inputs), 1), max(len(x), 1)]
+            )
+            point_id_splits = np.array_split(np.arange(len(x)), n_point_splits)
+
+            # The transverse velocities depend on the mean initial velocity over all of the
+            # points, so it is found here for the points that are split between workers
+            if n_point_splits > 1:
+                mean_chunk_size = chunk_size
+                if chunk_size is None and max_memory_mb is not None:
+                    mean_chunk_size = self._points_chunk_size(max_memory_mb)
+                u_initial_mean_splits = np.array_split(
+                    self.core.points_u_initial_mean(x, y, z, mean_chunk_size),
+                    len(parallel_run_inputs),
+                )
+            else:
+                u_initial_mean_splits = [None] * len(parallel_run_inputs)
+
             parallel_sample_flow_at_points_inputs = [
-                (fmodel_dict, control_setpoints, x, y, z)
-                for fmodel_dict, control_setpoints in parallel_run_inputs
+                (
+                    core_state,
+                    x[point_ids],
+                    y[point_ids],
+                    z[point_ids],
+                    chunk_size,
+                    max_memory_mb,
+                    return_components,
+                    u_initial_mean,
+                )
+                for (core_state,), u_initial_mean in zip(
+                    parallel_run_inputs, u_initial_mean_splits
+                )
+                for point_ids in point_id_splits
             ]
             t1 = timerpc()
             if self.interface == "multiprocessing":
@@ -226,7 +285,31 @@ class ParFlorisModel(FlorisModel):
                     )
                     sampled_wind_speeds_p = list(sampled_wind_speeds_p)
             t2 = timerpc()
-            sampled_wind_speeds = np.concatenate(sampled_wind_speeds_p, axis=0)
+
+            # Reassemble the points within each wind condition split, then the splits
+            n_point_splits = len(point_id_splits)
+            if return_components:
+                sampled_wind_speeds = tuple(
+                    np.concatenate(
+                        [
+                            np.concatenate(
+                                [r[i] for r in sampled_wind_speeds_p[j:j + n_point_splits]],
+                                axis=1
+                            )
+                            for j in range(0, len(sampled_wind_speeds_p), n_point_splits)
+                        ],
+                        axis=0
+                    )
+                    for i in range(3)
+                )
+            else:
+                sampled_wind_speeds = np.concatenate(
+                    [
+                        np.concatenate(sampled_wind_speeds_p[j:j + n_point_splits], axis=1)
+                        for j in range(0, len(sampled_wind_speeds_p), n_point_splits)
+                    ],
+                    axis=0
+                )
             t3 = timerpc()
             self._print_timings(t0, t1, t2, t3)
 
@@ -243,72 +326,29 @@ class ParFlorisModel(FlorisModel):
             [n_wind_condition_splits, self.core.flow_field.n_findex]
         )
 
-        # Prepare the input arguments for parallel execution
-        fmodel_dict = self.core.as_dict()
+        # Prepare the input arguments for parallel execution. Each split is sent as the
+        # compact state of the model for its wind conditions; see FlorisModel.__getstate__
         wind_condition_id_splits = np.array_split(
             np.arange(self.core.flow_field.n_findex),
             n_wind_condition_splits,
         )
-        multiargs = []
-        for wc_id_split in wind_condition_id_splits:
-            # for ws_id_split in wind_speed_id_splits:
-            fmodel_dict_split = copy.deepcopy(fmodel_dict)
-            wind_directions = self.core.flow_field.wind_directions[wc_id_split]
-            wind_speeds = self.core.flow_field.wind_speeds[wc_id_split]
-            turbulence_intensities = self.core.flow_field.turbulence_intensities[wc_id_split]
-
-            # Extract and format all control setpoints as a dict that can be unpacked later
-            control_setpoints_subset = {
-                "yaw_angles": self.core.farm.yaw_angles[wc_id_split, :],
-                "power_setpoints": self.core.farm.power_setpoints[wc_id_split, :],
-                "awc_modes": self.core.farm.awc_modes[wc_id_split, :],
-                "awc_amplitudes": self.core.farm.awc_amplitudes[wc_id_split, :],
-                "awc_frequencies": self.core.farm.awc_frequencies[wc_id_split, :],
-            }
-            fmodel_dict_split["flow_field"]["wind_directions"] = wind_directions
-            fmodel_dict_split["flow_field"]["wind_speeds"] = wind_speeds
-            fmodel_dict_split["flow_field"]["turbulence_intensities"] = turbulence_intensities
-
-            # Prepare lightweight data to pass along
-            multiargs.append((fmodel_dict_split, control_setpoints_subset))
+        multiargs = [
+            (self._get_core_state(wc_id_split, include_solution=False),)
+            for wc_id_split in wind_condition_id_splits
+        ]
 
         return multiargs
 
     def _postprocessing(self):
-        # Append the remaining flow_fields
-        # Could consider adding a merge method to the FlowField class
-        # to make this easier
-
+        # Merge the solved flow fields returned for the wind condition splits
         if self.return_turbine_powers_only:
             self._stored_turbine_powers = np.vstack(self._turbine_powers_split)
         else:
-            # Ensure fields to set have correct dimensions
-            self.core.flow_field.u = self._fmodels_split[0].core.flow_field.u
-            self.core.flow_field.v = self._fmodels_split[0].core.flow_field.v
-            self.core.flow_field.w = self._fmodels_split[0].core.flow_field.w
-            self.core.flow_field.turbulence_intensity_field = \
-                self._fmodels_split[0].core.flow_field.turbulence_intensity_field
-
-            for fm in self._fmodels_split[1:]:
-                self.core.flow_field.u = np.append(
-                    self.core.flow_field.u,
-                    fm.core.flow_field.u,
-                    axis=0
-                )
-                self.core.flow_field.v = np.append(
-                    self.core.flow_field.v,
-                    fm.core.flow_field.v,
-                    axis=0
-                )
-                self.core.flow_field.w = np.append(
-                    self.core.flow_field.w,
-                    fm.core.flow_field.w,
-                    axis=0
-                )
-                self.core.flow_field.turbulence_intensity_field = np.append(
-                    self.core.flow_field.turbulence_intensity_field,
-                    fm.core.flow_field.turbulence_intensity_field,
-                    axis=0
+            for key in SOLUTION_KEYS:
+                setattr(
+                    self.core.flow_field,
+                    key,
+                    np.concatenate([solution[key] for solution in self._solutions_split], axis=0),
                 )
 
     def _print_timings(self, t0, t1, t2, t3):
@@ -377,29 +417,38 @@ class ParFlorisModel(FlorisModel):
             "The parallelization interface cannot be changed after instantiation."
         )
 
-def _parallel_run(fmodel_dict, set_kwargs) -> FlorisModel:
+def _load_floris_model(core_state) -> FlorisModel:
     """
-    Run the FLORIS model in parallel.
+    Load a FlorisModel from the compact state given by FlorisModel._get_core_state().
 
     Args:
-        fmodel: The FLORIS model to run.
-        set_kwargs: Additional keyword arguments to pass to fmodel.set().
+        core_state: The compact state of the model.
     """
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(**set_kwargs)
-    fmodel.run()
+    fmodel = FlorisModel.__new__(FlorisModel)
+    fmodel.__setstate__(
+        {"configuration": core_state["configuration"], "_wind_data": None, "core": core_state}
+    )
     return fmodel
 
-def _parallel_run_powers_only(fmodel_dict, set_kwargs) -> np.ndarray:
+def _parallel_run(core_state) -> dict:
+    """
+    Run the FLORIS model in parallel, returning only the solved flow field at the turbines.
+
+    Args:
+        core_state: The compact state of the FLORIS model to run.
+    """
+    fmodel = _load_floris_model(core_state)
+    fmodel.run()
+    return {key: getattr(fmodel.core.flow_field, key) for key in SOLUTION_KEYS}
+
+def _parallel_run_powers_only(core_state) -> np.ndarray:
     """
     Run the FLORIS model in parallel, returning only the turbine powers.
 
     Args:
-        fmodel: The FLORIS model to run.
-        set_kwargs: Additional keyword arguments to pass to fmodel.set().
+        core_state: The compact state of the FLORIS model to run.
     """
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(**set_kwargs)
+    fmodel = _load_floris_model(core_state)
     fmodel.run()
     return fmodel.get_turbine_powers()
 
@@ -415,10 +464,27 @@ def _parallel_run_powers_only_map(x):
     """
     return _parallel_run_powers_only(*x)
 
-def _parallel_sample_flow_at_points(fmodel_dict, set_kwargs, x, y, z):
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(**set_kwargs)
-    return fmodel.sample_flow_at_points(x, y, z)
+def _parallel_sample_flow_at_points(
+    core_state,
+    x,
+    y,
+    z,
+    chunk_size=None,
+    max_memory_mb=None,
+    return_components=False,
+    u_initial_mean=None,
+):
+    fmodel = _load_floris_model(core_state)
+    if chunk_size is None and max_memory_mb is not None:
+        chunk_size = fmodel._points_chunk_size(max_memory_mb)
+    return fmodel.core.solve_for_points(
+        x,
+        y,
+        z,
+        chunk_size=chunk_size,
+        return_components=return_components,
+        u_initial_mean=u_initial_mean,
+    )
 
 def _parallel_sample_flow_at_points_map(x):
     """
@@ -0,0 +1,218 @@
+"""
+Low-overhead instrumentation of the FLORIS hot paths. Code marks a stage of the calculation
+with ``with profiler.stage("name", "category"):``. While no :py:class:`Profile` is
+recording, this returns a shared no-op context manager so that the instrumentation costs
+about a function call per stage. While a profile records, every stage adds an event with
+its wall time and, optionally, the array memory it allocated as traced by
+:py:mod:`tracemalloc`, which includes the NumPy array buffers.
+
+Profiles are usually enabled with :py:meth:`floris.FlorisModel.set_profiling` and read
+with :py:meth:`floris.FlorisModel.get_profile`.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+
+import pandas as pd
+
+
+# The profile that is currently recording, if any
+_active: Profile | None = None
+
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    """Context manager that records one event of a :py:class:`Profile`."""
+
+    __slots__ = ("profile", "name", "category", "start", "start_bytes", "peak_bytes")
+
+    def __init__(self, profile: Profile, name: str, category: str):
+        self.profile = profile
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        profile = self.profile
+        if profile.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if profile._stack:
+                # Keep the peak of the enclosing stage before the peak is reset for this one
+                parent = profile._stack[-1]
+                parent.peak_bytes = max(parent.peak_bytes, peak)
+            tracemalloc.reset_peak()
+            self.start_bytes = current
+            self.peak_bytes = current
+        profile._stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        profile = self.profile
+        profile._stack.pop()
+        allocated_bytes = 0
+        if profile.track_memory:
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+            allocated_bytes = self.peak_bytes - self.start_bytes
+            if profile._stack:
+                parent = profile._stack[-1]
+                parent.peak_bytes = max(parent.peak_bytes, self.peak_bytes)
+        profile.events.append(
+            (self.name, self.category, self.start, end - self.start, allocated_bytes)
+        )
+        return False
+
+
+class Profile:
+    """
+    Recorder for the timing and memory events of the instrumented stages.
+
+    Args:
+        track_memory (bool, optional): If True, record the peak array memory allocated in
+            each stage with tracemalloc. This slows the calculations considerably. Defaults
+            to False.
+
+    Attributes:
+        events (list): The recorded events, in order of completion, as tuples of the stage
+            name, category, start time (ns), duration (ns) and peak allocated bytes.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.events = []
+        self._stack = []
+        self._origin = time.perf_counter_ns()
+
+    def stage(self, name: str, category: str = "floris") -> _Stage:
+        return _Stage(self, name, category)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_stack"] = []
+        return state
+
+    def reset(self) -> None:
+        """Discard the recorded events."""
+        self.events = []
+        self._origin = time.perf_counter_ns()
+
+    def report(self) -> pd.DataFrame:
+        """
+        Aggregate the events per stage.
+
+        Returns:
+            pd.DataFrame: One row per stage, in order of first completion, with the stage
+            category, the number of calls, the total, mean and maximum wall time (s) and the
+            largest peak of allocated array memory (bytes) of a single call. The memory is 0
+            unless the profile tracks memory.
+        """
+        columns = ["stage", "category", "start", "duration", "allocated_bytes"]
+        df = pd.DataFrame(self.events, columns=columns)
+        df["duration"] = df["duration"] * 1e-9
+        report = df.groupby(["stage", "category"], sort=False).agg(
+            calls=("duration", "size"),
+            total_time=("duration", "sum"),
+            mean_time=("duration", "mean"),
+            max_time=("duration", "max"),
+            peak_allocated_bytes=("allocated_bytes", "max"),
+        )
+        return report.reset_index(level="category")
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Convert the events to the Chrome trace event format, which can be viewed with
+        chrome://tracing or https://ui.perfetto.dev.
+
+        Returns:
+            dict: The trace, with one complete ("X") event per recorded event.
+        """
+        trace_events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e-3,
+                "dur": duration * 1e-3,
+                "pid": 0,
+                "tid": 0,
+                "args": {"allocated_bytes": allocated_bytes},
+            }
+            for name, category, start, duration, allocated_bytes in self.events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, filename: str | Path) -> None:
+        """
+        Write the events to a JSON file in the Chrome trace event format.
+
+        Args:
+            filename (str | Path): The output file.
+        """
+        with open(filename, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def stage(name: str, category: str = "floris"):
+    """
+    Mark a stage of the calculation to be recorded by the active profile.
+
+    Args:
+        name (str): The name of the stage.
+        category (str, optional): The category of the stage, for example the module that
+            it belongs to. Defaults to "floris".
+
+    Returns:
+        A context manager for the stage, which does nothing if no profile is recording.
+    """
+    if _active is None:
+        return _NULL_STAGE
+    return _Stage(_active, name, category)
+
+
+def recording(profile: Profile | None):
+    """
+    Make a profile the active profile for the duration of a with block, starting tracemalloc
+    if the profile tracks memory. If the profile is None, the active profile, if any, is
+    kept so that models run within a profiled model are recorded too.
+
+    Args:
+        profile (Profile | None): The profile to record to.
+
+    Returns:
+        A context manager that activates the profile.
+    """
+    if profile is None:
+        return _NULL_STAGE
+    return _Recording(profile)
+
+
+class _Recording:
+    """Context manager that activates a :py:class:`Profile`; see :py:func:`recording`."""
+
+    __slots__ = ("profile", "previous", "started_tracemalloc")
+
+    def __init__(self, profile: Profile):
+        self.profile = profile
+
+    def __enter__(self):
+        global _active
+        self.previous = _active
+        self.started_tracemalloc = False
+        if self.profile.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        _active = self.profile
+        return self.profile
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self.previous
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+        return False
@@ -158,19 +158,21 @@ def convert_to_path(fn: str | Path) -> Path:
     if isinstance(fn, str):
         fn = Path(fn)
 
-    # Get the base path from where the analysis script was run to determine the relative
-    # path from which `fn` might be based. [1] is where a direct call to this function will be
-    # located (e.g., testing via pytest), and [-1] is where a direct call to the function via an
-    # analysis script will be located (e.g., running an example).
-    base_fn_script = Path(inspect.stack()[-1].filename).resolve().parent
-    base_fn_sys = Path(inspect.stack()[1].filename).resolve().parent
-
     if isinstance(fn, Path):
         absolute_fn = fn.resolve()
-        relative_fn_script = (base_fn_script / fn).resolve()
-        relative_fn_sys = (base_fn_sys / fn).resolve()
         if absolute_fn.exists():
             return absolute_fn
+
+        # Get the base path from where the analysis script was run to determine the relative
+        # path from which `fn` might be based. [1] is where a direct call to this function will
+        # be located (e.g., testing via pytest), and [-1] is where a direct call to the function
+        # via an analysis script will be located (e.g., running an example). Inspecting the
+        # stack is slow, so it is only done when `fn` is not found directly.
+        stack = inspect.stack()
+        base_fn_script = Path(stack[-1].filename).resolve().parent
+        base_fn_sys = Path(stack[1].filename).resolve().parent
+        relative_fn_script = (base_fn_script / fn).resolve()
+        relative_fn_sys = (base_fn_sys / fn).resolve()
         if relative_fn_script.exists():
             return relative_fn_script
         if relative_fn_sys.exists():
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import (
     Any,
@@ -8,6 +9,9 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
+from scipy.optimize import nnls
+from scipy.sparse import csr_matrix
 
 from floris import FlorisModel
 from floris.core import State
@@ -32,6 +36,17 @@ from floris.wind_data import (
 )
 
 
+# Arguments of set() that only change the operation of the turbines
+OPERATION_KWARGS = {
+    "yaw_angles",
+    "power_setpoints",
+    "awc_modes",
+    "awc_amplitudes",
+    "awc_frequencies",
+    "disable_turbines",
+}
+
+
 class UncertainFlorisModel(LoggingManager):
     """
     An interface for handling uncertainty in wind farm simulations.
@@ -63,6 +78,7 @@ class UncertainFlorisModel(LoggingManager):
         wd_std (float, optional): The standard deviation of wind direction. Defaults to 3.0.
         wd_sample_points (list[float], optional): The sample points for wind direction.
             If not provided, defaults to [-2 * wd_std, -1 * wd_std, 0, wd_std, 2 * wd_std].
+            Ignored if n_quadrature_points is provided.
         fix_yaw_to_nominal_direction (bool, optional): Fix the yaw angle to the nominal
             direction?   When False, the yaw misalignment is the same across the sampled wind
             directions. When True, the turbine orientation is fixed to the nominal wind
@@ -84,6 +100,7 @@ class UncertainFlorisModel(LoggingManager):
         wd_sample_points=None,
         fix_yaw_to_nominal_direction=False,
         verbose=False,
+        n_quadrature_points=None,
     ):
         # Save these inputs
         self.wd_resolution = wd_resolution
@@ -95,17 +112,24 @@ class UncertainFlorisModel(LoggingManager):
         self.wd_std = wd_std
         self.fix_yaw_to_nominal_direction = fix_yaw_to_nominal_direction
         self.verbose = verbose
+        self.n_quadrature_points = n_quadrature_points
+
+        if n_quadrature_points is not None:
+            # Get the sample points and weights from the quadrature
+            wd_sample_points, self.weights = self._get_quadrature(
+                self.wd_std, n_quadrature_points, self.wd_resolution
+            )
+        else:
+            # If wd_sample_points, default to 1 and 2 std
+            if wd_sample_points is None:
+                wd_sample_points = [-2 * wd_std, -1 * wd_std, 0, wd_std, 2 * wd_std]
 
-        # If wd_sample_points, default to 1 and 2 std
-        if wd_sample_points is None:
-            wd_sample_points = [-2 * wd_std, -1 * wd_std, 0, wd_std, 2 * wd_std]
+            # Get the weights
+            self.weights = self._get_weights(self.wd_std, wd_sample_points)
 
         self.wd_sample_points = wd_sample_points
         self.n_sample_points = len(self.wd_sample_points)
 
-        # Get the weights
-        self.weights = self._get_weights(self.wd_std, self.wd_sample_points)
-
         # Instantiate the un-expanded FlorisModel
         if isinstance(configuration, (FlorisModel, ParFlorisModel)):
             self.fmodel_unexpanded = configuration.copy()
@@ -132,6 +156,16 @@ class UncertainFlorisModel(LoggingManager):
         Args:
             **kwargs: The wind farm conditions to set.
         """
+        # When only the operation changes, reuse the expansion of the wind conditions
+        if (
+            kwargs
+            and set(kwargs) <= OPERATION_KWARGS
+            and hasattr(self, "fmodel_expanded")
+        ):
+            self.fmodel_unexpanded.set_operation(**kwargs)
+            self._set_uncertain_operation()
+            return
+
         # Call the nominal set function
         self.fmodel_unexpanded.set(**kwargs)
 
@@ -189,12 +223,16 @@ class UncertainFlorisModel(LoggingManager):
             self.fmodel_unexpanded.core.farm.n_turbines,
         )
         self.n_expanded = self._expanded_wind_directions.shape[0]
+        self._expanded_conditions = self._expanded_wind_directions[:, :3].copy()
 
         # Get the unique inputs
         self.unique_inputs, self.map_to_expanded_inputs = self._get_unique_inputs(
             self._expanded_wind_directions
         )
         self.n_unique = self.unique_inputs.shape[0]
+        self.weight_matrix = weight_matrix_uncertain(
+            self.map_to_expanded_inputs, self.weights, self.n_unexpanded, self.n_unique
+        )
 
         # Display info on sizes
         if self.verbose:
@@ -223,6 +261,95 @@ class UncertainFlorisModel(LoggingManager):
             ],
         )
 
+    def _set_uncertain_operation(self):
+        """
+        Update the expanded FlorisModel for new operation setpoints of the unexpanded
+        FlorisModel, reusing the expanded wind conditions of the last call to
+        _set_uncertain(). Unique rows are found by hashing quantized integer keys rather
+        than by sorting, and if the unique wind conditions are unchanged only the
+        setpoints of the expanded FlorisModel are updated.
+        """
+        n_turbines = self.fmodel_unexpanded.core.farm.n_turbines
+        self.yaw_angles_unexpanded = self.fmodel_unexpanded.core.farm.yaw_angles
+        self.power_setpoints_unexpanded = self.fmodel_unexpanded.core.farm.power_setpoints
+        self.awc_amplitudes_unexpanded = self.fmodel_unexpanded.core.farm.awc_amplitudes
+        self.unexpanded_inputs = np.hstack(
+            (
+                self.unexpanded_inputs[:, :3],
+                self.yaw_angles_unexpanded,
+                self.power_setpoints_unexpanded,
+                self.awc_amplitudes_unexpanded,
+            )
+        )
+        self.rounded_inputs = self._get_rounded_inputs(
+            self.unexpanded_inputs,
+            self.wd_resolution,
+            self.ws_resolution,
+            self.ti_resolution,
+            self.yaw_resolution,
+            self.power_setpoint_resolution,
+            self.awc_amplitude_resolution,
+        )
+
+        # Expand the setpoints in the same order as _expand_wind_directions()
+        expanded_setpoints = np.tile(self.rounded_inputs[:, 3:], (self.n_sample_points, 1))
+        if self.fix_yaw_to_nominal_direction:
+            expanded_setpoints[:, :n_turbines] = wrap_180(
+                expanded_setpoints[:, :n_turbines]
+                + np.repeat(self.wd_sample_points, self.n_unexpanded)[:, None]
+            )
+        self._expanded_wind_directions = np.hstack(
+            (self._expanded_conditions, expanded_setpoints)
+        )
+
+        # Get the unique inputs
+        resolutions = np.concatenate(
+            [
+                [self.wd_resolution, self.ws_resolution, self.ti_resolution],
+                np.full(n_turbines, self.yaw_resolution),
+                np.full(n_turbines, self.power_setpoint_resolution),
+                np.full(n_turbines, self.awc_amplitude_resolution),
+            ]
+        )
+        self.unique_inputs, self.map_to_expanded_inputs = self._get_unique_inputs_hashed(
+            self._expanded_wind_directions, resolutions
+        )
+        n_unique_previous = self.n_unique
+        self.n_unique = self.unique_inputs.shape[0]
+        self.weight_matrix = weight_matrix_uncertain(
+            self.map_to_expanded_inputs, self.weights, self.n_unexpanded, self.n_unique
+        )
+
+        if self.verbose:
+            print(f"Original num rows: {self.n_unexpanded}")
+            print(f"Expanded num rows: {self.n_expanded}")
+            print(f"Unique num rows: {self.n_unique}")
+
+        yaw_angles = self.unique_inputs[:, 3 : 3 + n_turbines]
+        power_setpoints = self.unique_inputs[:, 3 + n_turbines : 3 + 2 * n_turbines]
+        awc_amplitudes = self.unique_inputs[:, 3 + 2 * n_turbines : 3 + 3 * n_turbines]
+        flow_field = self.fmodel_expanded.core.flow_field
+        if (
+            self.n_unique == n_unique_previous
+            and np.array_equal(self.unique_inputs[:, 0], flow_field.wind_directions)
+            and np.array_equal(self.unique_inputs[:, 1], flow_field.wind_speeds)
+            and np.array_equal(self.unique_inputs[:, 2], flow_field.turbulence_intensities)
+        ):
+            self.fmodel_expanded.set_operation(
+                yaw_angles=yaw_angles,
+                power_setpoints=power_setpoints,
+                awc_amplitudes=awc_amplitudes,
+            )
+        else:
+            self.fmodel_expanded.set(
+                wind_directions=self.unique_inputs[:, 0],
+                wind_speeds=self.unique_inputs[:, 1],
+                turbulence_intensities=self.unique_inputs[:, 2],
+                yaw_angles=yaw_angles,
+                power_setpoints=power_setpoints,
+                awc_amplitudes=awc_amplitudes,
+            )
+
     def reset_operation(self):
         """
         Reset the operation of the underlying FlorisModel object.
@@ -262,17 +389,63 @@ class UncertainFlorisModel(LoggingManager):
 
         """
 
-        # Pass to off-class function
-        result = map_turbine_powers_uncertain(
-            unique_turbine_powers=self.fmodel_expanded._get_turbine_powers(),
-            map_to_expanded_inputs=self.map_to_expanded_inputs,
-            weights=self.weights,
-            n_unexpanded=self.n_unexpanded,
-            n_sample_points=self.n_sample_points,
-            n_turbines=self.fmodel_unexpanded.core.farm.n_turbines,
-        )
+        return self._map_to_unexpanded(self.fmodel_expanded._get_turbine_powers())
 
-        return result
+    def _map_to_unexpanded(self, unique_values):
+        """
+        Combine values computed for the unique conditions into their weighted sum for each
+        unexpanded condition, with a single product with the sparse weight matrix.
+
+        Args:
+            unique_values (NDArrayFloat): Values with shape (n_unique, ...).
+
+        Returns:
+            NDArrayFloat: The weighted values with shape (n_unexpanded, ...).
+        """
+        unique_values = np.asarray(unique_values)
+        result = self.weight_matrix @ unique_values.reshape(self.n_unique, -1)
+        return result.reshape((self.n_unexpanded,) + unique_values.shape[1:])
+
+    def get_turbine_thrust_coefficients(self):
+        """
+        Calculate the thrust coefficient of each turbine, averaged over the wind direction
+        uncertainty.
+
+        Returns:
+            NDArrayFloat: The thrust coefficients with shape (n_findex, n_turbines).
+        """
+        return self._map_to_unexpanded(self.fmodel_expanded.get_turbine_thrust_coefficients())
+
+    def get_turbine_ais(self):
+        """
+        Calculate the axial induction factor of each turbine, averaged over the wind
+        direction uncertainty.
+
+        Returns:
+            NDArrayFloat: The axial induction factors with shape (n_findex, n_turbines).
+        """
+        return self._map_to_unexpanded(self.fmodel_expanded.get_turbine_ais())
+
+    def get_turbine_TIs(self):
+        """
+        Get the turbulence intensity at each turbine, averaged over the wind direction
+        uncertainty.
+
+        Returns:
+            NDArrayFloat: The turbulence intensities with shape (n_findex, n_turbines).
+        """
+        return self._map_to_unexpanded(self.fmodel_expanded.get_turbine_TIs())
+
+    @property
+    def turbine_average_velocities(self):
+        """
+        Rotor-averaged velocity of each turbine, averaged over the wind direction
+        uncertainty.
+
+        Returns:
+            NDArrayFloat: The velocities with shape (n_findex, n_turbines).
+        """
+        return self._map_to_unexpanded(self.fmodel_expanded.turbine_average_velocities)
 
     def get_turbine_powers(self):
         """
@@ -910,6 +1083,45 @@ class UncertainFlorisModel(LoggingManager):
 
         return unique_inputs, map_to_expanded_inputs
 
+    def _get_unique_inputs_hashed(self, input_array, resolutions):
+        """
+        Finds unique rows in the input numpy array, as _get_unique_inputs(), by hashing
+        rather than sorting the rows. Each column is quantized to integer keys at a
+        thousandth of its resolution, the keys of each row are hashed to a single integer,
+        and the hashes are factorized. Unique rows are returned in order of first
+        appearance.
+
+        Args:
+            input_array (numpy.ndarray): Input array of shape (m, n).
+            resolutions (numpy.ndarray): The resolution of each of the n columns.
+
+        Returns:
+            tuple: A tuple containing:
+                numpy.ndarray: An array of unique rows found in the input_array, of shape (r, n),
+                            where r <= m.
+                numpy.ndarray: A 1D array of indices mapping each row of the input_array
+                            to the corresponding row in the unique_inputs array.
+        """
+        keys = np.round(input_array / (resolutions / 1000.0)).astype(np.int64)
+
+        # Hash each row with random odd multipliers (wrapping around 2^64)
+        multipliers = np.random.default_rng(0).integers(
+            1, 2**62, size=keys.shape[1], dtype=np.int64
+        ) * 2 + 1
+        hashes = (keys.view(np.uint64) * multipliers.view(np.uint64)).sum(axis=1)
+        map_to_expanded_inputs, _ = pd.factorize(hashes)
+        first_index = np.empty(map_to_expanded_inputs.max() + 1, dtype=int)
+        first_index[map_to_expanded_inputs[::-1]] = np.arange(len(keys))[::-1]
+
+        # Fall back to sorting in the unlikely event of a hash collision
+        if not np.array_equal(keys[first_index][map_to_expanded_inputs], keys):
+            _, first_index, map_to_expanded_inputs = np.unique(
+                keys, axis=0, return_index=True, return_inverse=True
+            )
+            map_to_expanded_inputs = np.reshape(map_to_expanded_inputs, -1)
+
+        return input_array[first_index], map_to_expanded_inputs
+
     def _get_weights(self, wd_std, wd_sample_points):
         """Generates weights based on a Gaussian distribution sampled at specific x-locations.
 
@@ -932,6 +1144,117 @@ class UncertainFlorisModel(LoggingManager):
 
         return weights
 
+    def _get_quadrature(self, wd_std, n_points, wd_resolution):
+        """Generates sample points and weights of a Gauss-Hermite quadrature of a Gaussian
+        distribution, with the sample points snapped to multiples of wd_resolution.
+
+        Snapping moves the nodes away from those of the exact quadrature, so the weights
+        are then recomputed (non-negative, by least squares) to match as many even moments
+        of the distribution as there are distinct nonzero nodes. Nodes that coincide after
+        snapping are merged.
+
+        Args:
+            wd_std (float): The standard deviation of the Gaussian distribution.
+            n_points (int): The number of quadrature nodes, which must be odd so that
+                the nominal wind direction is a node.
+            wd_resolution (float): The resolution the nodes are snapped to.
+
+        Returns:
+            tuple: The sample points, symmetric about 0, and their weights, which sum to 1.
+        """
+        if n_points < 1 or n_points % 2 != 1:
+            raise ValueError("n_quadrature_points must be a positive odd integer.")
+
+        # Nodes of the Gauss-Hermite quadrature, scaled to the standard deviation
+        nodes, _ = np.polynomial.hermite.hermgauss(n_points)
+        nodes = np.sqrt(2.0) * wd_std * nodes
+
+        # Snap the non-negative nodes to the resolution and merge coinciding nodes
+        half_nodes = np.unique(
+            np.round(nodes[n_points // 2 :] / wd_resolution) * wd_resolution
+        ) + 0.0
+
+        # Weight of 0 and of each symmetric pair of nodes, matching the even moments
+        # E[x^(2j)] = wd_std^(2j) (2j - 1)!!, each scaled to 1
+        n_moments = len(half_nodes)
+        j = np.arange(n_moments)
+        moments = wd_std ** (2 * j) * np.array(
+            [np.prod(np.arange(2 * k - 1, 0, -2), dtype=float) for k in j]
+        )
+        vandermonde = half_nodes[None, :] ** (2 * j[:, None])
+        vandermonde[:, 1:] *= 2.0
+        pair_weights, _ = nnls(vandermonde / moments[:, None], np.ones(n_moments))
+
+        sample_points = np.concatenate([-half_nodes[:0:-1], half_nodes])
+        weights = np.concatenate([pair_weights[:0:-1], pair_weights])
+        weights = weights / np.sum(weights)
+
+        return sample_points, weights
+
+    def get_sampling_error(self, wd_sample_points_dense=None):
+        """
+        Report the error of the wind direction sampling of this model against a dense
+        sampling of the same wind direction distribution, for the current conditions and
+        operation. Both models are run, so this costs a run of each.
+
+        Args:
+            wd_sample_points_dense (list[float], optional): The sample points of the dense
+                sampling, weighted as with wd_sample_points. Defaults to None, in which case
+                sample points every wd_resolution out to 3 * wd_std are used.
+
+        Returns:
+            dict: The maximum absolute difference in farm power relative to the dense farm
+            power across findices ("max_farm_power_error"), and the relative difference of
+            the expected farm power ("expected_farm_power_error").
+        """
+        if wd_sample_points_dense is None:
+            n_half = int(np.ceil(3 * self.wd_std / self.wd_resolution))
+            wd_sample_points_dense = np.arange(-n_half, n_half + 1) * self.wd_resolution
+
+        ufmodel_dense = UncertainFlorisModel(
+            self.fmodel_unexpanded,
+            wd_resolution=self.wd_resolution,
+            ws_resolution=self.ws_resolution,
+            ti_resolution=self.ti_resolution,
+            yaw_resolution=self.yaw_resolution,
+            power_setpoint_resolution=self.power_setpoint_resolution,
+            awc_amplitude_resolution=self.awc_amplitude_resolution,
+            wd_std=self.wd_std,
+            wd_sample_points=list(wd_sample_points_dense),
+            fix_yaw_to_nominal_direction=self.fix_yaw_to_nominal_direction,
+        )
+        ufmodel_dense.set(
+            yaw_angles=self.yaw_angles_unexpanded,
+            power_setpoints=self.power_setpoints_unexpanded,
+            awc_amplitudes=self.awc_amplitudes_unexpanded,
+        )
+        ufmodel_dense.run()
+        self.run()
+
+        farm_power = self._get_farm_power()
+        farm_power_dense = ufmodel_dense._get_farm_power()
+        if self.fmodel_unexpanded.wind_data is None:
+            freq = np.full(self.n_unexpanded, 1.0 / self.n_unexpanded)
+        else:
+            freq = self.fmodel_unexpanded.wind_data.unpack_freq()
+        expected_farm_power = np.nansum(freq * farm_power)
+        expected_farm_power_dense = np.nansum(freq * farm_power_dense)
+
+        sampling_error = {
+            "max_farm_power_error": np.max(
+                np.abs(farm_power - farm_power_dense) / np.maximum(farm_power_dense, 1e-12)
+            ),
+            "expected_farm_power_error": (
+                (expected_farm_power - expected_farm_power_dense) / expected_farm_power_dense
+            ),
+        }
+        if self.verbose:
+            print(f"Rows run: {self.n_unique} (dense sampling: {ufmodel_dense.n_unique})")
+            print(f"Max farm power error: {sampling_error['max_farm_power_error']:.2e}")
+            print(f"Expected farm power error: {sampling_error['expected_farm_power_error']:.2e}")
+
+        return sampling_error
+
     def get_operation_model(self) -> str:
         """Get the operation model of a FlorisModel.
 
@@ -956,7 +1279,9 @@ class UncertainFlorisModel(LoggingManager):
         if isinstance(operation_model, str):
             if len(self.fmodel_unexpanded.core.farm.turbine_type) == 1:
                 # Set a single one here, then, and return
-                turbine_type = self.fmodel_unexpanded.core.farm.turbine_definitions[0]
+                turbine_type = copy.deepcopy(
+                    self.fmodel_unexpanded.core.farm.turbine_definitions[0]
+                )
                 turbine_type["operation_model"] = operation_model
                 self.set(
                     turbine_type=[turbine_type],
@@ -971,7 +1296,7 @@ class UncertainFlorisModel(LoggingManager):
                 "The length of the operation_model list must be " "equal to the number of turbines."
             )
 
-        turbine_type_list = self.fmodel_unexpanded.core.farm.turbine_definitions
+        turbine_type_list = copy.deepcopy(self.fmodel_unexpanded.core.farm.turbine_definitions)
 
         for tindex in range(self.fmodel_unexpanded.core.farm.n_turbines):
             turbine_type_list[tindex]["turbine_type"] = (
@@ -998,6 +1323,7 @@ class UncertainFlorisModel(LoggingManager):
             wd_sample_points=self.wd_sample_points,
             fix_yaw_to_nominal_direction=self.fix_yaw_to_nominal_direction,
             verbose=self.verbose,
+            n_quadrature_points=self.n_quadrature_points,
         )
 
     def get_param(self, param: List[str], param_idx: Optional[int] = None) -> Any:
@@ -1150,26 +1476,42 @@ def map_turbine_powers_uncertain(
 
     """
 
-    # Expand back to the expanded value
-    expanded_turbine_powers = unique_turbine_powers[map_to_expanded_inputs]
+    weight_matrix = weight_matrix_uncertain(
+        map_to_expanded_inputs, weights, n_unexpanded, unique_turbine_powers.shape[0]
+    )
 
-    # Reshape the weights array to make it compatible with broadcasting
-    weights_reshaped = weights[:, np.newaxis]
+    return weight_matrix @ unique_turbine_powers
 
-    # Reshape expanded_turbine_powers into blocks
-    blocks = np.reshape(
-        expanded_turbine_powers,
-        (n_unexpanded, n_sample_points, n_turbines),
-        order="F",
-    )
 
-    # Multiply each block by the corresponding weight
-    weighted_blocks = blocks * weights_reshaped
+def weight_matrix_uncertain(map_to_expanded_inputs, weights, n_unexpanded, n_unique):
+    """Builds the sparse matrix that maps values for the unique conditions to their
+    weighted sum over the wind direction sample points of each unexpanded condition.
 
-    # Sum the blocks along the second axis
-    result = np.sum(weighted_blocks, axis=1)
+    The expanded conditions are ordered by sample point, then by unexpanded condition, so
+    that expanded condition i * n_unexpanded + j is sample point i of condition j. Expanded
+    conditions that share a unique condition have their weights summed.
 
-    return result
+    Args:
+        map_to_expanded_inputs (NDArrayFloat): An array of indices mapping the unique
+            conditions to the expanded conditions
+        weights (NDArrayFloat): An array of weights for each wind direction sample point
+        n_unexpanded (int): The number of unexpanded conditions
+        n_unique (int): The number of unique conditions
+
+    Returns:
+        scipy.sparse.csr_matrix: The weight matrix with shape (n_unexpanded, n_unique).
+    """
+    n_sample_points = len(weights)
+    return csr_matrix(
+        (
+            np.repeat(weights, n_unexpanded),
+            (
+                np.tile(np.arange(n_unexpanded), n_sample_points),
+                np.reshape(map_to_expanded_inputs, -1),
+            ),
+        ),
+        shape=(n_unexpanded, n_unique),
+    )
 
 
 class ApproxFlorisModel(UncertainFlorisModel):
@@ -1,8 +1,11 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from math import ceil
+from pathlib import Path
 from typing import (
     Any,
     Dict,
@@ -232,10 +235,14 @@ def rotate_coordinates_rel_west(
         wind_directions (NDArrayFloat): Series of wind directions to base the rotation.
         coordinates (NDArrayFloat): Series of coordinates to rotate with shape (N coordinates, 3)
             so that each element of the array coordinates[i] yields a three-component coordinate.
+            Coordinates that differ between conditions can be given with shape
+            (n_findex, N coordinates, 3).
         x_center_of_rotation (float, optional): The x-coordinate for the rotation center of the
-            input coordinates. Defaults to None.
+            input coordinates, or an array of shape (n_findex, 1) for each condition. Defaults
+            to None.
         y_center_of_rotation (float, optional): The y-coordinate for the rotational center of the
-            input coordinates. Defaults to None.
+            input coordinates, or an array of shape (n_findex, 1) for each condition. Defaults
+            to None.
     """
 
     # Calculate the difference in given wind direction from 270 / West
@@ -243,13 +250,24 @@ def rotate_coordinates_rel_west(
     wind_deviation_from_west = np.reshape(wind_deviation_from_west, (len(wind_directions), 1))
 
     # Construct the arrays storing the turbine locations
-    x_coordinates, y_coordinates, z_coordinates = coordinates.T
-
-    # Find center of rotation - this is the center of box bounding all of the turbines
+    x_coordinates, y_coordinates, z_coordinates = np.moveaxis(coordinates, -1, 0)
+
+    # Find center of rotation - this is the center of box bounding all of the turbines.
+    # Coordinates that differ between conditions are rotated about the center of each
+    # condition, with shape (n_findex, 1), so that each condition is rotated independently
+    # of the others.
+    axis = -1 if np.ndim(x_coordinates) > 1 else None
+    keepdims = axis is not None
     if x_center_of_rotation is None:
-        x_center_of_rotation = (np.min(x_coordinates) + np.max(x_coordinates)) / 2
+        x_center_of_rotation = (
+            np.min(x_coordinates, axis=axis, keepdims=keepdims)
+            + np.max(x_coordinates, axis=axis, keepdims=keepdims)
+        ) / 2
     if y_center_of_rotation is None:
-        y_center_of_rotation = (np.min(y_coordinates) + np.max(y_coordinates)) / 2
+        y_center_of_rotation = (
+            np.min(y_coordinates, axis=axis, keepdims=keepdims)
+            + np.max(y_coordinates, axis=axis, keepdims=keepdims)
+        ) / 2
 
     # Rotate turbine coordinates about the center
     x_coord_offset = x_coordinates - x_center_of_rotation
@@ -290,41 +308,37 @@ def reverse_rotate_coordinates_rel_west(
         grid_y (NDArrayFloat): Y-coordinates to be rotated.
         grid_z (NDArrayFloat): Z-coordinates to be rotated.
         x_center_of_rotation (float): The x-coordinate for the rotation center of the
-            input coordinates.
+            input coordinates, or an array of shape (n_findex, 1) for each condition.
         y_center_of_rotation (float): The y-coordinate for the rotational center of the
-            input coordinates.
+            input coordinates, or an array of shape (n_findex, 1) for each condition.
     """
     # Calculate the difference in given wind direction from 270 / West
     # We are rotating in the other direction
     wind_deviation_from_west = -1.0 * wind_delta(wind_directions)
 
-    # Construct the arrays storing the turbine locations
-    grid_x_reversed = np.zeros_like(grid_x)
-    grid_y_reversed = np.zeros_like(grid_x)
-    grid_z_reversed = np.zeros_like(grid_x)
-    for wii, angle_rotation in enumerate(wind_deviation_from_west):
-        x_rot = grid_x[wii]
-        y_rot = grid_y[wii]
-        z_rot = grid_z[wii]
-
-        # Rotate turbine coordinates about the center
-        x_rot_offset = x_rot - x_center_of_rotation
-        y_rot_offset = y_rot - y_center_of_rotation
-        x = (
-            x_rot_offset * cosd(angle_rotation)
-            - y_rot_offset * sind(angle_rotation)
-            + x_center_of_rotation
-        )
-        y = (
-            x_rot_offset * sind(angle_rotation)
-            + y_rot_offset * cosd(angle_rotation)
-            + y_center_of_rotation
-        )
-        z = z_rot  # Nothing changed in this rotation
+    # Expand the rotation angles and the centers of each condition to the dimensions of the
+    # grid
+    expanded_shape = (-1,) + (1,) * (np.ndim(grid_x) - 1)
+    angle_rotation = np.reshape(wind_deviation_from_west, expanded_shape)
+    if np.ndim(x_center_of_rotation) > 0:
+        x_center_of_rotation = np.reshape(x_center_of_rotation, expanded_shape)
+    if np.ndim(y_center_of_rotation) > 0:
+        y_center_of_rotation = np.reshape(y_center_of_rotation, expanded_shape)
 
-        grid_x_reversed[wii] = x
-        grid_y_reversed[wii] = y
-        grid_z_reversed[wii] = z
+    # Rotate turbine coordinates about the center
+    x_rot_offset = grid_x - x_center_of_rotation
+    y_rot_offset = grid_y - y_center_of_rotation
+    grid_x_reversed = (
+        x_rot_offset * cosd(angle_rotation)
+        - y_rot_offset * sind(angle_rotation)
+        + x_center_of_rotation
+    )
+    grid_y_reversed = (
+        x_rot_offset * sind(angle_rotation)
+        + y_rot_offset * cosd(angle_rotation)
+        + y_center_of_rotation
+    )
+    grid_z_reversed = np.array(grid_z, dtype=float, copy=True)  # Nothing changed in this rotation
 
     return grid_x_reversed, grid_y_reversed, grid_z_reversed
 
@@ -352,6 +366,46 @@ def load_yaml(filename, loader=Loader):
         return yaml.load(fid, loader)
 
 
+# Number of parsed files kept by the process-wide file caches
+FILE_CACHE_SIZE = 32
+
+
+def file_cache_key(filename) -> tuple:
+    """
+    Key that identifies the contents of a file for the process-wide file caches: the resolved
+    path with the modification time and size of the file, so that a changed file is read again.
+
+    Args:
+        filename (str | Path): The file path.
+
+    Returns:
+        tuple: The resolved path, modification time (ns) and size (bytes) of the file.
+    """
+    path = Path(filename).resolve()
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=FILE_CACHE_SIZE)
+def _load_yaml_cached(cache_key: tuple, loader):
+    return load_yaml(cache_key[0], loader)
+
+
+def load_yaml_cached(filename, loader=Loader):
+    """
+    Load a YAML file, reusing the result of an earlier load of the unchanged file in this
+    process. Files included with ``!include`` are not checked for changes.
+
+    Args:
+        filename (str | Path): The file path.
+        loader (yaml.Loader, optional): The YAML loader. Defaults to Loader.
+
+    Returns:
+        Any: A copy of the loaded data that can be modified by the caller.
+    """
+    return copy.deepcopy(_load_yaml_cached(file_cache_key(filename), loader))
+
+
 def round_nearest_2_or_5(x: int | float) -> int:
     """Rounds a number (with a 0.5 buffer) up to the nearest integer divisible by 2 or 5.
 
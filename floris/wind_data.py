@@ -6,8 +6,6 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import List
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.api.types import CategoricalDtype
@@ -739,6 +737,8 @@ class WindRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted wind rose.
         """
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
 
         # Get a aggregated (downsampled) wind_rose
         wind_rose_aggregate = self.downsample(wd_step, ws_step, inplace=False)
@@ -852,6 +852,7 @@ class WindRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted turbulence intensities as a function of wind speed.
         """
+        import matplotlib.pyplot as plt
 
         # TODO: Plot mean and std. devs. of TI in each ws bin in addition to
         # individual points
@@ -956,6 +957,7 @@ class WindRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted value as a function of wind speed.
         """
+        import matplotlib.pyplot as plt
 
         # TODO: Plot mean and std. devs. of value in each ws bin in addition to
         # individual points
@@ -1780,6 +1782,8 @@ class WindTIRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted wind rose.
         """
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
 
         if wind_rose_var not in {"ws", "ti"}:
             raise ValueError(
@@ -1866,6 +1870,7 @@ class WindTIRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted mean turbulence intensities as a function of wind speed.
         """
+        import matplotlib.pyplot as plt
 
         # TODO: Plot individual points and std. devs. of TI in addition to mean
         # values
@@ -1975,6 +1980,7 @@ class WindTIRose(WindDataBase):
             :py:class:`matplotlib.pyplot.axes`: A figure axes object containing
             the plotted value as a function of wind speed.
         """
+        import matplotlib.pyplot as plt
 
         # TODO: Plot mean and std. devs. of value in each ws bin in addition to
         # individual points
@@ -3232,6 +3238,7 @@ class WindRoseWRG(WindDataBase):
             wd_step (float, optional): Step size for wind direction. Defaults to None.
             ws_step (float, optional): Step size for wind speed. Defaults to None.
         """
+        import matplotlib.pyplot as plt
 
         if self.layout_x is None:
             raise ValueError("WindRoseByTurbine must be initialized to a layout before plotting")
@@ -6,18 +6,18 @@ import matplotlib.pyplot as plt
 import numpy as np
 from conftest import SampleInputs
 
-from floris.simulation import Floris
+from floris import FlorisModel
 
 
 def time_vec(input_dict):
-    start = time.time()
-    floris = Floris(input_dict=input_dict.core)
-    end = time.time()
+    start = time.perf_counter()
+    fmodel = FlorisModel(input_dict.core)
+    end = time.perf_counter()
     init_time = end - start
 
-    start = time.time()
-    floris.steady_state_atmospheric_condition()
-    end = time.time()
+    start = time.perf_counter()
+    fmodel.run()
+    end = time.perf_counter()
     calc_time = end - start
 
     return init_time, calc_time
@@ -31,15 +31,16 @@ def time_serial(input_dict, wd, ws):
 
         input_dict.core["flow_field"]["wind_directions"] = [d]
         input_dict.core["flow_field"]["wind_speeds"] = [s]
+        input_dict.core["flow_field"]["turbulence_intensities"] = [0.06]
 
-        start = time.time()
-        floris = Floris(input_dict=input_dict.core)
-        end = time.time()
+        start = time.perf_counter()
+        fmodel = FlorisModel(input_dict.core)
+        end = time.perf_counter()
         init_times[i] = end - start
 
-        start = time.time()
-        floris.steady_state_atmospheric_condition()
-        end = time.time()
+        start = time.perf_counter()
+        fmodel.run()
+        end = time.perf_counter()
         calc_times[i] = end - start
 
     return np.sum(init_times), np.sum(calc_times)
@@ -50,7 +51,8 @@ if __name__=="__main__":
     sample_inputs = SampleInputs()
     sample_inputs.core["flow_field"]["wind_directions"] = [270.0]
     sample_inputs.core["flow_field"]["wind_speeds"] = [8.0]
-    TURBINE_DIAMETER = sample_inputs.core["turbine"]["rotor_diameter"]
+    sample_inputs.core["flow_field"]["turbulence_intensities"] = [0.06]
+    TURBINE_DIAMETER = sample_inputs.turbine["rotor_diameter"]
 
     N = 5
     simulation_size = np.arange(N)
@@ -61,8 +63,9 @@ if __name__=="__main__":
         vectorize_scaling_inputs = copy.deepcopy(sample_inputs)
 
         factor = (i+1) * 50
-        vectorize_scaling_inputs.core["flow_field"]["wind_directions"] = [270.0]
+        vectorize_scaling_inputs.core["flow_field"]["wind_directions"] = factor * [270.0]
         vectorize_scaling_inputs.core["flow_field"]["wind_speeds"] = factor * [8.0]
+        vectorize_scaling_inputs.core["flow_field"]["turbulence_intensities"] = factor * [0.06]
 
         vectorize_init[i], vectorize_calc[i] = time_vec(copy.deepcopy(vectorize_scaling_inputs))
         print("vectorize", i, vectorize_calc[i])
@@ -72,7 +75,7 @@ if __name__=="__main__":
         serial_scaling_inputs = copy.deepcopy(sample_inputs)
 
         factor = (i+1) * 50
-        wind_directions = [270.0]
+        wind_directions = factor * [270.0]
         wind_speeds = factor * [8.0]
 
         serial_init[i], serial_calc[i] = time_serial(
@@ -99,7 +102,8 @@ if __name__=="__main__":
 
         factor = (i+1) * 50
         vectorize_scaling_inputs.core["flow_field"]["wind_speeds"] = factor * [8.0]
-        vectorize_scaling_inputs.core["flow_field"]["wind_directions"] = [270.0]
+        vectorize_scaling_inputs.core["flow_field"]["wind_directions"] = factor * [270.0]
+        vectorize_scaling_inputs.core["flow_field"]["turbulence_intensities"] = factor * [0.06]
 
         vectorize_init[i], vectorize_calc[i] = time_vec(copy.deepcopy(vectorize_scaling_inputs))
         print("vectorize", i, vectorize_calc[i])
@@ -110,7 +114,7 @@ if __name__=="__main__":
 
         factor = (i+1) * 50
         speeds = factor * [8.0]
-        wind_directions = [270.0]
+        wind_directions = factor * [270.0]
 
         serial_init[i], serial_calc[i] = time_serial(
             copy.deepcopy(serial_scaling_inputs),
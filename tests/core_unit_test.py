@@ -1,6 +1,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import yaml
 
 from floris.core import (
@@ -45,3 +46,53 @@ def test_asdict(turbine_grid_fixture: TurbineGrid):
     dict2 = new_floris.as_dict()
 
     assert dict1 == dict2
+
+
+def test_solve_to_checkpoint():
+    core = Core.from_dict(DICT_INPUT)
+    core.initialize_domain()
+    core.steady_state_atmospheric_condition()
+    u_full = core.flow_field.u.copy()
+
+    # Resuming from a checkpoint at any turbine gives the full solution
+    for index in range(core.farm.n_turbines):
+        core.initialize_domain()
+        checkpoint = core.solve_to_checkpoint(index)
+        assert checkpoint.index == index
+        core.initialize_domain()
+        core.steady_state_atmospheric_condition(resume_from=checkpoint)
+        np.testing.assert_array_equal(core.flow_field.u, u_full)
+
+    # Changing the yaw angle of the most downstream turbine only requires the solve to
+    # resume from that turbine, here for the two conditions repeated
+    core.initialize_domain()
+    index = core.farm.n_turbines - 1
+    checkpoint = core.solve_to_checkpoint(index)
+    turbine = core.grid.sorted_indices[0, index, 0, 0]
+    n_findex = core.flow_field.n_findex
+
+    repeated = Core.from_dict(
+        {
+            **DICT_INPUT,
+            "flow_field": {
+                **DICT_INPUT["flow_field"],
+                "wind_directions": np.tile(core.flow_field.wind_directions, 2),
+                "wind_speeds": np.tile(core.flow_field.wind_speeds, 2),
+                "turbulence_intensities": np.tile(core.flow_field.turbulence_intensities, 2),
+            },
+        }
+    )
+    yaw_angles = np.zeros((2 * n_findex, core.farm.n_turbines))
+    yaw_angles[n_findex:, turbine] = 20.0
+    repeated.farm.set_yaw_angles(yaw_angles)
+    repeated.initialize_domain()
+    repeated.steady_state_atmospheric_condition(
+        resume_from=checkpoint.select(np.tile(np.arange(n_findex), 2))
+    )
+
+    full = Core.from_dict(repeated.as_dict())
+    full.farm.set_yaw_angles(yaw_angles)
+    full.initialize_domain()
+    full.steady_state_atmospheric_condition()
+    np.testing.assert_array_equal(repeated.flow_field.u, full.flow_field.u)
+    np.testing.assert_array_equal(repeated.flow_field.u[:n_findex], u_full)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from floris.cut_plane import (
+    change_resolution,
+    CutPlane,
+    interpolate_onto_array,
+    set_origin,
+)
+
+
+def linear_cut_plane(n_x1=20, n_x2=10):
+    # A plane on a regular grid with velocities that vary linearly with x1 and x2
+    x1, x2 = np.meshgrid(np.linspace(0.0, 100.0, n_x1), np.linspace(0.0, 50.0, n_x2))
+    return CutPlane.from_arrays(
+        x1,
+        x2,
+        np.full_like(x1, 90.0),
+        8.0 + 0.01 * x1 - 0.02 * x2,
+        0.001 * x1,
+        0.002 * x2,
+        "z",
+    )
+
+
+def test_from_arrays():
+    cut_plane = linear_cut_plane()
+    assert cut_plane.resolution == (20, 10)
+    arrays = cut_plane.get_arrays()
+
+    # The DataFrame is built on access with x1 varying fastest
+    df = cut_plane.df
+    assert list(df.columns) == ["x1", "x2", "x3", "u", "v", "w"]
+    assert len(df) == 200
+    np.testing.assert_array_equal(df.x1.values[:20], np.linspace(0.0, 100.0, 20))
+    np.testing.assert_array_equal(df.u.values, arrays["u"].flatten())
+
+    # The arrays can still be recovered from the DataFrame
+    np.testing.assert_array_equal(cut_plane.get_arrays()["u"], arrays["u"])
+
+
+def test_df_cut_plane():
+    # A plane from a DataFrame that does not match its resolution has no arrays
+    df = pd.DataFrame({c: np.arange(5.0) for c in ["x1", "x2", "x3", "u", "v", "w"]})
+    cut_plane = CutPlane(df, 10, 10, "x")
+    assert cut_plane.get_arrays() is None
+    assert cut_plane.df is df
+
+
+def test_change_resolution():
+    cut_plane = change_resolution(linear_cut_plane(), resolution=(7, 5))
+    assert cut_plane.resolution == (7, 5)
+    arrays = cut_plane.get_arrays()
+    assert arrays["u"].shape == (5, 7)
+    np.testing.assert_allclose(arrays["u"], 8.0 + 0.01 * arrays["x1"] - 0.02 * arrays["x2"])
+    np.testing.assert_allclose(arrays["w"], 0.002 * arrays["x2"], atol=1e-12)
+    np.testing.assert_allclose(arrays["x3"], 90.0)
+
+    # The same result is found from the points when they are not on a structured grid
+    df = linear_cut_plane().df.iloc[::-1].reset_index(drop=True)
+    scattered = change_resolution(CutPlane(df, 1, 200, "z"), resolution=(7, 5))
+    np.testing.assert_allclose(scattered.get_arrays()["u"], arrays["u"], atol=1e-3)
+
+
+def test_interpolate_onto_array():
+    cut_plane = linear_cut_plane()
+    x1_array = np.array([10.0, 20.0, 30.0])
+    x2_array = np.array([5.0, 25.0])
+    new_plane = interpolate_onto_array(cut_plane, x1_array, x2_array)
+    assert new_plane.resolution == (3, 2)
+    np.testing.assert_allclose(
+        new_plane.df.u.values,
+        [8.0, 8.1, 8.2, 7.6, 7.7, 7.8],
+    )
+
+    # The input plane is unchanged
+    assert cut_plane.resolution == (20, 10)
+
+
+def test_set_origin_and_subtract():
+    cut_plane = set_origin(linear_cut_plane(), center_x1=50.0, center_x2=25.0)
+    arrays = cut_plane.get_arrays()
+    assert arrays["x1"].min() == -50.0
+    assert arrays["x2"].max() == 25.0
+
+    difference = cut_plane - linear_cut_plane()
+    np.testing.assert_array_equal(difference.get_arrays()["u"], 0.0)
+    np.testing.assert_array_equal(difference.get_arrays()["x1"], arrays["x1"])
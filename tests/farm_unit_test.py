@@ -4,6 +4,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+import yaml
 
 from floris.core import Farm
 from floris.utilities import load_yaml
@@ -221,3 +222,38 @@ def test_farm_external_library(sample_inputs_fixture: SampleInputs):
     farm_data["turbine_type"] = ["FAKE_TURBINE"] * N_TURBINES
     with pytest.raises(FileNotFoundError):
         Farm.from_dict(farm_data)
+
+
+def test_turbine_cache(tmp_path):
+    farm_data = deepcopy(SampleInputs().farm)
+    farm_data["turbine_type"] = ["nrel_5MW"]
+    farm = Farm.from_dict(farm_data)
+    farm.construct_turbine_map()
+
+    # Farms with equal turbine definitions share the turbines
+    farm_2 = Farm.from_dict(farm_data)
+    farm_2.construct_turbine_map()
+    assert farm_2.turbine_map[0] is farm.turbine_map[0]
+
+    # A different definition builds a new turbine
+    turbine_definition = deepcopy(farm.turbine_definitions[0])
+    turbine_definition["hub_height"] = 100.0
+    farm_data["turbine_type"] = [turbine_definition]
+    farm_3 = Farm.from_dict(farm_data)
+    farm_3.construct_turbine_map()
+    assert farm_3.turbine_map[0] is not farm.turbine_map[0]
+    assert farm_3.turbine_map[0].hub_height == 100.0
+
+    # A changed turbine library file is loaded again
+    turbine_definition["turbine_type"] = "cached_turbine"
+    with open(tmp_path / "cached_turbine.yaml", "w") as f:
+        yaml.dump(turbine_definition, f)
+    farm_data["turbine_type"] = ["cached_turbine"]
+    farm_data["turbine_library_path"] = tmp_path
+    assert Farm.from_dict(farm_data).turbine_definitions[0]["hub_height"] == 100.0
+    # The file size changes too, in case of a coarse file modification time
+    turbine_definition["hub_height"] = 110.0
+    with open(tmp_path / "cached_turbine.yaml", "w") as f:
+        yaml.dump(turbine_definition, f)
+        f.write("\n")
+    assert Farm.from_dict(farm_data).turbine_definitions[0]["hub_height"] == 110.0
@@ -1,4 +1,7 @@
+import copy
+import json
 import logging
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -631,6 +634,119 @@ def test_calculate_planes(caplog):
         fmodel.calculate_cross_plane(500.0)
     assert caplog.text != "" # Checking not empty
 
+def test_calculate_planes_batched():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 100.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        wind_directions=[270.0, 280.0, 300.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+        yaw_angles=np.array([[20.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 0.0]]),
+    )
+    fmodel.run()
+
+    # Each plane matches the corresponding single plane, with or without chunking
+    x_bounds, y_bounds = (-200.0, 2000.0), (-400.0, 400.0)
+    for max_memory_mb in [None, 0.1]:
+        planes = fmodel.calculate_horizontal_planes(
+            [90.0, 120.0],
+            findices=[0, 2],
+            x_resolution=20,
+            y_resolution=10,
+            x_bounds=x_bounds,
+            y_bounds=y_bounds,
+            max_memory_mb=max_memory_mb,
+        )
+        assert len(planes) == 2 and len(planes[0]) == 2
+        for i, findex in enumerate([0, 2]):
+            for j, height in enumerate([90.0, 120.0]):
+                plane = fmodel.calculate_horizontal_plane(
+                    height,
+                    x_resolution=20,
+                    y_resolution=10,
+                    x_bounds=x_bounds,
+                    y_bounds=y_bounds,
+                    findex_for_viz=findex,
+                )
+                np.testing.assert_allclose(planes[i][j].df.values, plane.df.values)
+
+    cross_planes = fmodel.calculate_cross_planes(500.0, y_resolution=10, z_resolution=10)
+    y_planes = fmodel.calculate_y_planes(
+        [0.0], x_resolution=10, z_resolution=10, x_bounds=x_bounds
+    )
+    assert len(cross_planes) == len(y_planes) == 3
+    plane = fmodel.calculate_y_plane(
+        0.0, x_resolution=10, z_resolution=10, x_bounds=x_bounds, findex_for_viz=1
+    )
+    np.testing.assert_allclose(y_planes[1][0].df.values, plane.df.values)
+
+def test_reuse_wake_source_terms():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 100.0],
+        wind_speeds=[8.0, 9.0],
+        wind_directions=[270.0, 280.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=np.array([[20.0, 10.0, 0.0], [0.0, -10.0, 0.0]]),
+    )
+    x = np.linspace(-100.0, 1500.0, 20)
+    y = np.linspace(-200.0, 300.0, 20)
+    z = 90.0 * np.ones_like(x)
+
+    # Without a run, the turbine grid is solved within sample_flow_at_points
+    u_solved = fmodel.sample_flow_at_points(x, y, z)
+    assert fmodel.core.wake_source_terms is None
+
+    # After a run, the turbine grid solution is reused and gives the same flow
+    fmodel.run()
+    u_reused = fmodel.sample_flow_at_points(x, y, z)
+    assert fmodel.core.wake_source_terms is not None
+    np.testing.assert_allclose(u_reused, u_solved)
+
+    # Changing the setpoints after the run invalidates the stored solution
+    fmodel.core.farm.set_yaw_angles(np.zeros((2, 3)))
+    u_unyawed = fmodel.sample_flow_at_points(x, y, z)
+    assert fmodel.core.get_wake_source_terms() is None
+    assert not np.allclose(u_unyawed, u_reused)
+
+def test_sample_flow_at_points_chunked():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 100.0],
+        wind_speeds=[8.0, 9.0],
+        wind_directions=[270.0, 280.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=[[25.0, 0.0, 0.0], [25.0, 0.0, 0.0]],
+    )
+    x = np.linspace(-100.0, 1500.0, 23)
+    y = np.linspace(-200.0, 300.0, 23)
+    z = np.linspace(20.0, 160.0, 23)
+
+    u, v, w = fmodel.sample_flow_at_points(x, y, z, return_components=True)
+    assert np.max(np.abs(v)) > 0.1
+
+    # Evaluating the points in blocks, with or without a run, gives the same result
+    u_chunked = fmodel.sample_flow_at_points(x, y, z, chunk_size=5)
+    np.testing.assert_allclose(u_chunked, u)
+    fmodel.run()
+    u_chunked, v_chunked, w_chunked = fmodel.sample_flow_at_points(
+        x, y, z, chunk_size=4, return_components=True
+    )
+    np.testing.assert_allclose(u_chunked, u)
+    np.testing.assert_allclose(v_chunked, v, atol=1e-12)
+    np.testing.assert_allclose(w_chunked, w, atol=1e-12)
+
+    # A memory budget is converted to at least one point per block
+    assert fmodel._points_chunk_size(1e-9) == 1
+    u_budget = fmodel.sample_flow_at_points(x, y, z, max_memory_mb=0.01)
+    np.testing.assert_allclose(u_budget, u)
+
+    with pytest.raises(ValueError):
+        fmodel.sample_flow_at_points(x, y, z, chunk_size=0)
+
 def test_get_turbine_powers_with_WindRose():
     fmodel = FlorisModel(configuration=YAML_INPUT)
 
@@ -871,3 +987,251 @@ def test_merge_floris_models():
     fmodel_list = [fmodel1, "not a floris model"]
     with pytest.raises(TypeError):
         merged_fmodel = FlorisModel.merge_floris_models(fmodel_list)
+
+
+def test_calculate_horizontal_plane_with_turbines():
+    from floris.flow_visualization import calculate_horizontal_plane_with_turbines
+
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0],
+        layout_y=[0.0, 50.0],
+        wind_speeds=[8.0, 9.0],
+        wind_directions=[270.0, 270.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=np.array([[0.0, 0.0], [20.0, 0.0]]),
+    )
+
+    # The locations of the test turbine are solved in chunks of conditions
+    x_bounds, y_bounds = (-200.0, 1500.0), (-200.0, 200.0)
+    plane = calculate_horizontal_plane_with_turbines(
+        fmodel,
+        x_resolution=4,
+        y_resolution=3,
+        x_bounds=x_bounds,
+        y_bounds=y_bounds,
+        findex_for_viz=1,
+        chunk_size=5,
+    )
+    assert plane.resolution == (4, 3)
+    df = plane.df
+    np.testing.assert_array_equal(df.x1.values[:4], np.linspace(*x_bounds, 4))
+    np.testing.assert_array_equal(df.x2.values[::4], np.linspace(*y_bounds, 3))
+
+    # Each point matches a test turbine added to the farm at that location
+    for i in [0, 5, 7, 11]:
+        fmodel_test = FlorisModel(configuration=YAML_INPUT)
+        fmodel_test.set(
+            layout_x=[0.0, 500.0, df.x1.values[i]],
+            layout_y=[0.0, 50.0, df.x2.values[i]],
+            wind_speeds=[9.0],
+            wind_directions=[270.0],
+            turbulence_intensities=[0.06],
+            yaw_angles=np.array([[20.0, 0.0, 0.0]]),
+        )
+        fmodel_test.run()
+        u = fmodel_test.core.flow_field.u
+        center_point = u.shape[2] // 2
+        assert df.u.values[i] == pytest.approx(u[0, -1, center_point, center_point])
+
+
+def test_run_layouts():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    yaw_angles = np.array([[0.0, 10.0, 0.0], [20.0, 0.0, 0.0]])
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_speeds=[8.0, 9.0],
+        wind_directions=[270.0, 280.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=yaw_angles,
+    )
+    layouts_x = np.array([[0.0, 500.0, 1000.0], [0.0, 630.0, 1260.0], [0.0, 0.0, 500.0]])
+    layouts_y = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 500.0, 100.0]])
+
+    # Each layout matches a model set to that layout, in one or several passes
+    turbine_powers = fmodel.run_layouts(layouts_x, layouts_y)
+    assert turbine_powers.shape == (3, 2, 3)
+    np.testing.assert_allclose(
+        fmodel.run_layouts(layouts_x, layouts_y, max_layouts_per_run=2),
+        turbine_powers,
+    )
+    for i in range(3):
+        fmodel_layout = fmodel.copy()
+        fmodel_layout.set(layout_x=layouts_x[i], layout_y=layouts_y[i], yaw_angles=yaw_angles)
+        fmodel_layout.run()
+        np.testing.assert_allclose(turbine_powers[i], fmodel_layout.get_turbine_powers())
+
+    # Irregular layouts do not depend on the other layouts that share their batch
+    rng = np.random.default_rng(4)
+    random_layouts_x = rng.uniform(0.0, 1000.0, (6, 3))
+    random_layouts_y = rng.uniform(0.0, 1000.0, (6, 3))
+    turbine_powers = fmodel.run_layouts(random_layouts_x, random_layouts_y)
+    for i in range(6):
+        fmodel_layout = fmodel.copy()
+        fmodel_layout.set(
+            layout_x=random_layouts_x[i],
+            layout_y=random_layouts_y[i],
+            yaw_angles=yaw_angles,
+        )
+        fmodel_layout.run()
+        np.testing.assert_allclose(
+            turbine_powers[i],
+            fmodel_layout.get_turbine_powers(),
+            rtol=1e-12,
+        )
+
+    # The model itself is not changed
+    np.testing.assert_array_equal(fmodel.layout_x, [0.0, 500.0, 1000.0])
+    np.testing.assert_array_equal(fmodel.core.farm.yaw_angles, yaw_angles)
+
+    # Yaw angles can be given per layout
+    turbine_powers = fmodel.run_layouts(
+        layouts_x[:1],
+        layouts_y[:1],
+        yaw_angles=np.zeros((1, 2, 3)),
+    )
+    fmodel.set(yaw_angles=np.zeros((2, 3)))
+    fmodel.run()
+    np.testing.assert_allclose(turbine_powers[0], fmodel.get_turbine_powers())
+
+    with pytest.raises(ValueError):
+        fmodel.run_layouts(layouts_x[:, :2], layouts_y[:, :2])
+
+def test_copy():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_directions=[270.0, 280.0],
+        wind_speeds=[8.0, 9.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=np.array([[20.0, 10.0, 0.0], [0.0, 0.0, 0.0]]),
+    )
+    fmodel.run()
+
+    # copy() matches a model built from the configuration dictionary, with the turbine data
+    # shared with the original model
+    fmodel_copy = fmodel.copy()
+    fmodel_dict = FlorisModel(fmodel.core.as_dict())
+    assert fmodel_copy.core.as_dict() == fmodel_dict.core.as_dict()
+    assert fmodel_copy.core.farm.turbine_map[0] is fmodel.core.farm.turbine_map[0]
+    np.testing.assert_array_equal(fmodel_copy.core.farm.yaw_angles, np.zeros((2, 3)))
+    fmodel_copy.run()
+    fmodel_dict.run()
+    np.testing.assert_array_equal(
+        fmodel_copy.get_turbine_powers(),
+        fmodel_dict.get_turbine_powers(),
+    )
+
+    # A deep copy keeps the setpoints and solution and shares the turbine data
+    fmodel_deepcopy = copy.deepcopy(fmodel)
+    assert fmodel_deepcopy.core.farm.turbine_map[0] is fmodel.core.farm.turbine_map[0]
+    np.testing.assert_array_equal(
+        fmodel_deepcopy.get_turbine_powers(),
+        fmodel.get_turbine_powers(),
+    )
+    fmodel_deepcopy.set(yaw_angles=np.zeros((2, 3)))
+    assert fmodel.core.farm.yaw_angles[0, 0] == 20.0
+
+    # Changing the operation model of a copy does not change the original model
+    fmodel_copy.set_operation_model("mixed")
+    assert fmodel.get_operation_model() == "cosine-loss"
+    assert fmodel.core.farm.turbine_definitions[0]["operation_model"] == "cosine-loss"
+
+def test_pickle():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_directions=[270.0, 280.0, 290.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.08],
+        yaw_angles=np.array([[20.0, 10.0, 0.0], [0.0, 0.0, 0.0], [0.0, 5.0, 0.0]]),
+        disable_turbines=[[False, False, False], [False, True, False], [False, False, False]],
+    )
+
+    # An unsolved model keeps its conditions and setpoints
+    fmodel_unpickled = pickle.loads(pickle.dumps(fmodel, protocol=5))
+    assert fmodel_unpickled.core.as_dict() == fmodel.core.as_dict()
+    np.testing.assert_array_equal(
+        fmodel_unpickled.core.farm.yaw_angles,
+        fmodel.core.farm.yaw_angles,
+    )
+    np.testing.assert_array_equal(
+        fmodel_unpickled.core.farm.power_setpoints,
+        fmodel.core.farm.power_setpoints,
+    )
+    fmodel.run()
+    fmodel_unpickled.run()
+    np.testing.assert_array_equal(
+        fmodel_unpickled.get_turbine_powers(),
+        fmodel.get_turbine_powers(),
+    )
+
+    # A solved model keeps its solution, without the grids and the full fields
+    buffers = []
+    data = pickle.dumps(fmodel, protocol=5, buffer_callback=buffers.append)
+    fmodel_unpickled = pickle.loads(data, buffers=buffers)
+    for get_output in [
+        FlorisModel.get_turbine_powers,
+        FlorisModel.get_turbine_thrust_coefficients,
+        FlorisModel.get_turbine_TIs,
+    ]:
+        np.testing.assert_array_equal(get_output(fmodel_unpickled), get_output(fmodel))
+    assert len(data) + sum(memoryview(b).nbytes for b in buffers) < len(
+        pickle.dumps(fmodel.core.flow_field, protocol=5)
+    )
+
+    # The turbine models are shared between models unpickled from the same configuration
+    fmodel_unpickled_2 = pickle.loads(pickle.dumps(fmodel, protocol=5))
+    assert fmodel_unpickled_2.core.farm.turbine_map[0] is fmodel_unpickled.core.farm.turbine_map[0]
+
+
+def test_profiling(tmp_path):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_directions=[270.0, 280.0],
+        wind_speeds=[8.0, 9.0],
+        turbulence_intensities=[0.06, 0.06],
+    )
+
+    # Profiling is disabled by default
+    with pytest.raises(RuntimeError):
+        fmodel.get_profile()
+
+    fmodel.set_profiling(track_memory=True)
+    fmodel.set(yaw_angles=np.array([[20.0, 10.0, 0.0], [0.0, 0.0, 0.0]]))
+    fmodel.run()
+    turbine_powers = fmodel.get_turbine_powers()
+
+    # Every stage is recorded, the solver phases once per turbine
+    profile = fmodel.get_profile()
+    for stage in [
+        "Core.__attrs_post_init__",
+        "Core.initialize_domain",
+        "Core.solve",
+        "Core.finalize",
+        "FlorisModel.power",
+    ]:
+        assert profile.loc[stage, "calls"] == 1
+    for stage in ["thrust_induction", "deflection", "deficit", "combination", "turbulence"]:
+        assert profile.loc[stage, "category"] == "solver"
+        assert profile.loc[stage, "calls"] == 3
+    assert (profile["total_time"] > 0.0).all()
+    assert profile.loc["Core.solve", "total_time"] >= profile.loc["deficit", "total_time"]
+    assert profile.loc["Core.solve", "peak_allocated_bytes"] > 0
+
+    # The trace has one complete event per call
+    fmodel.write_profile_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == profile["calls"].sum()
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+
+    # Disabling the profiling does not change the results
+    fmodel.set_profiling(False)
+    fmodel.run()
+    np.testing.assert_array_equal(fmodel.get_turbine_powers(), turbine_powers)
@@ -3,7 +3,11 @@ import numpy as np
 import pandas as pd
 
 from floris import FlorisModel
-from floris.optimization.yaw_optimization.yaw_optimizer_geometric import YawOptimizationGeometric
+from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
+    geometric_yaw,
+    geometric_yaw_array,
+    YawOptimizationGeometric,
+)
 
 
 DEBUG = False
@@ -113,3 +117,36 @@ def test_disabled_turbines(sample_inputs_fixture):
     yaw_angles_opt_removed = df_opt.loc[3, "yaw_angles_opt"]
 
     assert np.allclose(yaw_angles_opt_disabled[[0, 2]], yaw_angles_opt_removed)
+
+
+def test_geometric_yaw_array():
+    """
+    The vectorized geometric yaw matches evaluating each wind direction separately with
+    the inactive turbines removed from the layout.
+    """
+    rng = np.random.default_rng(0)
+    layout_x = rng.uniform(0.0, 3000.0, 20)
+    layout_y = rng.uniform(0.0, 3000.0, 20)
+    wind_directions = np.tile(np.arange(0.0, 360.0, 5.0), 2)
+    active_turbines = rng.random((len(wind_directions), 20)) > 0.2
+
+    yaw_angles = geometric_yaw_array(
+        layout_x,
+        layout_y,
+        wind_directions,
+        126.0,
+        active_turbines=active_turbines,
+    )
+    assert yaw_angles.shape == (len(wind_directions), 20)
+    assert np.any(yaw_angles > 0.0)
+    assert np.any(yaw_angles < 0.0)
+    assert np.all(yaw_angles[~active_turbines] == 0.0)
+
+    for i, wd in enumerate(wind_directions):
+        yaw_angles_wd = geometric_yaw(
+            layout_x[active_turbines[i]],
+            layout_y[active_turbines[i]],
+            wd,
+            126.0,
+        )
+        np.testing.assert_allclose(yaw_angles[i, active_turbines[i]], yaw_angles_wd)
@@ -0,0 +1,100 @@
+import numpy as np
+from scipy.optimize import approx_fprime
+from scipy.spatial.distance import pdist
+from shapely.geometry import MultiPolygon, Point, Polygon
+
+from floris.optimization.layout_optimization.layout_constraints import (
+    distance_from_boundaries,
+    ks_aggregate,
+    min_dist_satisfied,
+    points_in_bounds,
+    prepare_boundary,
+    space_constraint,
+    SpacingTree,
+)
+
+
+BOUNDARY_POLYGON = prepare_boundary(
+    MultiPolygon(
+        [
+            Polygon([(0.0, 0.0), (0.0, 1000.0), (1000.0, 1000.0), (1000.0, 0.0)]),
+            Polygon([(1500.0, 0.0), (2000.0, 500.0), (1500.0, 1000.0)]),
+        ]
+    )
+)
+
+
+def test_points_in_bounds():
+    x = np.array([500.0, 1200.0, 1600.0, 0.0, 1000.0])
+    y = np.array([500.0, 500.0, 500.0, 500.0, 1000.0])
+    np.testing.assert_array_equal(
+        points_in_bounds(x, y, BOUNDARY_POLYGON),
+        [BOUNDARY_POLYGON.contains(Point(xi, yi)) for xi, yi in zip(x, y)],
+    )
+    np.testing.assert_array_equal(
+        points_in_bounds(x, y, BOUNDARY_POLYGON, include_boundary=True),
+        [True, False, True, True, True],
+    )
+
+
+def test_distance_from_boundaries():
+    x = np.array([100.0, 500.0, 1200.0, -50.0, 1700.0])
+    y = np.array([500.0, 800.0, 500.0, -50.0, 500.0])
+    distances, jac = distance_from_boundaries(x, y, BOUNDARY_POLYGON, jacobian=True)
+    np.testing.assert_allclose(distances[:4], [100.0, 200.0, -200.0, -50.0 * np.sqrt(2)])
+
+    # The analytic derivatives match finite differences
+    for i in range(len(x)):
+        for j, (dx, dy) in enumerate([(1e-3, 0.0), (0.0, 1e-3)]):
+            fd = (
+                distance_from_boundaries(x[i] + dx, y[i] + dy, BOUNDARY_POLYGON)
+                - distance_from_boundaries(x[i] - dx, y[i] - dy, BOUNDARY_POLYGON)
+            ) / 2e-3
+            np.testing.assert_allclose(jac[i, j], fd, atol=1e-6)
+
+
+def test_space_constraint():
+    # Matches the KS aggregation of the nearest neighbor distances computed directly
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.0, 2000.0, 20)
+    y = rng.uniform(0.0, 2000.0, 20)
+    distances = np.sqrt((x[:, None] - x[None, :])**2 + (y[:, None] - y[None, :])**2)
+    distances[np.arange(20), np.arange(20)] = np.inf
+    g = 1 - distances.min(axis=0) / 300.0
+    assert np.isclose(space_constraint(x, y, 300.0), ks_aggregate(g))
+    assert np.isclose(ks_aggregate(g), np.max(g), atol=np.log(20) / 500)
+
+    # The analytic derivatives match finite differences
+    _, jac = space_constraint(x, y, 300.0, rho=5, jacobian=True)
+    fd = approx_fprime(
+        np.concatenate([x, y]),
+        lambda xy: space_constraint(xy[:20], xy[20:], 300.0, rho=5),
+        1e-4,
+    )
+    np.testing.assert_allclose(jac, fd, atol=1e-6)
+
+
+def test_spacing_tree():
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0.0, 3000.0, 30)
+    y = rng.uniform(0.0, 3000.0, 30)
+    min_dist = 200.0
+    spacing_tree = SpacingTree(x, y, min_dist, rebuild_interval=3)
+    assert spacing_tree.is_satisfied() == (pdist(np.column_stack([x, y])).min() >= min_dist)
+
+    # Moves are checked against the whole layout, as for a check from scratch
+    for _ in range(300):
+        turbine = rng.integers(30)
+        x_new, y_new = rng.uniform(0.0, 3000.0, 2)
+        x_test = x.copy()
+        y_test = y.copy()
+        x_test[turbine] = x_new
+        y_test[turbine] = y_new
+        expected = min_dist_satisfied(x_test, y_test, min_dist)
+        assert spacing_tree.test_move(turbine, x_new, y_new) == expected
+
+        # Accept valid moves and some invalid ones
+        if expected or rng.uniform() < 0.2:
+            spacing_tree.move(turbine, x_new, y_new)
+            x, y = x_test, y_test
+            assert spacing_tree.is_satisfied() == min_dist_satisfied(x, y, min_dist)
@@ -8,14 +8,21 @@ from floris import (
     FlorisModel,
     TimeSeries,
     WindRose,
+    WindRoseWRG,
 )
 from floris.optimization.layout_optimization.layout_optimization_base import (
     LayoutOptimization,
 )
+from floris.optimization.layout_optimization.layout_optimization_boundary_grid import (
+    LayoutOptimizationBoundaryGrid,
+)
 from floris.optimization.layout_optimization.layout_optimization_gridded import (
     LayoutOptimizationGridded,
 )
 from floris.optimization.layout_optimization.layout_optimization_random_search import (
+    _get_objective,
+    _get_objectives,
+    _IncrementalObjective,
     LayoutOptimizationRandomSearch,
 )
 from floris.optimization.layout_optimization.layout_optimization_scipy import (
@@ -92,6 +99,193 @@ def test_LayoutOptimizationRandomSearch():
     # Check that the optimization runs
     layout_opt.optimize()
 
+def test_LayoutOptimizationRandomSearch_batched_objectives():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    wind_rose = WindRose(
+        wind_directions=np.arange(0.0, 360.0, 45.0),
+        wind_speeds=np.array([8.0, 10.0]),
+        ti_table=0.06,
+    )
+    wind_rose.assign_value_piecewise_linear()
+    fmodel.set(layout_x=[0.0, 630.0, 0.0], layout_y=[0.0, 0.0, 630.0], wind_data=wind_rose)
+
+    # The objectives of layouts evaluated in one batched run are weighted as those of
+    # layouts evaluated one by one
+    rng = np.random.default_rng(0)
+    layouts_x = rng.uniform(0.0, 1000.0, (4, 3))
+    layouts_y = rng.uniform(0.0, 1000.0, (4, 3))
+    for use_value in [False, True]:
+        objectives = _get_objectives(layouts_x, layouts_y, fmodel, use_value=use_value)
+        for i in range(4):
+            np.testing.assert_allclose(
+                objectives[i],
+                _get_objective(layouts_x[i], layouts_y[i], fmodel, use_value=use_value),
+                rtol=1e-12,
+            )
+
+def test_LayoutOptimizationRandomSearch_incremental():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0, 0.0, 630.0],
+        layout_y=[0.0, 0.0, 630.0, 630.0],
+        wind_data=WindRose(
+            wind_directions=np.arange(0.0, 360.0, 30.0),
+            wind_speeds=np.array([8.0]),
+            ti_table=0.06,
+        ),
+    )
+    fmodel.run()
+    aep = fmodel.get_farm_AEP()
+
+    # The estimate of the objective is close to the full solve
+    layout_x = np.array(fmodel.layout_x)
+    layout_y = np.array(fmodel.layout_y)
+    incremental_objective = _IncrementalObjective(fmodel, layout_x, layout_y)
+    assert np.isclose(incremental_objective.objective, aep, rtol=0.01)
+
+    # Moving a turbine only updates its pairs, and the estimate matches
+    # building the cache of the new layout from scratch
+    layout_x[3] = 900.0
+    estimated_objective = incremental_objective.evaluate_move(3, layout_x, layout_y)
+    incremental_objective.accept()
+    assert np.isclose(
+        estimated_objective,
+        _IncrementalObjective(fmodel, layout_x, layout_y).objective,
+    )
+    np.testing.assert_allclose(
+        incremental_objective.deficits,
+        _IncrementalObjective(fmodel, layout_x, layout_y).deficits,
+        atol=1e-5,
+    )
+
+    layout_opt = LayoutOptimizationRandomSearch(
+        fmodel=fmodel,
+        boundaries=test_boundaries,
+        min_dist_D=5,
+        seconds_per_iteration=1,
+        total_optimization_seconds=1,
+        use_dist_based_init=False,
+        incremental_evaluation=True,
+    )
+    _, layout_x_opt, layout_y_opt = layout_opt.optimize()
+
+    # The optimized layout is confirmed with full solves
+    fmodel.set(layout_x=layout_x_opt, layout_y=layout_y_opt)
+    fmodel.run()
+    assert fmodel.get_farm_AEP() >= aep - 1e-6
+
+    # The frequencies of a WindRoseWRG depend on the layout, which the estimate does not
+    # account for
+    fmodel.set(wind_data=WindRoseWRG(TEST_DATA / "wrg_test.wrg"))
+    with pytest.raises(ValueError, match="WindRoseWRG"):
+        LayoutOptimizationRandomSearch(
+            fmodel=fmodel,
+            boundaries=test_boundaries,
+            min_dist_D=5,
+            use_dist_based_init=False,
+            interface=None,
+            relegation_number=0,
+            incremental_evaluation=True,
+        )
+
+def test_LayoutOptimizationRandomSearch_incremental_mixed_types():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0, 0.0, 630.0],
+        layout_y=[0.0, 0.0, 630.0, 630.0],
+        turbine_type=["nrel_5MW", "iea_10MW", "nrel_5MW", "iea_15MW"],
+        reference_wind_height=90.0,
+        wind_data=WindRose(
+            wind_directions=np.arange(0.0, 360.0, 30.0),
+            wind_speeds=np.array([8.0]),
+            ti_table=0.06,
+        ),
+    )
+    fmodel.run()
+    aep = fmodel.get_farm_AEP()
+
+    # Each pair is solved with the turbine types and hub heights of its source and target
+    layout_x = np.array(fmodel.layout_x)
+    layout_y = np.array(fmodel.layout_y)
+    incremental_objective = _IncrementalObjective(fmodel, layout_x, layout_y)
+    assert np.isclose(incremental_objective.objective, aep, rtol=0.01)
+
+    layout_x[3] = 900.0
+    estimated_objective = incremental_objective.evaluate_move(3, layout_x, layout_y)
+    assert np.isclose(
+        estimated_objective,
+        _IncrementalObjective(fmodel, layout_x, layout_y).objective,
+    )
+    fmodel.set(layout_x=layout_x, layout_y=layout_y)
+    fmodel.run()
+    assert np.isclose(estimated_objective, fmodel.get_farm_AEP(), rtol=0.01)
+
+    layout_opt = LayoutOptimizationRandomSearch(
+        fmodel=fmodel,
+        boundaries=test_boundaries,
+        min_dist_D=5,
+        seconds_per_iteration=1,
+        total_optimization_seconds=1,
+        use_dist_based_init=False,
+        interface=None,
+        relegation_number=0,
+        incremental_evaluation=True,
+    )
+    layout_opt.optimize()
+
+def test_LayoutOptimizationRandomSearch_screening(caplog):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    wind_rose = WindRose(
+        wind_directions=np.arange(0.0, 360.0, 15.0),
+        wind_speeds=np.array([8.0, 9.0]),
+        ti_table=0.06,
+    )
+    fmodel.set(layout_x=[0.0, 630.0, 0.0], layout_y=[0.0, 0.0, 630.0], wind_data=wind_rose)
+
+    # Screening cannot be combined with the incremental evaluation
+    with pytest.raises(ValueError):
+        LayoutOptimizationRandomSearch(
+            fmodel=fmodel,
+            boundaries=test_boundaries,
+            min_dist_D=5,
+            use_dist_based_init=False,
+            interface=None,
+            relegation_number=0,
+            incremental_evaluation=True,
+            screening_turbine_grid_points=1,
+        )
+
+    layout_opt = LayoutOptimizationRandomSearch(
+        fmodel=fmodel,
+        boundaries=test_boundaries,
+        min_dist_D=5,
+        use_dist_based_init=False,
+        interface=None,
+        relegation_number=0,
+        random_seed=0,
+        screening_wind_data=wind_rose.downsample(wd_step=45.0, ws_step=2.0),
+        screening_turbine_grid_points=1,
+        screening_margin=0.001,
+    )
+    assert layout_opt.screening_fmodel_dict["solver"]["turbine_grid_points"] == 1
+    assert fmodel.core.solver["turbine_grid_points"] == 3
+
+    with caplog.at_level(logging.INFO):
+        _, layout_x_opt, layout_y_opt = layout_opt._test_optimize()
+    assert "Screening confirmed" in caplog.text
+
+    # Only the screened moves that were confirmed called the full objective
+    num_objective_calls = np.sum(layout_opt.num_objective_calls_log)
+    num_full_objective_calls = np.sum(layout_opt.num_full_objective_calls_log)
+    num_accepted_moves = np.sum(layout_opt.num_accepted_moves_log)
+    assert num_objective_calls > num_full_objective_calls >= num_accepted_moves
+
+    # The optimized layout is confirmed at full fidelity
+    fmodel.set(layout_x=layout_x_opt, layout_y=layout_y_opt)
+    fmodel.run()
+    assert np.isclose(fmodel.get_farm_AEP(), layout_opt.objective_final)
+    assert layout_opt.objective_final >= layout_opt.objective_initial
+
 def test_LayoutOptimizationGridded_initialization(caplog):
     fmodel = FlorisModel(configuration=YAML_INPUT)
     fmodel.set(layout_x=[0, 500], layout_y=[0, 0])
@@ -287,3 +481,82 @@ def test_LayoutOptimizationGridded_hexagonal():
 
     # Check that the hexagonal layout is better
     assert n_turbs_opt_hex >= n_turbs_opt_square
+
+
+def test_LayoutOptimizationBoundaryGrid_search_parameters(tmp_path):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    wind_rose = WindRose(
+        wind_directions=np.arange(0.0, 360.0, 45.0),
+        wind_speeds=np.array([8.0]),
+        ti_table=0.06,
+    )
+    fmodel.set(wind_data=wind_rose)
+    layout_opt = LayoutOptimizationBoundaryGrid(
+        fmodel,
+        test_boundaries[:-1],
+        start=0.0,
+        x_spacing=500.0,
+        y_spacing=500.0,
+        shear=0.0,
+        rotation=0.0,
+        center_x=500.0,
+        center_y=500.0,
+        boundary_setback=200.0,
+        n_boundary_turbines=4,
+    )
+
+    # The repeated spacing generates the same layouts, which are evaluated once
+    parameter_values = {"x_spacing": [300.0, 400.0, 400.0], "start": [0.0, 100.0]}
+    checkpoint_file = tmp_path / "checkpoint.csv"
+    df_search = layout_opt.search_parameters(
+        parameter_values,
+        min_dist=250.0,
+        interface=None,
+        layouts_per_task=2,
+        checkpoint_file=checkpoint_file,
+    )
+    assert len(df_search) == 6
+    assert layout_opt.n_layouts_evaluated == df_search["feasible"].sum() - 2
+
+    # The objectives match those of the layouts set on the model directly
+    fmodel = fmodel.copy()
+    fmodel.set(wind_data=wind_rose)
+    for _, row in df_search[df_search["feasible"]].iterrows():
+        layout_x, layout_y = layout_opt.boundary_grid(
+            **row[list(parameter_values)],
+            **{name: getattr(layout_opt, name) for name in ["y_spacing", "shear", "rotation"]},
+            center_x=500.0,
+            center_y=500.0,
+            boundary_setback=200.0,
+            n_boundary_turbines=4,
+        )
+        fmodel.set(layout_x=layout_x, layout_y=layout_y)
+        fmodel.run()
+        np.testing.assert_allclose(row["objective"], fmodel.get_farm_AEP())
+
+    # The best parameters are applied
+    best = df_search.loc[df_search["objective"].idxmax()]
+    assert layout_opt.x_spacing == best["x_spacing"]
+    assert layout_opt.start == best["start"]
+    assert layout_opt.fmodel.n_turbines == best["n_turbines"]
+
+    # A resumed search reads the objectives from the checkpoint, and the parallel search
+    # gives the same results
+    df_resumed = layout_opt.search_parameters(
+        parameter_values,
+        min_dist=250.0,
+        interface=None,
+        checkpoint_file=checkpoint_file,
+    )
+    assert layout_opt.n_layouts_evaluated == 0
+    np.testing.assert_allclose(df_resumed["objective"], df_search["objective"])
+    df_parallel = layout_opt.search_parameters(
+        parameter_values,
+        min_dist=250.0,
+        max_workers=2,
+        layouts_per_task=1,
+    )
+    np.testing.assert_allclose(df_parallel["objective"], df_search["objective"])
+
+    with pytest.raises(ValueError):
+        layout_opt.search_parameters({"n_rows": [2, 3]})
@@ -63,6 +63,42 @@ def test_multiprocessing_interface(sample_inputs_fixture):
 
     assert np.allclose(f_turb_powers, pf_turb_powers)
 
+def test_heterogeneous_inflow(sample_inputs_fixture):
+    """
+    The speed multipliers of heterogeneous inflow vary by findex and should be split with
+    the wind conditions.
+    """
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+
+    heterogeneous_inflow_config = {
+        "x": [-1000.0, -1000.0, 2000.0, 2000.0],
+        "y": [-1000.0, 1000.0, -1000.0, 1000.0],
+        "speed_multipliers": [
+            [1.0, 1.0, 1.0, 1.0],
+            [1.2, 0.8, 1.2, 0.8],
+            [0.8, 1.2, 0.8, 1.2],
+            [1.1, 1.1, 0.9, 0.9],
+        ],
+    }
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        wind_directions=[270.0, 270.0, 280.0, 290.0],
+        wind_speeds=[8.0, 9.0, 8.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.06, 0.06],
+        heterogeneous_inflow_config=heterogeneous_inflow_config,
+    )
+    pfmodel = ParFlorisModel(fmodel, interface="multiprocessing", n_wind_condition_splits=2)
+
+    fmodel.run()
+    pfmodel.run()
+
+    f_turb_powers = fmodel.get_turbine_powers()
+    pf_turb_powers = pfmodel.get_turbine_powers()
+
+    assert np.allclose(f_turb_powers, pf_turb_powers)
+
 def test_pathos_interface(sample_inputs_fixture):
     """
     With interface="pathos", the ParFlorisModel should return the same powers
@@ -313,6 +349,42 @@ def test_sample_flow_at_points(sample_inputs_fixture):
         ws_test = pfmodel.sample_flow_at_points(x_test, y_test, z_test)
         assert np.allclose(ws_base, ws_test)
 
+def test_sample_flow_at_points_split_points(sample_inputs_fixture):
+    """
+    Check that splitting over points as well as wind conditions gives the same result.
+    """
+
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+
+    sample_inputs_fixture.core["wake"]["enable_transverse_velocities"] = True
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        wind_directions=np.array([270.0, 280.0]),
+        wind_speeds=np.array([8.0, 9.0]),
+        turbulence_intensities=np.array([0.06, 0.06]),
+        yaw_angles=np.array([[25.0, 0.0, 0.0], [25.0, 0.0, 0.0]]),
+    )
+
+    x_test = np.linspace(0.0, 1500.0, 11)
+    y_test = np.linspace(-100.0, 100.0, 11)
+    z_test = np.linspace(20.0, 160.0, 11)
+
+    u_base, v_base, w_base = fmodel.sample_flow_at_points(
+        x_test, y_test, z_test, return_components=True
+    )
+
+    pfmodel = ParFlorisModel(fmodel, max_workers=4, interface="multiprocessing")
+    u_test, v_test, w_test = pfmodel.sample_flow_at_points(
+        x_test, y_test, z_test, chunk_size=2, return_components=True
+    )
+    assert u_test.shape == (2, 11)
+    assert np.max(np.abs(v_base)) > 0.1
+    assert np.allclose(u_base, u_test)
+    assert np.allclose(v_base, v_test, rtol=0.0, atol=1e-12)
+    assert np.allclose(w_base, w_test, rtol=0.0, atol=1e-12)
+
 def test_copy(sample_inputs_fixture):
     """
     Check that the ParFlorisModel copies correctly as a ParFlorisModel.
@@ -105,3 +105,94 @@ def test_disabled_turbines(sample_inputs_fixture):
 
     assert np.allclose(yaw_angles_opt_disabled[[0, 2]], yaw_angles_opt_removed)
     assert np.allclose(farm_power_opt_disabled, farm_power_opt_removed)
+
+def test_checkpoint_upstream_state(sample_inputs_fixture):
+    """
+    Resuming the candidate solves from the state upstream of the turbine being yawed gives the
+    same result as solving the full farm for every candidate.
+    """
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        layout_x=[0.0, 600.0, 1200.0, 0.0, 600.0, 1200.0],
+        layout_y=[0.0, 0.0, 0.0, 400.0, 400.0, 400.0],
+        wind_directions=[260.0, 270.0, 280.0],
+        wind_speeds=[8.0] * 3,
+        turbulence_intensities=[0.06] * 3,
+    )
+
+    df_opts = []
+    for checkpoint_upstream_state in [False, True]:
+        yaw_opt = YawOptimizationSR(
+            fmodel,
+            minimum_yaw_angle=0.0,
+            maximum_yaw_angle=MAXIMUM_YAW_ANGLE,
+            exclude_downstream_turbines=False,
+            checkpoint_upstream_state=checkpoint_upstream_state,
+        )
+        assert yaw_opt.checkpoint_upstream_state == checkpoint_upstream_state
+        df_opts.append(yaw_opt.optimize(print_progress=False))
+
+    assert np.any(np.vstack(df_opts[1]["yaw_angles_opt"]) > 0.0)
+    np.testing.assert_array_equal(
+        np.vstack(df_opts[0]["yaw_angles_opt"]),
+        np.vstack(df_opts[1]["yaw_angles_opt"]),
+    )
+    np.testing.assert_array_equal(df_opts[0]["farm_power_opt"], df_opts[1]["farm_power_opt"])
+
+def test_adaptive_optimization(sample_inputs_fixture):
+    """
+    The adaptive SR method stops evaluating converged turbines and conditions in later passes,
+    and reports the statistics of each pass.
+    """
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        layout_x=LAYOUT_X,
+        layout_y=LAYOUT_Y,
+        wind_directions=WIND_DIRECTIONS,
+        wind_speeds=WIND_SPEEDS,
+        turbulence_intensities=TURBULENCE_INTENSITIES
+    )
+
+    df_opts = []
+    pass_statistics = []
+    for adaptive in [False, True]:
+        yaw_opt = YawOptimizationSR(
+            fmodel,
+            minimum_yaw_angle=0.0,
+            maximum_yaw_angle=MAXIMUM_YAW_ANGLE,
+            Ny_passes=[5, 4, 4],
+            adaptive=adaptive,
+        )
+        df_opts.append(yaw_opt.optimize(print_progress=False))
+        pass_statistics.append(yaw_opt.pass_statistics)
+
+    # The first pass is the same, after which the unaligned conditions are dropped
+    assert list(pass_statistics[1].columns) == [
+        "pass",
+        "Ny",
+        "rows_remaining",
+        "turbines_remaining",
+        "evaluations",
+        "evaluations_saved",
+        "time_in_floris",
+    ]
+    assert len(pass_statistics[1]) == 3
+    assert pass_statistics[0].loc[0, "evaluations"] == pass_statistics[1].loc[0, "evaluations"]
+    assert (pass_statistics[0]["rows_remaining"] == 4).all()
+    assert (pass_statistics[1].loc[1:, "rows_remaining"] <= 2).all()
+    assert (pass_statistics[1]["evaluations"] <= pass_statistics[0]["evaluations"]).all()
+    assert pass_statistics[1]["evaluations"].sum() < pass_statistics[0]["evaluations"].sum()
+
+    # The solution is close to the one with a fixed number of passes
+    assert (df_opts[1]["farm_power_opt"] >= df_opts[1]["farm_power_baseline"]).all()
+    np.testing.assert_allclose(
+        df_opts[1]["farm_power_opt"],
+        df_opts[0]["farm_power_opt"],
+        rtol=1e-3,
+    )
@@ -281,3 +281,42 @@ def test_asdict(sample_inputs_fixture: SampleInputs):
     dict2 = new_turb.as_dict()
 
     assert dict1 == dict2
+
+
+def test_multidim_data_file_cache(tmp_path):
+    # Two conditions with three wind speeds each
+    df = pd.DataFrame(
+        {
+            "Tp": [2, 2, 2, 4, 4, 4],
+            "Hs": [1, 1, 1, 5, 5, 5],
+            "ws": [4.0, 8.0, 12.0] * 2,
+            "power": [100.0, 800.0, 1500.0, 90.0, 700.0, 1400.0],
+            "thrust_coefficient": [0.8, 0.7, 0.4, 0.8, 0.6, 0.3],
+        }
+    )
+    df.to_csv(tmp_path / "multi_dim.csv", index=False)
+    turbine_data = SampleInputs().turbine_multi_dim
+    turbine_data["power_thrust_table"]["power_thrust_data_file"] = "multi_dim.csv"
+    turbine_data["turbine_library_path"] = tmp_path
+
+    turbine = Turbine.from_dict(turbine_data)
+    assert turbine.condition_keys == ["Tp", "Hs"]
+    assert list(turbine.power_thrust_table.keys()) == [(2, 1), (4, 5)]
+    np.testing.assert_array_equal(turbine.power_thrust_table[(4, 5)]["power"], df.power[3:])
+    assert (
+        turbine.power_thrust_table[(4, 5)]["ref_air_density"]
+        == turbine_data["power_thrust_table"]["ref_air_density"]
+    )
+
+    # The parsed data file is reused by turbines built from the unchanged file
+    turbine_2 = Turbine.from_dict(turbine_data)
+    assert (
+        turbine_2.power_thrust_table[(2, 1)]["power"]
+        is turbine.power_thrust_table[(2, 1)]["power"]
+    )
+
+    # A changed data file is read again
+    df["power"] *= 2.0
+    df.to_csv(tmp_path / "multi_dim.csv", index=False)
+    turbine_3 = Turbine.from_dict(turbine_data)
+    np.testing.assert_array_equal(turbine_3.power_thrust_table[(4, 5)]["power"], df.power[3:])
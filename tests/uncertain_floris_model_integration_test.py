@@ -12,6 +12,7 @@ from floris import (
 from floris.core.turbine.operation_models import POWER_SETPOINT_DEFAULT
 from floris.uncertain_floris_model import (
     ApproxFlorisModel,
+    map_turbine_powers_uncertain,
     UncertainFlorisModel,
     WindRose,
 )
@@ -140,6 +141,175 @@ def test_get_weights():
     )
 
 
+def test_get_quadrature():
+    ufmodel = UncertainFlorisModel(configuration=YAML_INPUT, wd_std=3.0, n_quadrature_points=5)
+
+    # The nodes are snapped to the resolution, symmetric about 0, and the weights still
+    # match the second and fourth moments of the distribution
+    sample_points, weights = ufmodel.wd_sample_points, ufmodel.weights
+    np.testing.assert_allclose(sample_points, [-9.0, -4.0, 0.0, 4.0, 9.0])
+    np.testing.assert_allclose(weights, weights[::-1])
+    assert np.isclose(np.sum(weights), 1.0)
+    assert np.isclose(np.sum(weights * sample_points**2), 3.0**2)
+    assert np.isclose(np.sum(weights * sample_points**4), 3 * 3.0**4)
+
+    with pytest.raises(ValueError):
+        UncertainFlorisModel(configuration=YAML_INPUT, n_quadrature_points=4)
+
+
+def test_get_sampling_error():
+    ufmodel = UncertainFlorisModel(configuration=YAML_INPUT, wd_std=3.0, n_quadrature_points=5)
+    ufmodel.set(
+        layout_x=[0, 500, 1000],
+        layout_y=[0, 0, 0],
+        wind_speeds=[8.0, 8.0, 8.0],
+        wind_directions=[265.0, 270.0, 275.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+    )
+
+    # With as many sample points, the quadrature is closer to the dense sampling than
+    # the default sampling
+    ufmodel_default = UncertainFlorisModel(configuration=YAML_INPUT, wd_std=3.0)
+    ufmodel_default.set(
+        layout_x=[0, 500, 1000],
+        layout_y=[0, 0, 0],
+        wind_speeds=[8.0, 8.0, 8.0],
+        wind_directions=[265.0, 270.0, 275.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+    )
+    sampling_error = ufmodel.get_sampling_error()
+    sampling_error_default = ufmodel_default.get_sampling_error()
+    assert ufmodel.n_sample_points == ufmodel_default.n_sample_points
+    assert (
+        abs(sampling_error["expected_farm_power_error"])
+        < abs(sampling_error_default["expected_farm_power_error"])
+    )
+    assert sampling_error["max_farm_power_error"] < 5e-3
+
+    # Against the same sampling, the error is 0
+    sampling_error = ufmodel_default.get_sampling_error(
+        wd_sample_points_dense=ufmodel_default.wd_sample_points
+    )
+    assert sampling_error["max_farm_power_error"] < 1e-12
+
+
+def test_get_unique_inputs_hashed():
+    ufmodel = UncertainFlorisModel(configuration=YAML_INPUT)
+
+    input_array = np.array(
+        [
+            [1.0, 2.0],
+            [3.0, 4.0],
+            [1.0, 2.0],
+            [-1.0, 2.0],
+            [3.0, 4.0],
+        ]
+    )
+    unique_inputs, map_to_expanded_inputs = ufmodel._get_unique_inputs_hashed(
+        input_array, np.array([1.0, 1.0])
+    )
+    np.testing.assert_allclose(unique_inputs, [[1.0, 2.0], [3.0, 4.0], [-1.0, 2.0]])
+    np.testing.assert_array_equal(map_to_expanded_inputs, [0, 1, 0, 2, 1])
+
+
+@pytest.mark.parametrize("fix_yaw_to_nominal_direction", [False, True])
+def test_set_operation_incremental(fix_yaw_to_nominal_direction):
+    # Setting only the operation reuses the expanded wind conditions and gives the same
+    # result as a full update
+    rng = np.random.default_rng(0)
+    ufmodel = UncertainFlorisModel(
+        configuration=YAML_INPUT,
+        fix_yaw_to_nominal_direction=fix_yaw_to_nominal_direction,
+    )
+    ufmodel.set(
+        layout_x=[0, 500, 1000],
+        layout_y=[0, 0, 0],
+        wind_speeds=rng.uniform(6.0, 10.0, 10),
+        wind_directions=rng.uniform(250.0, 290.0, 10),
+        turbulence_intensities=0.06 * np.ones(10),
+    )
+    for yaw_angles in [np.zeros((10, 3)), rng.uniform(-20.0, 20.0, (10, 3))]:
+        for kwargs in [
+            {"yaw_angles": yaw_angles},
+            {"yaw_angles": yaw_angles + 2.0, "power_setpoints": 4e6 * np.ones((10, 3))},
+        ]:
+            ufmodel.set(**kwargs)
+            ufmodel.run()
+            farm_power = ufmodel.get_farm_power()
+            n_unique = ufmodel.n_unique
+
+            ufmodel.fmodel_unexpanded.set(**kwargs)
+            ufmodel._set_uncertain()
+            ufmodel.run()
+            assert ufmodel.n_unique == n_unique
+            np.testing.assert_allclose(farm_power, ufmodel.get_farm_power())
+
+
+def test_weight_matrix():
+    # The sparse weight matrix gives the same result as the weighted sum over the
+    # expanded conditions
+    rng = np.random.default_rng(0)
+    n_unexpanded, n_sample_points, n_unique = 4, 3, 7
+    weights = np.array([0.25, 0.5, 0.25])
+    map_to_expanded_inputs = rng.integers(0, n_unique, n_unexpanded * n_sample_points)
+    unique_turbine_powers = rng.uniform(0.0, 5e6, (n_unique, 2))
+
+    turbine_powers = map_turbine_powers_uncertain(
+        unique_turbine_powers,
+        map_to_expanded_inputs,
+        weights,
+        n_unexpanded,
+        n_sample_points,
+        2,
+    )
+    expanded_turbine_powers = unique_turbine_powers[map_to_expanded_inputs]
+    expected = sum(
+        weights[i] * expanded_turbine_powers[i * n_unexpanded : (i + 1) * n_unexpanded]
+        for i in range(n_sample_points)
+    )
+    np.testing.assert_allclose(turbine_powers, expected)
+
+
+def test_uncertain_outputs():
+    # Other turbine outputs are weighted like the powers
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    ufmodel = UncertainFlorisModel(configuration=YAML_INPUT, wd_sample_points=[-3, 0, 3], wd_std=3)
+    fmodel.set(
+        layout_x=[0, 300],
+        layout_y=[0, 0],
+        wind_speeds=[8.0, 8.0, 8.0],
+        wind_directions=[267.0, 270.0, 273],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+    )
+    ufmodel.set(
+        layout_x=[0, 300],
+        layout_y=[0, 0],
+        wind_speeds=[8.0],
+        wind_directions=[270.0],
+        turbulence_intensities=[0.06],
+    )
+    fmodel.run()
+    ufmodel.run()
+
+    weights = ufmodel.weights[:, None]
+    np.testing.assert_allclose(
+        ufmodel.get_turbine_thrust_coefficients(),
+        np.sum(weights * fmodel.get_turbine_thrust_coefficients(), axis=0, keepdims=True),
+    )
+    np.testing.assert_allclose(
+        ufmodel.get_turbine_ais(),
+        np.sum(weights * fmodel.get_turbine_ais(), axis=0, keepdims=True),
+    )
+    np.testing.assert_allclose(
+        ufmodel.get_turbine_TIs(),
+        np.sum(weights * fmodel.get_turbine_TIs(), axis=0, keepdims=True),
+    )
+    np.testing.assert_allclose(
+        ufmodel.turbine_average_velocities,
+        np.sum(weights * fmodel.turbine_average_velocities, axis=0, keepdims=True),
+    )
+
+
 def test_uncertain_floris_model():
     # Recompute uncertain result using certain result with 1 deg
 
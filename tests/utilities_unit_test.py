@@ -188,6 +188,43 @@ def test_rotate_coordinates_rel_west():
     np.testing.assert_almost_equal(Z_COORDS, z_rotated[0])
 
 
+def test_rotate_coordinates_rel_west_per_findex():
+    coordinates = np.array(list(zip(X_COORDS, Y_COORDS, Z_COORDS)))
+    wind_directions = np.array([270.0, 300.0])
+
+    # Coordinates that vary with the condition are rotated separately for each condition,
+    # about the center of that condition
+    coordinates_findex = np.stack([coordinates, coordinates + np.array([10.0, -20.0, 0.0])])
+    x_rotated, y_rotated, z_rotated, x_center, y_center = rotate_coordinates_rel_west(
+        wind_directions,
+        coordinates_findex,
+    )
+    np.testing.assert_equal(np.shape(x_rotated), (2, len(X_COORDS)))
+    np.testing.assert_equal(np.shape(x_center), (2, 1))
+    for i in range(2):
+        x_i, y_i, z_i, x_center_i, y_center_i = rotate_coordinates_rel_west(
+            wind_directions[i:i+1],
+            coordinates_findex[i],
+        )
+        np.testing.assert_allclose(x_rotated[i], x_i[0])
+        np.testing.assert_allclose(y_rotated[i], y_i[0])
+        np.testing.assert_allclose(z_rotated[i], z_i[0])
+        np.testing.assert_allclose(x_center[i, 0], x_center_i)
+        np.testing.assert_allclose(y_center[i, 0], y_center_i)
+
+    # The reverse rotation about the center of each condition recovers the coordinates
+    grid_x_reversed, grid_y_reversed, _ = reverse_rotate_coordinates_rel_west(
+        wind_directions,
+        x_rotated[:, :, None, None],
+        y_rotated[:, :, None, None],
+        z_rotated[:, :, None, None],
+        x_center,
+        y_center,
+    )
+    np.testing.assert_allclose(grid_x_reversed[:, :, 0, 0], coordinates_findex[:, :, 0])
+    np.testing.assert_allclose(grid_y_reversed[:, :, 0, 0], coordinates_findex[:, :, 1])
+
+
 def test_reverse_rotate_coordinates_rel_west():
     # Test that appplying the rotation, and then the reverse produces the original coordinates
 
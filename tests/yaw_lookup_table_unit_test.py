@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from floris import FlorisModel
+from floris.optimization.yaw_optimization.yaw_lookup_table import YawLookupTable
+from floris.optimization.yaw_optimization.yaw_optimizer_sr import YawOptimizationSR
+
+
+def linear_table():
+    # Yaw angles that vary linearly with wind direction and wind speed for two turbines
+    wd, ws = np.meshgrid(np.arange(0.0, 360.0, 10.0), np.arange(6.0, 11.0, 1.0))
+    wd = wd.flatten()
+    ws = ws.flatten()
+    yaw_angles = np.column_stack([0.1 * wd, ws])
+    return YawLookupTable(wd, ws, 0.06 * np.ones_like(wd), yaw_angles)
+
+
+def test_lookup():
+    table = linear_table()
+    assert table.n_turbines == 2
+
+    # Tabulated conditions are returned exactly by both methods
+    for method in ["nearest", "linear"]:
+        yaw_angles = table.get_yaw_angles([20.0, 300.0], [7.0, 9.0], [0.06, 0.06], method=method)
+        np.testing.assert_allclose(yaw_angles, [[2.0, 7.0], [30.0, 9.0]])
+
+    # Between tabulated conditions
+    yaw_angles = table.get_yaw_angles([24.0], [7.5], [0.06], method="nearest")
+    np.testing.assert_allclose(yaw_angles, [[2.0, 7.0]])
+    yaw_angles = table.get_yaw_angles([24.0], [7.5], [0.06], method="linear")
+    np.testing.assert_allclose(yaw_angles, [[2.4, 7.5]])
+
+    # Wind direction is periodic and out-of-range wind speeds use the nearest condition
+    yaw_angles = table.get_yaw_angles([355.0, 360.0, 100.0], [8.0, 8.0, 15.0], 0.08)
+    np.testing.assert_allclose(yaw_angles, [[17.5, 8.0], [0.0, 8.0], [10.0, 10.0]])
+
+    with pytest.raises(ValueError):
+        table.get_yaw_angles([20.0], [7.0], [0.06], method="cubic")
+
+
+def test_bounds_and_csv(tmp_path):
+    table = linear_table()
+    yaw_lbs, yaw_ubs = table.get_bounds([20.0, 250.0], [7.0, 9.0], [0.06, 0.06], margin=3.0)
+    np.testing.assert_allclose(yaw_lbs, [[0.0, 4.0], [22.0, 6.0]])
+    np.testing.assert_allclose(yaw_ubs, [[5.0, 10.0], [25.0, 12.0]])
+
+    file_path = tmp_path / "yaw_lookup_table.csv"
+    table.to_csv(file_path)
+    table_read = YawLookupTable.read_csv(file_path)
+    np.testing.assert_allclose(table_read.yaw_angles, table.yaw_angles)
+    np.testing.assert_allclose(
+        table_read.get_yaw_angles([24.0], [7.5], [0.06]),
+        table.get_yaw_angles([24.0], [7.5], [0.06]),
+    )
+
+
+def test_from_df_opt(sample_inputs_fixture):
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        layout_x=[0.0, 600.0, 1200.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_directions=[260.0, 270.0, 280.0, 270.0],
+        wind_speeds=[8.0, 8.0, 8.0, 10.0],
+        turbulence_intensities=[0.06] * 4,
+    )
+    df_opt = YawOptimizationSR(fmodel).optimize(print_progress=False)
+    table = YawLookupTable.from_df_opt(df_opt)
+
+    # The yaw angles of the optimized conditions are reproduced
+    yaw_angles = table.get_yaw_angles(
+        df_opt.wind_direction,
+        df_opt.wind_speed,
+        df_opt.turbulence_intensity,
+    )
+    np.testing.assert_allclose(yaw_angles, np.vstack(df_opt.yaw_angles_opt), atol=1e-10)
+
+    # A new optimization with narrowed bounds around the tabulated optimum is
+    # at least as good as the looked up yaw angles
+    fmodel.set(wind_directions=[272.0], wind_speeds=[9.0], turbulence_intensities=[0.06])
+    yaw_lbs, yaw_ubs = table.get_bounds([272.0], [9.0], [0.06], margin=4.0)
+    df_opt_new = YawOptimizationSR(
+        fmodel,
+        minimum_yaw_angle=yaw_lbs,
+        maximum_yaw_angle=yaw_ubs,
+        Ny_passes=[5, 4],
+    ).optimize(print_progress=False)
+    assert (df_opt_new.yaw_angles_opt[0] >= yaw_lbs[0]).all()
+    assert (df_opt_new.yaw_angles_opt[0] <= yaw_ubs[0]).all()
+
+    fmodel.set(yaw_angles=table.get_yaw_angles([272.0], [9.0], [0.06]))
+    fmodel.run()
+    assert df_opt_new.farm_power_opt[0] >= fmodel.get_farm_power()[0] - 1e-6
@@ -64,3 +64,31 @@ def test_yaw_optimization_limits(sample_inputs_fixture):
             minimum_yaw_angle=20.0,
             maximum_yaw_angle=5.0,
         )
+
+
+def test_derive_downstream_turbines(sample_inputs_fixture):
+    from floris.optimization.yaw_optimization.yaw_optimization_tools import (
+        derive_downstream_turbines,
+        derive_downstream_turbines_mask,
+    )
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    D = 126.0
+    fmodel.set(
+        layout_x=[0.0, 5 * D, 10 * D, 0.0],
+        layout_y=[0.0, 0.0, 0.0, 10 * D],
+        wind_directions=[270.0, 270.0],
+        wind_speeds=[8.0, 8.0],
+        turbulence_intensities=[0.06, 0.06],
+    )
+
+    assert derive_downstream_turbines(fmodel, 270.0) == [2, 3]
+    assert derive_downstream_turbines(fmodel, 90.0) == [0, 3]
+    assert derive_downstream_turbines(fmodel, 0.0) == [0, 1, 2]
+
+    # The mask has a row for every wind direction, including repeated wind directions
+    wind_directions = [270.0, 90.0, 0.0, 270.0]
+    mask = derive_downstream_turbines_mask(fmodel, wind_directions)
+    assert mask.shape == (4, 4)
+    for i, wd in enumerate(wind_directions):
+        assert list(np.where(mask[i])[0]) == derive_downstream_turbines(fmodel, wd)